@@ -1,6 +1,10 @@
 import streamlit as st
 from pawpal_system import Owner, Pet, Scheduler, Walk, Feed, GiveMedicine
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from uuid import uuid4
+
+# Rows rendered per page in the task list and schedule
+PAGE_SIZE = 25
 
 st.set_page_config(page_title="PawPal+", page_icon="🐾", layout="centered")
 
@@ -29,9 +33,70 @@ if "vault" not in st.session_state:
     st.session_state.vault = {
         "owner": None,
         "pets": {},
-        "task_counter": 0
+        "task_counter": 0,
+        "scheduler": None,
+        # Separates this session's entries in the cross-session st.cache_data store
+        "session_key": uuid4().hex
     }
 
+
+# ----------------------
+# Cached views
+# ----------------------
+def state_version(owner):
+    """Changes whenever a pet is added/removed or any pet's tasks change."""
+    return (owner.version, tuple(pet.version for pet in owner.pets))
+
+
+def due_occurrence(task, day):
+    """Time of the occurrence the Complete button acts on: for a series, its first pending one from day on."""
+    if task.recurrence == "none":
+        return task.time_obj
+    return task.next_occurrence(datetime.combine(day, datetime.min.time())) or task.time_obj
+
+
+@st.cache_data(max_entries=64)
+def cached_task_rows(session_key, version, day, _owner):
+    """(pet_name, task_id, label, pending) for every task; recomputed when version or day changes."""
+    rows = []
+    for pet in _owner.pets:
+        for task in pet.tasks:
+            recurrence_badge = f"🔄 {task.recurrence}" if task.recurrence != "none" else ""
+            status_badge = "✅" if task.status == "complete" else "⏳"
+            due = due_occurrence(task, day)
+            label = (
+                f"{status_badge} {task.__class__.__name__} on {due.strftime('%a %Y-%m-%d %H:%M')} "
+                f"[Priority {task.priority}] {recurrence_badge}"
+            )
+            rows.append((pet.name, task.task_id, label, task.status == "pending"))
+    return rows
+
+
+@st.cache_data(max_entries=64)
+def cached_schedule(session_key, version, day, _scheduler):
+    """Rendered (line, conflict) schedule rows for a day; recomputed only when version changes."""
+    return [(entry.render(), entry.conflict) for entry in _scheduler.build_schedule(day)]
+
+
+def paginate(rows, key):
+    """Show page controls and return only the rows on the selected page."""
+    pages = max(1, -(-len(rows) // PAGE_SIZE))
+    if st.session_state.get(key, 1) > pages:
+        st.session_state[key] = pages
+    if pages > 1:
+        # Streamlit warns if a keyed widget gets value= after its key was set in session state
+        default = {} if key in st.session_state else {"value": 1}
+        page = st.number_input("Page", min_value=1, max_value=pages, key=key, **default)
+    else:
+        page = 1
+
+    start = (page - 1) * PAGE_SIZE
+    end = min(start + PAGE_SIZE, len(rows))
+    if pages > 1:
+        st.caption(f"Showing {start + 1}–{end} of {len(rows)}")
+    return rows[start:end]
+
+
 # Owner Section
 st.subheader("👤 Owner Information")
 owner_name = st.text_input("Owner name", value="Jordan")
@@ -42,6 +107,8 @@ if st.session_state.vault["owner"] is None:
     if st.button("Create Owner Profile"):
         owner_id = 1
         st.session_state.vault["owner"] = Owner(owner_id, owner_name, contact_info)
+        # Kept across reruns so its schedule cache survives between button presses
+        st.session_state.vault["scheduler"] = Scheduler(st.session_state.vault["owner"], warn_on_conflict=False)
         st.success(f"✅ Owner profile created for {owner_name}!")
         st.rerun()
 else:
@@ -106,7 +173,7 @@ if st.session_state.vault["pets"]:
     # Recurrence option
     recurrence = st.selectbox("Recurrence", ["none", "daily", "weekly"])
     if recurrence != "none":
-        st.info(f"ℹ️ This task will automatically recreate itself {recurrence} when marked complete.")
+        st.info(f"ℹ️ This task repeats {recurrence}; completing it checks off its next occurrence.")
 
     # Task-specific fields
     if task_type == "Walk":
@@ -114,9 +181,11 @@ if st.session_state.vault["pets"]:
     elif task_type == "Feed":
         food_type = st.text_input("Food type", value="Dry Kibble")
         portion_size = st.text_input("Portion size", value="1 cup")
+        duration = st.number_input("Feeding window (minutes, 0 = instant)", min_value=0, max_value=240, value=0)
     elif task_type == "GiveMedicine":
         medication_name = st.text_input("Medication name", value="PetMed")
         dosage = st.text_input("Dosage", value="5ml")
+        duration = st.number_input("Medication window (minutes, 0 = instant)", min_value=0, max_value=240, value=0)
 
     if st.button("Add Task"):
         st.session_state.vault["task_counter"] += 1
@@ -126,13 +195,13 @@ if st.session_state.vault["pets"]:
         if task_type == "Walk":
             task = Walk(st.session_state.vault["task_counter"], task_time, priority_value, duration, recurrence)
         elif task_type == "Feed":
-            task = Feed(st.session_state.vault["task_counter"], task_time, priority_value, food_type, portion_size, recurrence)
+            task = Feed(st.session_state.vault["task_counter"], task_time, priority_value, food_type, portion_size, recurrence, duration)
         elif task_type == "GiveMedicine":
-            task = GiveMedicine(st.session_state.vault["task_counter"], task_time, priority_value, medication_name, dosage, recurrence)
+            task = GiveMedicine(st.session_state.vault["task_counter"], task_time, priority_value, medication_name, dosage, recurrence, duration)
 
         # Check for conflicts before adding
         selected_pet = st.session_state.vault["pets"][selected_pet_name]
-        scheduler = Scheduler(st.session_state.vault["owner"])
+        scheduler = st.session_state.vault["scheduler"]
         has_conflict = scheduler.check_for_conflicts(task, selected_pet)
 
         # Add task to selected pet
@@ -153,53 +222,61 @@ st.subheader("📅 Generate Daily Schedule")
 st.caption("View all tasks organized by time and priority.")
 
 if st.session_state.vault["owner"] is not None and st.session_state.vault["pets"]:
-    # Show current tasks for all pets with completion option
-    with st.expander("View all tasks", expanded=True):
-        for pet_name, pet in st.session_state.vault["pets"].items():
-            if pet.tasks:
-                st.markdown(f"**{pet_name}'s tasks:**")
-                for idx, task in enumerate(pet.tasks):
-                    task_type = task.__class__.__name__
-                    recurrence_badge = f"🔄 {task.recurrence}" if task.recurrence != "none" else ""
-                    status_badge = "✅" if task.status == "complete" else "⏳"
-
-                    col1, col2 = st.columns([4, 1])
-                    with col1:
-                        st.write(f"{status_badge} {task_type} at {task.time_obj.strftime('%H:%M')} [Priority {task.priority}] {recurrence_badge}")
-                    with col2:
-                        if task.status == "pending":
-                            if st.button("Complete", key=f"complete_{pet_name}_{idx}"):
-                                st.session_state.vault["task_counter"] += 1
-                                next_task = pet.complete_task(task, st.session_state.vault["task_counter"])
-                                if next_task:
-                                    st.success(f"✅ Task completed! Next {task_type} scheduled for {next_task.time_obj.strftime('%Y-%m-%d %H:%M')}")
-                                else:
-                                    st.success(f"✅ Task completed!")
-                                st.rerun()
-                            if st.button("Delete", key=f"delete_{pet_name}_{idx}"):
-                                pet.tasks.remove(task)
-                                st.success(f"🗑️ Task deleted!")
-                                st.rerun()
-            else:
-                st.write(f"**{pet_name}:** No tasks yet")
+    vault = st.session_state.vault
+    owner = vault["owner"]
+    version = state_version(owner)
 
+    # Show current tasks with completion option, one page at a time
+    with st.expander("View all tasks", expanded=True):
+        pet_filter = st.selectbox("Show tasks for", ["All pets"] + list(vault["pets"].keys()))
+        rows = cached_task_rows(vault["session_key"], version, date.today(), owner)
+        if pet_filter != "All pets":
+            rows = [row for row in rows if row[0] == pet_filter]
+
+        if not rows:
+            st.write("No tasks yet")
+        for pet_name, task_id, label, pending in paginate(rows, "task_page"):
+            pet = vault["pets"][pet_name]
+            col1, col2 = st.columns([4, 1])
+            with col1:
+                st.write(f"**{pet_name}:** {label}")
+            with col2:
+                if pending:
+                    if st.button("Complete", key=f"complete_{pet_name}_{task_id}"):
+                        task = pet.get_task(task_id)
+                        if task.recurrence != "none":
+                            # Check off the occurrence due today instead of adding a new task
+                            due = due_occurrence(task, date.today())
+                            pet.complete_occurrence(task, due)
+                            upcoming = task.next_occurrence(due)
+                            st.success(f"✅ Task completed! Next {task.__class__.__name__} scheduled for {upcoming.strftime('%Y-%m-%d %H:%M')}")
+                        else:
+                            pet.complete_task_by_id(task_id)
+                            st.success(f"✅ Task completed!")
+                        st.rerun()
+                    if st.button("Delete", key=f"delete_{pet_name}_{task_id}"):
+                        pet.remove_task(task_id)
+                        st.success(f"🗑️ Task deleted!")
+                        st.rerun()
+
+    # Keep the schedule open across reruns; it is served from the cache until tasks change
     if st.button("Generate Schedule"):
-        scheduler = Scheduler(st.session_state.vault["owner"])
-        schedule = scheduler.generate_daily_schedule()
+        vault["show_schedule"] = True
+
+    if vault.get("show_schedule"):
+        schedule = cached_schedule(vault["session_key"], version, date.today(), vault["scheduler"])
 
         if schedule:
-            if "CONFLICT" not in "\n".join(schedule):
+            # Check if there are any conflicts
+            has_conflicts = any(conflict for _, conflict in schedule)
+            if not has_conflicts:
                 st.success("✅ Schedule generated!")
                 st.markdown("### 📅 Today's Schedule")
-
-
-            # Check if there are any conflicts
-            has_conflicts = any("CONFLICT" in line for line in schedule)
-            if has_conflicts:
+            else:
                 st.warning("⚠️ Warning: Some tasks have time conflicts!")
 
-            for line in schedule:
-                if "CONFLICT" in line:
+            for line, conflict in paginate(schedule, "schedule_page"):
+                if conflict:
                     st.error(f"• {line}")
                 else:
                     st.write(f"• {line}")
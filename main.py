@@ -31,7 +31,6 @@ def main():
     task1 = Walk(
         task_id=1,
         time_obj=now.replace(hour=11, minute=30, second=0, microsecond=0),
-        time="11:30",
         priority=2,
         duration=30
     )
@@ -39,7 +38,6 @@ def main():
     task2 = Feed(
         task_id=2,
         time_obj=now.replace(hour=12, minute=45, second=0, microsecond=0),
-        time= "12:45",
         priority=1,
         food_type="Dry Kibble",
         portion_size="1 cup"
@@ -48,7 +46,6 @@ def main():
     task3 = GiveMedicine(
         task_id=3,
         time_obj=now.replace(hour=15, minute=45, second=0, microsecond=0),
-        time="15:45",
         priority=3,
         medication_name="PetMed",
         dosage="5ml"
@@ -56,7 +53,6 @@ def main():
     task4 = Walk(
         task_id=4,
         time_obj=now.replace(hour=12, minute=45, second=0, microsecond=0),
-        time="12:45",
         priority=2,
         duration=30,
         recurrence="daily"
@@ -74,9 +70,16 @@ def main():
     # Print Today's Schedule
     # ----------------------
     print("\n===== Today's Schedule =====")
-    scheduler = Scheduler(owner)
-    daily_schedule = scheduler.generate_daily_schedule()
-    print ("\n".join(daily_schedule))
+    scheduler = Scheduler(owner, warn_on_conflict=False)
+    for entry in scheduler.build_schedule(now.date()):
+        print(entry)
+
+    # ----------------------
+    # Print This Week's Calendar
+    # ----------------------
+    print("\n===== This Week =====")
+    for line in scheduler.generate_weekly_calendar(now.date()):
+        print(line)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,164 @@
+"""
+Asyncio reminder dispatcher for PawPal+ tasks.
+
+ReminderDispatcher keeps one heap of upcoming task times across all of an
+owner's pets. A single coroutine sleeps until the earliest one is due and
+fires it, so tens of thousands of pending tasks need no per-task timers or
+threads. Tasks added later through Pet.add_task, and pets added later
+through Owner.add_pet, are picked up live.
+"""
+import asyncio
+import heapq
+import inspect
+import threading
+from datetime import datetime, timedelta
+from itertools import count
+
+from pawpal_system import Owner, Pet, Task
+
+
+def execute_task(pet: Pet, task: Task):
+    """Default notifier: run the task's own execute()."""
+    task.execute()
+
+
+class ReminderDispatcher:
+    """
+    Fire a notifier for every pending task occurrence when its time comes around.
+
+    One-off tasks fire once, at their time_obj. A recurring series keeps a
+    single heap entry for its next pending occurrence; when it fires the
+    following occurrence is queued, and occurrences finished through
+    Pet.complete_occurrence are skipped.
+    """
+
+    def __init__(self, owner: Owner, notifier=execute_task, clock=datetime.now, catch_up: timedelta = timedelta(0)):
+        """
+        Args:
+            owner: Owner whose pets' tasks are dispatched
+            notifier: Callable(pet, task), plain or async, called when a task is due
+            clock: Returns the current time; naive datetimes like Task.time_obj
+            catch_up: Tasks overdue by less than this when seen are still fired;
+                older ones are treated as missed
+        """
+        self.owner = owner
+        self.notifier = notifier
+        self.clock = clock
+        self.catch_up = catch_up
+
+        self._heap = []  # (occurrence time, seq, pet, task)
+        self._seq = count()
+        self._queued = {}  # task -> seq of its live heap entry; other entries for it are stale
+        self._lock = threading.Lock()  # guards _heap, _queued and _watched; listeners may run on any thread
+        self._watched = []
+        self._loop = None
+        self._wakeup = None
+        self._stopping = False
+
+    def __len__(self):
+        with self._lock:
+            return len(self._heap)
+
+    def watch_pet(self, pet: Pet):
+        """Start dispatching a pet's tasks, including ones added later."""
+        with self._lock:
+            if pet in self._watched:
+                return
+            self._watched.append(pet)
+
+        # Register and read the tasks together so no task slips in between
+        with pet.lock:
+            pet.task_listeners.append(self._on_task_added)
+            tasks = pet.tasks
+
+        cutoff = self.clock() - self.catch_up
+        for task in tasks:
+            self._push(pet, task, cutoff)
+        self._wake()
+
+    def stop(self):
+        """Ask run() to return; safe to call from any thread, including before run() starts."""
+        self._stopping = True
+        self._wake()
+
+    async def run(self, stop_when_idle: bool = False):
+        """
+        Dispatch tasks until stop() is called.
+
+        Args:
+            stop_when_idle: Return once no tasks are left instead of waiting
+                for new ones
+        """
+        self._wakeup = asyncio.Event()
+        self._loop = asyncio.get_running_loop()
+        self.owner.pet_listeners.append(self._on_pet_added)
+        for pet in list(self.owner.pets):
+            self.watch_pet(pet)
+
+        try:
+            while not self._stopping:
+                with self._lock:
+                    head = self._heap[0][0] if self._heap else None
+                if head is None:
+                    if stop_when_idle:
+                        return
+                    await self._wakeup.wait()
+                    self._wakeup.clear()
+                    continue
+
+                delay = (head - self.clock()).total_seconds()
+                if delay > 0:
+                    # Sleep until due, or until a new task or stop() wakes us
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                    except asyncio.TimeoutError:
+                        pass
+                    self._wakeup.clear()
+                    continue
+
+                with self._lock:
+                    queued_time, seq, pet, task = heapq.heappop(self._heap)
+                    if self._queued.get(task) != seq:
+                        continue  # Rescheduled; the listener queued it again
+                    del self._queued[task]
+                if task.status == "complete" or pet.get_task(task.task_id) is not task:
+                    continue  # Completed or removed since it was queued
+                if task.recurrence != "none":
+                    self._push(pet, task, queued_time + timedelta.resolution)
+                if not task.occurs_at(queued_time):
+                    continue  # This occurrence was completed since it was queued
+                result = self.notifier(pet, task)
+                if inspect.isawaitable(result):
+                    await result
+        finally:
+            self.owner.pet_listeners.remove(self._on_pet_added)
+            with self._lock:
+                watched, self._watched = self._watched, []
+            for pet in watched:
+                with pet.lock:
+                    pet.task_listeners.remove(self._on_task_added)
+            self._loop = None
+            self._stopping = False  # the pending stop() has been honoured
+
+    def _push(self, pet: Pet, task: Task, after: datetime):
+        """Queue the task's first pending occurrence at or after `after`, replacing any queued one."""
+        due = task.next_occurrence(max(after, task.time_obj))
+        with self._lock:
+            if due is None:
+                self._queued.pop(task, None)
+                return
+            seq = next(self._seq)
+            self._queued[task] = seq
+            heapq.heappush(self._heap, (due, seq, pet, task))
+
+    def _on_pet_added(self, owner: Owner, pet: Pet):
+        self.watch_pet(pet)
+
+    def _on_task_added(self, pet: Pet, task: Task):
+        self._push(pet, task, self.clock() - self.catch_up)
+        self._wake()
+
+    def _wake(self):
+        loop = self._loop
+        if loop is not None:
+            loop.call_soon_threadsafe(self._wakeup.set)
@@ -0,0 +1,340 @@
+"""
+Facility-level scheduling for boarding facilities with many owners.
+
+FacilityScheduler shards generate_daily_schedule work for thousands of owners
+across a ProcessPoolExecutor and streams each owner's schedule back as soon as
+its batch finishes. forecast_medications projects GiveMedicine series over a
+horizon with NumPy instead of materializing a Task per dose.
+"""
+import os
+import re
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import date, datetime, timedelta
+from itertools import islice
+from typing import Dict, List, NamedTuple, Tuple
+
+from pawpal_system import RECURRENCE_STEPS, GiveMedicine, Scheduler, Walk, np
+
+
+class OwnerSchedule(NamedTuple):
+    """Schedule produced for one owner by a worker process."""
+    owner_id: int
+    lines: List[str]
+    conflicts: List[Tuple[int, int, int]]  # (pet_id, task_id, other_task_id)
+
+
+def schedule_owner(owner, start_date: date = None, end_date: date = None) -> OwnerSchedule:
+    """Build one owner's schedule; runs inside worker processes."""
+    scheduler = Scheduler(owner, warn_on_conflict=False)
+    conflicts = []
+    entries = scheduler.build_schedule(start_date, end_date, collector=conflicts)
+    return OwnerSchedule(
+        owner.owner_id,
+        [entry.render() for entry in entries],
+        [(c.pet.pet_id, c.task.task_id, c.other.task_id) for c in conflicts],
+    )
+
+
+def _schedule_owner_batch(owners, start_date, end_date):
+    return [schedule_owner(owner, start_date, end_date) for owner in owners]
+
+
+def _schedule_stored_batch(store_path, owner_ids, start_date, end_date):
+    # Imported here so the facility module does not require the storage layer
+    from pawpal_storage import SQLiteStore
+
+    with SQLiteStore(store_path) as store:
+        return [schedule_owner(store.load_owner(owner_id), start_date, end_date) for owner_id in owner_ids]
+
+
+class FacilityScheduler:
+    """
+    Generate schedules for many owners in parallel.
+
+    Owners are grouped into batches so each task sent to a worker carries
+    enough work to outweigh pickling. Only a few batches per worker are in
+    flight at a time, so an owner generator of any size is consumed lazily.
+    """
+
+    def __init__(self, owners=None, store_path: str = None, max_workers: int = None, batch_size: int = 64):
+        """
+        Args:
+            owners: Iterable of Owner objects to schedule
+            store_path: Path to a SQLiteStore file; workers load owners from it
+                themselves, so only owner ids are sent between processes
+            max_workers: Worker processes (defaults to the CPU count)
+            batch_size: Owners per unit of work sent to a worker
+        """
+        if (owners is None) == (store_path is None):
+            raise ValueError("Pass exactly one of owners or store_path")
+        if store_path == ":memory:":
+            raise ValueError("An in-memory store cannot be shared with worker processes")
+
+        self.owners = owners
+        self.store_path = store_path
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+
+    def _batches(self):
+        if self.owners is not None:
+            items = iter(self.owners)
+        else:
+            from pawpal_storage import SQLiteStore
+
+            with SQLiteStore(self.store_path) as store:
+                items = iter(store.owner_ids())
+
+        while True:
+            batch = list(islice(items, self.batch_size))
+            if not batch:
+                return
+            yield batch
+
+    def iter_schedules(self, start_date: date = None, end_date: date = None):
+        """
+        Yield an OwnerSchedule for every owner, in completion order.
+
+        Args:
+            start_date: Day to schedule; every task is included if None
+            end_date: Last day to include (defaults to start_date)
+        """
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            max_in_flight = 2 * self.max_workers
+            batches = self._batches()
+            pending = set()
+
+            for batch in batches:
+                if self.owners is not None:
+                    pending.add(executor.submit(_schedule_owner_batch, batch, start_date, end_date))
+                else:
+                    pending.add(executor.submit(_schedule_stored_batch, self.store_path, batch, start_date, end_date))
+
+                if len(pending) >= max_in_flight:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield from future.result()
+
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+
+    def generate_schedules(self, start_date: date = None, end_date: date = None):
+        """Return {owner_id: OwnerSchedule} once every owner is done."""
+        return {result.owner_id: result for result in self.iter_schedules(start_date, end_date)}
+
+    def forecast_medications(self, start, days: int = 90):
+        """
+        Run forecast_medications over every owner in the facility, in this process.
+
+        Owners from a store are loaded one at a time; the projection itself
+        is vectorized, so it does not need the worker pool.
+        """
+        if self.owners is not None:
+            return forecast_medications(self.owners, start, days)
+
+        from pawpal_storage import SQLiteStore
+
+        with SQLiteStore(self.store_path) as store:
+            return forecast_medications((store.load_owner(owner_id) for owner_id in store.owner_ids()), start, days)
+
+
+# ----------------------
+# Medication forecasting
+# ----------------------
+
+# Row layout of MedicationForecast.doses
+DOSE_DTYPE = [("pet_id", "i8"), ("task_id", "i8"), ("time", "datetime64[m]"), ("walk_collision", "?")]
+
+STEP_MINUTES = {name: step // timedelta(minutes=1) for name, step in RECURRENCE_STEPS.items()}
+
+DOSAGE_PATTERN = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*(.*?)\s*$")
+
+
+class MedicationForecast(NamedTuple):
+    """Projected GiveMedicine doses for a facility over [start_time, end_time)."""
+    start_time: datetime
+    end_time: datetime
+    doses: "np.ndarray"  # DOSE_DTYPE rows sorted by time
+    dose_counts: Dict[str, int]  # medication_name -> doses
+    total_dosage: Dict[Tuple[str, str], float]  # (medication_name, unit) -> summed amount
+    walk_collisions: Dict[str, int]  # medication_name -> doses overlapping one of the pet's walks
+
+
+def parse_dosage(dosage: str):
+    """
+    Split a dosage string into its amount and unit.
+
+    "5ml" -> (5.0, "ml"), "2 units" -> (2.0, "units"); returns (None, dosage)
+    when the text does not start with a number.
+    """
+    match = DOSAGE_PATTERN.match(dosage or "")
+    if match is None:
+        return None, dosage
+    return float(match.group(1)), match.group(2)
+
+
+def _project(first, step, start, end):
+    """
+    Expand task series into occurrence times without a loop per task.
+
+    Args:
+        first: int64 minutes of each task's first occurrence
+        step: int64 minutes between occurrences (0 for one-off tasks)
+        start: Window start in minutes (inclusive)
+        end: Window end in minutes (exclusive)
+
+    Returns:
+        (rows, times): the index into first/step of each occurrence, and its time
+    """
+    recurring = step > 0
+    safe_step = np.where(recurring, step, 1)
+    # First and one-past-last occurrence numbers inside the window (ceil division)
+    k0 = np.where(recurring, np.maximum(0, -((first - start) // safe_step)), 0)
+    k1 = np.where(recurring, np.maximum(0, -((first - end) // safe_step)), (first >= start) & (first < end))
+    counts = np.maximum(k1 - k0, 0)
+
+    rows = np.repeat(np.arange(len(first)), counts)
+    group_starts = np.repeat(np.cumsum(counts) - counts, counts)
+    k = np.arange(counts.sum()) - group_starts + k0[rows]
+    return rows, first[rows] + step[rows] * k
+
+
+def _drop_exceptions(rows, times, exceptions, start, end):
+    """Remove occurrences listed in (row, minute) exceptions from a projection."""
+    if not exceptions:
+        return rows, times
+    width = end - start
+    exception_rows, exception_times = np.array(exceptions, dtype=np.int64).T
+    inside = (exception_times >= start) & (exception_times < end)
+    exception_keys = exception_rows[inside] * width + (exception_times[inside] - start)
+    keep = ~np.isin(rows * width + (times - start), exception_keys)
+    return rows[keep], times[keep]
+
+
+def forecast_medications(owners, start, days: int = 90) -> MedicationForecast:
+    """
+    Project every pending GiveMedicine dose across many owners' pets.
+
+    Each series is expanded with NumPy from its first time and recurrence
+    step, minus its completed occurrences, so no Task or Occurrence object
+    is created per dose. Walk series are projected the same way, and each
+    dose is checked for overlap with its own pet's walks using a single
+    searchsorted over all pets.
+
+    Args:
+        owners: Iterable of Owner objects
+        start: First moment of the horizon (a date means its midnight)
+        days: Length of the horizon in days
+
+    Returns:
+        MedicationForecast. Doses whose dosage does not start with a number
+        are counted in dose_counts but left out of total_dosage.
+    """
+    if np is None:
+        raise ImportError("NumPy is required for forecast_medications")
+
+    if not isinstance(start, datetime):
+        start = datetime.combine(start, datetime.min.time())
+    end = start + timedelta(days=days)
+
+    # One row per task; only these loops touch Python objects
+    med_pets, med_ids, med_first, med_steps, med_durations, med_codes, med_amounts, med_groups = \
+        [], [], [], [], [], [], [], []
+    med_exceptions = []
+    walk_slots, walk_first, walk_steps, walk_durations = [], [], [], []
+    walk_exceptions = []
+    medications: Dict[str, int] = {}
+    groups: Dict[Tuple[str, str], int] = {}
+    slot = 0
+
+    for owner in owners:
+        for pet in owner.pets:
+            for task in pet.tasks:
+                if task.status == "complete" or not isinstance(task, (GiveMedicine, Walk)):
+                    continue
+                step = STEP_MINUTES.get(task.recurrence, 0)
+                if isinstance(task, Walk):
+                    row, exceptions = len(walk_first), walk_exceptions
+                    walk_slots.append(slot)
+                    walk_first.append(task.time_obj)
+                    walk_steps.append(step)
+                    walk_durations.append(task.duration)
+                else:
+                    row, exceptions = len(med_first), med_exceptions
+                    amount, unit = parse_dosage(task.dosage)
+                    med_pets.append((slot, pet.pet_id))
+                    med_ids.append(task.task_id)
+                    med_first.append(task.time_obj)
+                    med_steps.append(step)
+                    med_durations.append(task.duration)
+                    med_codes.append(medications.setdefault(task.medication_name, len(medications)))
+                    med_amounts.append(np.nan if amount is None else amount)
+                    med_groups.append(-1 if amount is None else groups.setdefault((task.medication_name, unit), len(groups)))
+                if task.exceptions:
+                    exceptions.extend((row, _minutes(t)) for t in task.exceptions)
+            slot += 1
+
+    start_minute, end_minute = _minutes(start), _minutes(end)
+    max_walk = max(walk_durations, default=0)
+    med_durations = np.array(med_durations, dtype=np.int64)
+
+    # Doses in the horizon
+    rows, times = _project(_to_minutes(med_first), np.array(med_steps, dtype=np.int64), start_minute, end_minute)
+    rows, times = _drop_exceptions(rows, times, med_exceptions, start_minute, end_minute)
+
+    # Walks, starting early enough to include ones already running at the start
+    walk_start = start_minute - max_walk
+    walk_rows, walk_times = _project(_to_minutes(walk_first), np.array(walk_steps, dtype=np.int64), walk_start, end_minute)
+    walk_rows, walk_times = _drop_exceptions(walk_rows, walk_times, walk_exceptions, walk_start, end_minute)
+
+    # Give every pet its own stretch of the axis, then a dose overlaps a walk
+    # of its pet iff the latest end among walks starting by the dose's end
+    # reaches the dose's start (closed ranges, as in Scheduler)
+    stride = (end_minute - walk_start) + max(max_walk, int(med_durations.max(initial=0))) + 1
+    pet_slots = np.array([pet_slot for pet_slot, _ in med_pets], dtype=np.int64).reshape(-1)
+    dose_start = pet_slots[rows] * stride + (times - walk_start)
+    dose_end = dose_start + med_durations[rows]
+
+    walk_key = np.array(walk_slots, dtype=np.int64)[walk_rows] * stride + (walk_times - walk_start)
+    order = np.argsort(walk_key, kind="stable")
+    walk_key = walk_key[order]
+    walk_end = walk_key + np.array(walk_durations, dtype=np.int64)[walk_rows][order]
+    latest_end = np.maximum.accumulate(walk_end) if len(walk_end) else walk_end
+
+    before = np.searchsorted(walk_key, dose_end, side="right")
+    collides = before > 0
+    collides[collides] = latest_end[before[collides] - 1] >= dose_start[collides]
+
+    # Aggregate per medication and per (medication, unit)
+    codes = np.array(med_codes, dtype=np.int64)[rows]
+    dose_counts = np.bincount(codes, minlength=len(medications))
+    collision_counts = np.bincount(codes, weights=collides, minlength=len(medications))
+    dose_groups = np.array(med_groups, dtype=np.int64)[rows]
+    parsed = dose_groups >= 0
+    totals = np.bincount(dose_groups[parsed], weights=np.array(med_amounts, dtype=float)[rows][parsed],
+                         minlength=len(groups))
+
+    order = np.argsort(times, kind="stable")
+    doses = np.empty(len(times), dtype=DOSE_DTYPE)
+    doses["pet_id"] = np.array([pet_id for _, pet_id in med_pets], dtype=np.int64).reshape(-1)[rows][order]
+    doses["task_id"] = np.array(med_ids, dtype=np.int64)[rows][order]
+    doses["time"] = times[order].astype("datetime64[m]")
+    doses["walk_collision"] = collides[order]
+
+    return MedicationForecast(
+        start,
+        end,
+        doses,
+        {name: int(dose_counts[code]) for name, code in medications.items()},
+        {group: float(totals[code]) for group, code in groups.items()},
+        {name: int(collision_counts[code]) for name, code in medications.items()},
+    )
+
+
+def _minutes(value: datetime) -> int:
+    return int(np.datetime64(value, "m").astype(np.int64))
+
+
+def _to_minutes(values) -> "np.ndarray":
+    return np.array(values, dtype="datetime64[m]").astype(np.int64).reshape(-1)
@@ -0,0 +1,188 @@
+"""
+Streaming JSON Lines and CSV export/import for PawPal+ data.
+
+Exports write one record per line in owner -> pets -> tasks order. Loaders
+rebuild one Owner at a time from that stream and yield it as soon as the
+next owner starts, so memory stays bounded by the largest single owner
+rather than by the size of the file.
+"""
+import csv
+import json
+from datetime import datetime
+
+from pawpal_system import Owner, Pet, task_from_dict
+
+
+CSV_COLUMNS = [
+    "kind", "owner_id", "pet_id", "name", "contact_info", "availability", "caretaker_capacity",
+    "species", "breed", "medication_type",
+    "type", "task_id", "time_obj", "priority", "status", "recurrence", "details", "exceptions",
+]
+
+# Fields of task records that are not subclass details
+TASK_BASE_FIELDS = ("kind", "pet_id", "type", "task_id", "time_obj", "priority", "status", "recurrence", "exceptions")
+
+
+# ----------------------
+# Export
+# ----------------------
+def iter_records(owners):
+    """
+    Yield plain, JSON-ready dict records for owners, their pets and tasks.
+
+    Args:
+        owners: Iterable of Owner objects (consumed lazily)
+    """
+    for owner in owners:
+        yield {
+            "kind": "owner",
+            "owner_id": owner.owner_id,
+            "name": owner.name,
+            "contact_info": owner.contact_info,
+            "availability": [[start.isoformat(), end.isoformat()] for start, end in owner.availability],
+            "caretaker_capacity": owner.caretaker_capacity,
+        }
+        for pet in owner.pets:
+            yield {
+                "kind": "pet",
+                "owner_id": owner.owner_id,
+                "pet_id": pet.pet_id,
+                "name": pet.name,
+                "species": pet.species,
+                "breed": pet.breed,
+                "medication_type": pet.medication_type,
+            }
+            for task in pet.tasks:
+                record = task.to_dict()
+                record["time_obj"] = record["time_obj"].isoformat()
+                record["exceptions"] = [t.isoformat() for t in record["exceptions"]]
+                record["kind"] = "task"
+                record["pet_id"] = pet.pet_id
+                yield record
+
+
+def write_jsonl(owners, fp):
+    """Write owners to a text file object as JSON Lines. Returns the number of records."""
+    written = 0
+    for record in iter_records(owners):
+        fp.write(json.dumps(record))
+        fp.write("\n")
+        written += 1
+    return written
+
+
+def write_csv(owners, fp):
+    """
+    Write owners to a text file object as CSV. Returns the number of records.
+
+    Owners, pets and tasks share one header; task subclass fields go in a
+    JSON "details" column so every task type fits the same columns.
+    """
+    writer = csv.DictWriter(fp, fieldnames=CSV_COLUMNS)
+    writer.writeheader()
+    written = 0
+    for record in iter_records(owners):
+        if record["kind"] == "owner":
+            record["availability"] = json.dumps(record["availability"])
+        elif record["kind"] == "task":
+            details = {key: value for key, value in record.items() if key not in TASK_BASE_FIELDS}
+            for key in details:
+                del record[key]
+            record["details"] = json.dumps(details)
+            record["exceptions"] = json.dumps(record["exceptions"])
+        writer.writerow(record)
+        written += 1
+    return written
+
+
+# ----------------------
+# Import
+# ----------------------
+def owners_from_records(records):
+    """
+    Rebuild Owner objects from a stream of records produced by iter_records.
+
+    Yields each Owner once the next owner record (or the end of the stream)
+    is reached, so only one owner is held in memory at a time.
+    """
+    owner = None
+    pets = {}
+
+    for record in records:
+        kind = record["kind"]
+        if kind == "owner":
+            if owner is not None:
+                yield owner
+            owner = Owner(record["owner_id"], record["name"], record["contact_info"])
+            owner.availability = [
+                (datetime.fromisoformat(start), datetime.fromisoformat(end))
+                for start, end in record.get("availability") or []
+            ]
+            owner.caretaker_capacity = record.get("caretaker_capacity", 1)
+            pets = {}
+        elif kind == "pet":
+            if owner is None:
+                raise ValueError("Pet record appears before any owner record")
+            pet = Pet(record["pet_id"], record["name"], record["species"], record["breed"], record["medication_type"])
+            pets[pet.pet_id] = pet
+            owner.add_pet(pet)
+        elif kind == "task":
+            pet = pets.get(record["pet_id"])
+            if pet is None:
+                raise ValueError(f"Task {record['task_id']} references unknown pet {record['pet_id']}")
+            task_record = dict(record)
+            task_record["time_obj"] = datetime.fromisoformat(record["time_obj"])
+            task_record["exceptions"] = [datetime.fromisoformat(t) for t in record.get("exceptions") or []]
+            pet.add_task(task_from_dict(task_record))
+        else:
+            raise ValueError(f"Unknown record kind: {kind!r}")
+
+    if owner is not None:
+        yield owner
+
+
+def read_jsonl(fp):
+    """Lazily yield Owner objects from a JSON Lines text file object."""
+    return owners_from_records(json.loads(line) for line in fp if line.strip())
+
+
+def read_csv(fp):
+    """Lazily yield Owner objects from a CSV text file object written by write_csv."""
+    return owners_from_records(_csv_record(row) for row in csv.DictReader(fp))
+
+
+def _csv_record(row):
+    kind = row["kind"]
+    if kind == "owner":
+        return {
+            "kind": kind,
+            "owner_id": int(row["owner_id"]),
+            "name": row["name"],
+            "contact_info": row["contact_info"],
+            "availability": json.loads(row["availability"] or "[]"),
+            "caretaker_capacity": int(row["caretaker_capacity"] or 1),
+        }
+    if kind == "pet":
+        return {
+            "kind": kind,
+            "pet_id": int(row["pet_id"]),
+            "name": row["name"],
+            "species": row["species"],
+            "breed": row["breed"],
+            "medication_type": row["medication_type"],
+        }
+    if kind == "task":
+        record = {
+            "kind": kind,
+            "pet_id": int(row["pet_id"]),
+            "type": row["type"],
+            "task_id": int(row["task_id"]),
+            "time_obj": row["time_obj"],
+            "priority": int(row["priority"]),
+            "status": row["status"],
+            "recurrence": row["recurrence"],
+            "exceptions": json.loads(row["exceptions"] or "[]"),
+        }
+        record.update(json.loads(row["details"] or "{}"))
+        return record
+    return {"kind": kind}
@@ -0,0 +1,510 @@
+"""
+Memory-mapped binary snapshots of PawPal+ owners, pets and tasks.
+
+A snapshot is a single file of fixed-size records: an owner directory, a pet
+directory, one task record per task (sorted by start time within each pet), a
+table of skipped occurrences, the task rows of each pet's recurring series,
+the owners' availability windows and a deduplicated UTF-8 string table.
+Snapshot opens it with mmap, so a restarted worker can answer range and
+conflict queries straight off the mapped pages without building any Task
+objects; only the tasks a query returns, and the pending series it has to
+expand, are materialized.
+
+Times are stored as whole minutes since 1970-01-01, matching the minute
+resolution tasks are scheduled at.
+"""
+import mmap
+import struct
+from datetime import date, datetime, timedelta
+
+from pawpal_system import (
+    Owner,
+    Pet,
+    RECURRENCE_NAMES,
+    STATUS_CODES,
+    STATUS_NAMES,
+    TASK_TYPES,
+    sweep_series_conflicts,
+    task_from_dict,
+)
+
+
+EPOCH = datetime(1970, 1, 1)
+MAGIC = b"PAWSNAP2"
+
+# magic, owner count, pet count, task count, skipped occurrence count, series row count,
+# availability window count, longest task (minutes), string table bytes
+HEADER = struct.Struct("<8sIIIIIIIQ")
+# owner_id, name, contact_info (offset/length pairs), caretaker_capacity, first pet row, pet count,
+# first availability window, window count
+OWNER_RECORD = struct.Struct("<qIIIIIIIII")
+# pet_id, owner_id, name, species, breed, medication_type (offset/length pairs), first task row, task count,
+# first series row, series count
+PET_RECORD = struct.Struct("<qqIIIIIIIIIIII")
+# task_id, start minute, duration, priority, type, status, recurrence, two detail strings, first skip row, skip count
+TASK_RECORD = struct.Struct("<qiihBBBxIIIIII")
+MINUTE = struct.Struct("<i")
+# Task row of a recurring series, in start order within each pet
+SERIES_ROW = struct.Struct("<I")
+# Availability window as start and end minute
+WINDOW = struct.Struct("<ii")
+
+START_FIELD_OFFSET = 8  # byte offset of the start minute inside TASK_RECORD
+
+TYPE_NAMES = tuple(TASK_TYPES)
+TYPE_CODES = {name: code for code, name in enumerate(TYPE_NAMES)}
+# Text detail fields per task type; each task record has room for two
+STRING_FIELDS = {
+    name: tuple(field for field in cls.detail_fields if field != "duration")
+    for name, cls in TASK_TYPES.items()
+}
+
+
+def to_minutes(value: datetime) -> int:
+    """Whole minutes since 1970-01-01 for a naive datetime."""
+    return (value - EPOCH) // timedelta(minutes=1)
+
+
+def from_minutes(minutes: int) -> datetime:
+    return EPOCH + timedelta(minutes=minutes)
+
+
+def _minute_range(start_date: date, end_date: date = None):
+    """Return [start, end) minutes covering start_date through end_date inclusive."""
+    if isinstance(start_date, datetime):
+        start_date = start_date.date()
+    if end_date is None:
+        end_date = start_date
+    elif isinstance(end_date, datetime):
+        end_date = end_date.date()
+
+    start = datetime.combine(start_date, datetime.min.time())
+    end = datetime.combine(end_date, datetime.min.time()) + timedelta(days=1)
+    return to_minutes(start), to_minutes(end)
+
+
+# ----------------------
+# Writing
+# ----------------------
+class _StringTable:
+    """Deduplicated UTF-8 strings addressed by (offset, length)."""
+
+    def __init__(self):
+        self.data = bytearray()
+        self.offsets = {}
+
+    def add(self, text) -> tuple:
+        text = "" if text is None else str(text)
+        if text not in self.offsets:
+            encoded = text.encode("utf-8")
+            self.offsets[text] = (len(self.data), len(encoded))
+            self.data += encoded
+        return self.offsets[text]
+
+
+def write_snapshot(owners, path: str) -> int:
+    """
+    Write owners, their pets and tasks to a snapshot file.
+
+    Args:
+        owners: Iterable of Owner objects
+        path: File to create or overwrite
+
+    Returns:
+        Number of task records written
+    """
+    strings = _StringTable()
+    owner_rows = bytearray()
+    pet_rows = bytearray()
+    task_rows = bytearray()
+    skip_rows = bytearray()
+    series_rows = bytearray()
+    window_rows = bytearray()
+    owner_count = pet_count = task_count = skip_count = series_count = window_count = 0
+    max_duration = 0
+
+    for owner in owners:
+        owner_rows += OWNER_RECORD.pack(
+            owner.owner_id, *strings.add(owner.name), *strings.add(owner.contact_info),
+            owner.caretaker_capacity, pet_count, len(owner.pets), window_count, len(owner.availability)
+        )
+        owner_count += 1
+        for start_time, end_time in owner.availability:
+            window_rows += WINDOW.pack(to_minutes(start_time), to_minutes(end_time))
+        window_count += len(owner.availability)
+
+        for pet in owner.pets:
+            records = []
+            for task in pet.tasks:
+                start_time, end_time = pet._get_task_time_range(task)
+                records.append((to_minutes(start_time), task.task_id, to_minutes(end_time) - to_minutes(start_time), task))
+            records.sort(key=lambda record: record[:2])
+            series = [task_count + row for row, record in enumerate(records) if record[3].recurrence != "none"]
+
+            pet_rows += PET_RECORD.pack(
+                pet.pet_id, owner.owner_id, *strings.add(pet.name), *strings.add(pet.species),
+                *strings.add(pet.breed), *strings.add(pet.medication_type), task_count, len(records),
+                series_count, len(series)
+            )
+            pet_count += 1
+            for row in series:
+                series_rows += SERIES_ROW.pack(row)
+            series_count += len(series)
+
+            for start, task_id, duration, task in records:
+                type_name = task.__class__.__name__
+                fields = STRING_FIELDS[type_name]
+                if len(fields) > 2:
+                    raise ValueError(f"{type_name} has more text fields than a snapshot record holds")
+                text = [strings.add(getattr(task, field)) for field in fields]
+                text += [(0, 0)] * (2 - len(text))
+
+                skipped = sorted(task.exceptions) if task.exceptions else []
+                for skipped_time in skipped:
+                    skip_rows += MINUTE.pack(to_minutes(skipped_time))
+
+                task_rows += TASK_RECORD.pack(
+                    task_id, start, duration, task.priority, TYPE_CODES[type_name],
+                    task.status_code, task.recurrence_code, *text[0], *text[1], skip_count, len(skipped)
+                )
+                skip_count += len(skipped)
+                task_count += 1
+                max_duration = max(max_duration, duration)
+
+    with open(path, "wb") as fp:
+        fp.write(HEADER.pack(MAGIC, owner_count, pet_count, task_count, skip_count, series_count, window_count,
+                             max_duration, len(strings.data)))
+        for section in (owner_rows, pet_rows, task_rows, skip_rows, series_rows, window_rows, strings.data):
+            fp.write(section)
+    return task_count
+
+
+# ----------------------
+# Reading
+# ----------------------
+class Snapshot:
+    """
+    Read-only view of a snapshot file through mmap.
+
+    get_tasks_between and find_conflicts take the same arguments and return
+    the same shapes as SQLiteStore, so a Snapshot can be passed to
+    Scheduler(store=...) in its place.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self.buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"{path} is not a PawPal snapshot")
+
+        if len(self.buffer) < HEADER.size or self.buffer[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a PawPal snapshot")
+        (_, self.owner_count, self.pet_count, self.task_count, skip_count, series_count, window_count,
+         self.max_duration, _) = HEADER.unpack_from(self.buffer, 0)
+
+        self._owners_at = HEADER.size
+        self._pets_at = self._owners_at + self.owner_count * OWNER_RECORD.size
+        self._tasks_at = self._pets_at + self.pet_count * PET_RECORD.size
+        self._skips_at = self._tasks_at + self.task_count * TASK_RECORD.size
+        self._series_at = self._skips_at + skip_count * MINUTE.size
+        self._windows_at = self._series_at + series_count * SERIES_ROW.size
+        self._strings_at = self._windows_at + window_count * WINDOW.size
+
+        # owner_id / pet_id -> directory row, built on first lookup
+        self._owner_rows = None
+        self._pet_rows = None
+
+    def close(self):
+        self.buffer.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __len__(self):
+        return self.task_count
+
+    # ----------------------
+    # Directory
+    # ----------------------
+    def owner_ids(self):
+        """Return every owner_id in the snapshot, in the order written."""
+        return [self._owner(row)[0] for row in range(self.owner_count)]
+
+    def pet_ids(self, owner_id: int = None):
+        """Return the pet_ids of one owner, or of every owner."""
+        if owner_id is None:
+            return [self._pet(row)[0] for row in range(self.pet_count)]
+        row = self._owner_row(owner_id)
+        if row is None:
+            return []
+        record = self._owner(row)
+        return [self._pet(pet_row)[0] for pet_row in range(record[6], record[6] + record[7])]
+
+    def load_owner(self, owner_id: int):
+        """Rebuild an Owner with all of its pets and tasks, or return None if missing."""
+        row = self._owner_row(owner_id)
+        return None if row is None else self._build_owner(row)
+
+    def iter_owners(self):
+        """Yield every Owner in the snapshot, one at a time."""
+        for row in range(self.owner_count):
+            yield self._build_owner(row)
+
+    # ----------------------
+    # Queries
+    # ----------------------
+    def get_tasks_between(self, start_date: date, end_date: date = None, owner_id: int = None, pet_id: int = None):
+        """
+        Return tasks that occur on start_date through end_date (inclusive), like SQLiteStore.
+
+        Each pet's rows are located by binary search on the mapped start
+        times, and only one-off and completed rows inside the window are
+        turned into Tasks. Pending series that began before the window end
+        are expanded and listed once at their first pending occurrence in it.
+
+        Returns:
+            List of (pet_id, task) pairs sorted by time, then priority
+        """
+        start, end = _minute_range(start_date, end_date)
+        window_start, window_end = from_minutes(start), from_minutes(end)
+        pending = STATUS_CODES["pending"]
+        entries = []
+        for pet_row in self._pet_rows_for(owner_id, pet_id):
+            record = self._pet(pet_row)
+            first, last = record[10], record[10] + record[11]
+            lo = self._bisect_start(first, last, start)
+            hi = self._bisect_start(lo, last, end)
+            for row in range(lo, hi):
+                fields = self._task(row)
+                if fields[6] == 0 or fields[5] != pending:
+                    entries.append((from_minutes(fields[1]), -fields[3], record[0], self._build_task(row)))
+
+            for task in self._pending_series(record, end):
+                occurrence_time = task.next_occurrence(max(window_start, task.time_obj))
+                if occurrence_time is not None and occurrence_time < window_end:
+                    entries.append((occurrence_time, -task.priority, record[0], task))
+
+        entries.sort(key=lambda entry: entry[:2])
+        return [(task_pet_id, task) for _, _, task_pet_id, task in entries]
+
+    def find_conflicts(self, start_date: date = None, end_date: date = None, owner_id: int = None):
+        """
+        Find overlapping pending tasks of the same pet.
+
+        A pair is reported when its later-starting task starts inside the
+        window. Earlier tasks are only scanned back as far as the longest
+        task in the snapshot. Pending recurring series are expanded and swept
+        against their pet's one-off tasks, pairing once per clashing
+        occurrence, as in SQLiteStore.
+
+        If start_date is None every task is covered; series then run, like
+        Owner.iter_timeline, to just after the last stored start but at
+        least Owner.SERIES_HORIZON past the first.
+
+        Returns:
+            List of (pet_id, task_id, other_task_id) tuples, where task_id is
+            the later-starting task
+        """
+        if start_date is None:
+            start, end = None, None
+        else:
+            start, end = _minute_range(start_date, end_date)
+        pending = STATUS_CODES["pending"]
+        conflicts = []
+        series = []
+
+        # Slicing a memoryview hands iter_unpack the mapped pages without copying the block
+        with memoryview(self.buffer) as view:
+            for pet_row in self._pet_rows_for(owner_id, None):
+                record = self._pet(pet_row)
+                first, last = record[10], record[10] + record[11]
+                if start is not None:
+                    lo = self._bisect_start(first, last, start)
+                    hi = self._bisect_start(lo, last, end)
+                    first = self._bisect_start(first, lo, start - self.max_duration)
+                else:
+                    lo, hi = first, last
+
+                # (task_id, start, end) of pending tasks that may still overlap the next one
+                rows = TASK_RECORD.iter_unpack(view[self._tasks_at + first * TASK_RECORD.size:
+                                                    self._tasks_at + hi * TASK_RECORD.size])
+                active = []
+                for row, fields in enumerate(rows, first):
+                    task_id, task_start, duration, _, _, status, recurrence = fields[:7]
+                    if status != pending or recurrence != 0:
+                        continue
+                    active = [entry for entry in active if task_start - entry[1] <= self.max_duration]
+                    if row >= lo:
+                        conflicts.extend(
+                            (task_start, record[0], task_id, other_id)
+                            for other_id, _, other_end in active if other_end >= task_start
+                        )
+                    active.append((task_id, task_start, task_start + duration))
+
+                pet_series = self._pending_series(record, end)
+                if pet_series:
+                    series.append((record, pet_series))
+
+        if series:
+            conflicts += self._series_conflicts(series, start, end)
+
+        # Same order as SQLiteStore: by the later task's start, then pet_id
+        conflicts.sort(key=lambda conflict: conflict[:2])
+        return [conflict[1:] for conflict in conflicts]
+
+    def _pending_series(self, record, end):
+        """Build the pending recurring series of a pet record that start before minute end (or ever, if None)."""
+        pending = STATUS_CODES["pending"]
+        series = []
+        for slot in range(record[12], record[12] + record[13]):
+            row = SERIES_ROW.unpack_from(self.buffer, self._series_at + slot * SERIES_ROW.size)[0]
+            fields = self._task(row)
+            if end is not None and fields[1] >= end:
+                break  # Series rows are in start order
+            if fields[5] == pending:
+                series.append(self._build_task(row))
+        return series
+
+    def _series_conflicts(self, series, start, end):
+        """
+        Sweep the occurrences of pending series against their pets' pending one-off tasks.
+
+        Args:
+            series: (pet record, series tasks) pairs from _pending_series
+            start: Window start minute, or None for every task
+            end: Window end minute (exclusive), or None for every task
+
+        Returns:
+            List of (start minute, pet_id, task_id, other_task_id) for every
+            pair that involves a series
+        """
+        if start is None:
+            firsts, lasts = [], []
+            for record, _ in series:
+                firsts.append(self._start_of(record[10]))
+                lasts.append(self._start_of(record[10] + record[11] - 1))
+            start = min(firsts)
+            end = max(max(lasts) + 1, start + Owner.SERIES_HORIZON // timedelta(minutes=1))
+        scan = start - self.max_duration
+        scan_start, window_end = from_minutes(scan), from_minutes(end)
+
+        pending = STATUS_CODES["pending"]
+        items = []
+        for record, tasks in series:
+            for task in tasks:
+                duration = to_minutes(task.end_time) - to_minutes(task.time_obj)
+                for occurrence in task.occurrences(scan_start, window_end):
+                    occurrence_start = to_minutes(occurrence.time_obj)
+                    items.append((occurrence_start, task.task_id, record[0], occurrence_start + duration, True))
+
+            first, last = record[10], record[10] + record[11]
+            lo = self._bisect_start(first, last, scan)
+            for row in range(lo, self._bisect_start(lo, last, end)):
+                task_id, task_start, duration, _, _, status, recurrence = self._task(row)[:7]
+                if status == pending and recurrence == 0:
+                    items.append((task_start, task_id, record[0], task_start + duration, False))
+
+        # Ties go to the lower task_id first, as in the one-off sweep
+        items.sort(key=lambda item: item[:2])
+        return sweep_series_conflicts(items, start)
+
+    # ----------------------
+    # Record access
+    # ----------------------
+    def _owner(self, row):
+        return OWNER_RECORD.unpack_from(self.buffer, self._owners_at + row * OWNER_RECORD.size)
+
+    def _pet(self, row):
+        return PET_RECORD.unpack_from(self.buffer, self._pets_at + row * PET_RECORD.size)
+
+    def _task(self, row):
+        return TASK_RECORD.unpack_from(self.buffer, self._tasks_at + row * TASK_RECORD.size)
+
+    def _start_of(self, row):
+        return MINUTE.unpack_from(self.buffer, self._tasks_at + row * TASK_RECORD.size + START_FIELD_OFFSET)[0]
+
+    def _string(self, offset, length):
+        start = self._strings_at + offset
+        return self.buffer[start:start + length].decode("utf-8")
+
+    def _owner_row(self, owner_id):
+        if self._owner_rows is None:
+            self._owner_rows = {self._owner(row)[0]: row for row in range(self.owner_count)}
+        return self._owner_rows.get(owner_id)
+
+    def _pet_rows_for(self, owner_id, pet_id):
+        if pet_id is not None:
+            if self._pet_rows is None:
+                self._pet_rows = {self._pet(row)[0]: row for row in range(self.pet_count)}
+            row = self._pet_rows.get(pet_id)
+            if row is None or (owner_id is not None and self._pet(row)[1] != owner_id):
+                return range(0)
+            return range(row, row + 1)
+        if owner_id is not None:
+            row = self._owner_row(owner_id)
+            if row is None:
+                return range(0)
+            record = self._owner(row)
+            return range(record[6], record[6] + record[7])
+        return range(self.pet_count)
+
+    def _bisect_start(self, lo, hi, minute):
+        """First task row in [lo, hi) whose start is >= minute."""
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._start_of(mid) < minute:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _build_owner(self, row):
+        (owner_id, name_at, name_len, contact_at, contact_len, capacity, first_pet, pet_count,
+         first_window, window_count) = self._owner(row)
+        owner = Owner(owner_id, self._string(name_at, name_len), self._string(contact_at, contact_len))
+        owner.caretaker_capacity = capacity
+        owner.availability = [
+            tuple(map(from_minutes, WINDOW.unpack_from(self.buffer, self._windows_at + window * WINDOW.size)))
+            for window in range(first_window, first_window + window_count)
+        ]
+
+        for pet_row in range(first_pet, first_pet + pet_count):
+            record = self._pet(pet_row)
+            pet = Pet(record[0], *(self._string(record[i], record[i + 1]) for i in range(2, 10, 2)))
+            for task_row in range(record[10], record[10] + record[11]):
+                pet.add_task(self._build_task(task_row))
+            owner.add_pet(pet)
+        return owner
+
+    def _build_task(self, row):
+        (task_id, start, duration, priority, type_code, status, recurrence,
+         text1_at, text1_len, text2_at, text2_len, first_skip, skip_count) = \
+            self._task(row)
+
+        type_name = TYPE_NAMES[type_code]
+        record = {
+            "type": type_name,
+            "task_id": task_id,
+            "time_obj": from_minutes(start),
+            "priority": priority,
+            "status": STATUS_NAMES[status],
+            "recurrence": RECURRENCE_NAMES[recurrence],
+            "exceptions": [
+                from_minutes(MINUTE.unpack_from(self.buffer, self._skips_at + skip * MINUTE.size)[0])
+                for skip in range(first_skip, first_skip + skip_count)
+            ],
+        }
+        if "duration" in TASK_TYPES[type_name].detail_fields:
+            record["duration"] = duration
+        texts = ((text1_at, text1_len), (text2_at, text2_len))
+        for field, (offset, length) in zip(STRING_FIELDS[type_name], texts):
+            record[field] = self._string(offset, length)
+        return task_from_dict(record)
@@ -0,0 +1,394 @@
+"""
+SQLite storage for PawPal+ owners, pets and tasks.
+
+Built on the standard-library sqlite3 module so state survives restarts and
+can be shared between workers. Tasks are indexed on (pet_id, start_ts) and on
+status, so day views and conflict queries only read the rows they need.
+Recurring series are stored once, like in Pet, and expanded with
+Task.occurrences when a query window needs them.
+"""
+import json
+import sqlite3
+from datetime import date, datetime, timedelta
+
+from pawpal_system import (
+    Owner,
+    Pet,
+    RECURRENCE_CODES,
+    RECURRENCE_NAMES,
+    STATUS_CODES,
+    STATUS_NAMES,
+    sweep_series_conflicts,
+    task_from_dict,
+)
+
+
+EPOCH = datetime(1970, 1, 1)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS owners (
+    owner_id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    contact_info TEXT,
+    caretaker_capacity INTEGER NOT NULL DEFAULT 1,
+    availability TEXT  -- JSON list of [start_ts, end_ts] windows
+);
+
+CREATE TABLE IF NOT EXISTS pets (
+    pet_id INTEGER PRIMARY KEY,
+    owner_id INTEGER NOT NULL REFERENCES owners(owner_id),
+    name TEXT NOT NULL,
+    species TEXT,
+    breed TEXT,
+    medication_type TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_pets_owner ON pets(owner_id);
+
+CREATE TABLE IF NOT EXISTS tasks (
+    pet_id INTEGER NOT NULL REFERENCES pets(pet_id),
+    task_id INTEGER NOT NULL,
+    type TEXT NOT NULL,
+    start_ts INTEGER NOT NULL,
+    end_ts INTEGER NOT NULL,
+    priority INTEGER NOT NULL,
+    status INTEGER NOT NULL,
+    recurrence INTEGER NOT NULL,
+    details TEXT NOT NULL,
+    exceptions TEXT,
+    PRIMARY KEY (pet_id, task_id)
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_pet_time ON tasks(pet_id, start_ts);
+CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status);
+CREATE INDEX IF NOT EXISTS idx_tasks_series ON tasks(pet_id, start_ts) WHERE recurrence != 0;
+
+-- Longest stored task range in seconds, so conflict queries can bound their index scans
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+# Columns added to existing tables after their first release, added on open if missing
+MIGRATIONS = {
+    "owners": [
+        ("caretaker_capacity", "INTEGER NOT NULL DEFAULT 1"),
+        ("availability", "TEXT"),
+    ],
+}
+
+TASK_COLUMNS = "t.pet_id, t.task_id, t.type, t.start_ts, t.priority, t.status, t.recurrence, t.details, t.exceptions"
+
+
+def to_timestamp(value: datetime) -> int:
+    """Whole seconds since 1970-01-01 for a naive datetime."""
+    return (value - EPOCH) // timedelta(seconds=1)
+
+
+def from_timestamp(seconds: int) -> datetime:
+    return EPOCH + timedelta(seconds=seconds)
+
+
+def _day_range(start_date: date, end_date: date = None):
+    """Return [start, end) timestamps covering start_date through end_date inclusive."""
+    if isinstance(start_date, datetime):
+        start_date = start_date.date()
+    if end_date is None:
+        end_date = start_date
+    elif isinstance(end_date, datetime):
+        end_date = end_date.date()
+
+    start = datetime.combine(start_date, datetime.min.time())
+    end = datetime.combine(end_date, datetime.min.time()) + timedelta(days=1)
+    return to_timestamp(start), to_timestamp(end)
+
+
+class SQLiteStore:
+    """Persistent store for Owner, Pet and Task objects."""
+
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(SCHEMA)
+        self._migrate()
+
+    def _migrate(self):
+        with self.connection:
+            for table, columns in MIGRATIONS.items():
+                existing = {row[1] for row in self.connection.execute(f"PRAGMA table_info({table})")}
+                for name, definition in columns:
+                    if name not in existing:
+                        self.connection.execute(f"ALTER TABLE {table} ADD COLUMN {name} {definition}")
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    # ----------------------
+    # Writes
+    # ----------------------
+    def save_owner(self, owner: Owner):
+        """
+        Insert or replace an owner with all of its pets and their tasks.
+
+        Stored pets of this owner that are no longer in owner.pets are
+        deleted with their tasks in the same transaction.
+        """
+        with self.connection:
+            availability = json.dumps([[to_timestamp(start), to_timestamp(end)] for start, end in owner.availability])
+            self.connection.execute(
+                "INSERT OR REPLACE INTO owners (owner_id, name, contact_info, caretaker_capacity, availability) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (owner.owner_id, owner.name, owner.contact_info, owner.caretaker_capacity, availability)
+            )
+            kept = {pet.pet_id for pet in owner.pets}
+            removed = [
+                (pet_id,) for (pet_id,) in self.connection.execute(
+                    "SELECT pet_id FROM pets WHERE owner_id = ?", (owner.owner_id,)
+                ) if pet_id not in kept
+            ]
+            self.connection.executemany("DELETE FROM tasks WHERE pet_id = ?", removed)
+            self.connection.executemany("DELETE FROM pets WHERE pet_id = ?", removed)
+            for pet in owner.pets:
+                self._save_pet(owner.owner_id, pet)
+                self.connection.execute("DELETE FROM tasks WHERE pet_id = ?", (pet.pet_id,))
+                self._insert_tasks(pet, pet.tasks)
+
+    def save_pet(self, owner_id: int, pet: Pet):
+        """Insert or replace a pet row (its tasks are left untouched)."""
+        with self.connection:
+            self._save_pet(owner_id, pet)
+
+    def add_tasks(self, pet: Pet, tasks):
+        """Bulk insert (or replace) tasks for a pet in one transaction."""
+        with self.connection:
+            self._insert_tasks(pet, tasks)
+
+    def remove_task(self, pet_id: int, task_id: int):
+        with self.connection:
+            self.connection.execute("DELETE FROM tasks WHERE pet_id = ? AND task_id = ?", (pet_id, task_id))
+
+    def _save_pet(self, owner_id: int, pet: Pet):
+        self.connection.execute(
+            "INSERT OR REPLACE INTO pets (pet_id, owner_id, name, species, breed, medication_type) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (pet.pet_id, owner_id, pet.name, pet.species, pet.breed, pet.medication_type)
+        )
+
+    def _insert_tasks(self, pet: Pet, tasks):
+        rows = []
+        max_span = 0
+        for task in tasks:
+            start_time, end_time = pet._get_task_time_range(task)
+            start_ts, end_ts = to_timestamp(start_time), to_timestamp(end_time)
+            max_span = max(max_span, end_ts - start_ts)
+
+            details = {field: getattr(task, field) for field in task.detail_fields}
+            exceptions = json.dumps(sorted(to_timestamp(t) for t in task.exceptions)) if task.exceptions else None
+            rows.append((
+                pet.pet_id, task.task_id, task.__class__.__name__, start_ts, end_ts, task.priority,
+                STATUS_CODES[task.status], RECURRENCE_CODES[task.recurrence], json.dumps(details), exceptions
+            ))
+
+        self.connection.executemany(
+            "INSERT OR REPLACE INTO tasks "
+            "(pet_id, task_id, type, start_ts, end_ts, priority, status, recurrence, details, exceptions) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            rows
+        )
+        self.connection.execute(
+            "INSERT INTO meta (key, value) VALUES ('max_span', ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = MAX(value, excluded.value)",
+            (max_span,)
+        )
+
+    # ----------------------
+    # Reads
+    # ----------------------
+    def owner_ids(self):
+        """Return every stored owner_id in ascending order."""
+        return [row[0] for row in self.connection.execute("SELECT owner_id FROM owners ORDER BY owner_id")]
+
+    def load_owner(self, owner_id: int):
+        """Rebuild an Owner with all of its pets and tasks, or return None if missing."""
+        row = self.connection.execute(
+            "SELECT owner_id, name, contact_info, caretaker_capacity, availability FROM owners WHERE owner_id = ?",
+            (owner_id,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        owner = Owner(*row[:3])
+        owner.caretaker_capacity = row[3]
+        owner.availability = [(from_timestamp(start), from_timestamp(end)) for start, end in json.loads(row[4] or "[]")]
+        pets = {}
+        for pet_row in self.connection.execute(
+            "SELECT pet_id, name, species, breed, medication_type FROM pets WHERE owner_id = ? ORDER BY pet_id",
+            (owner_id,)
+        ):
+            pet = Pet(*pet_row)
+            pets[pet.pet_id] = pet
+            owner.add_pet(pet)
+
+        for row in self.connection.execute(
+            f"SELECT {TASK_COLUMNS} FROM tasks t JOIN pets p ON p.pet_id = t.pet_id "
+            "WHERE p.owner_id = ? ORDER BY t.pet_id, t.start_ts",
+            (owner_id,)
+        ):
+            pets[row[0]].add_task(self._row_to_task(row))
+        return owner
+
+    def get_tasks_between(self, start_date: date, end_date: date = None, owner_id: int = None, pet_id: int = None):
+        """
+        Return tasks that occur on start_date through end_date (inclusive), like Pet.get_tasks_between.
+
+        One-off and completed tasks are matched on their own start. Pending
+        recurring series that began before the window end are expanded, and
+        listed once at their first pending occurrence inside the window.
+
+        Args:
+            start_date: First day to include
+            end_date: Last day to include (defaults to start_date)
+            owner_id: Only include this owner's pets
+            pet_id: Only include this pet
+
+        Returns:
+            List of (pet_id, task) pairs sorted by time, then priority
+        """
+        start_ts, end_ts = _day_range(start_date, end_date)
+        window_start, window_end = from_timestamp(start_ts), from_timestamp(end_ts)
+        pending = STATUS_CODES["pending"]
+
+        entries = [
+            (from_timestamp(row[3]), -row[4], row[0], self._row_to_task(row))
+            for row in self._select_tasks(
+                "t.start_ts >= ? AND t.start_ts < ? AND (t.recurrence = 0 OR +t.status != ?)",
+                [start_ts, end_ts, pending], owner_id, pet_id
+            )
+        ]
+        for task_pet_id, task in self._pending_series(end_ts, owner_id, pet_id):
+            first = task.next_occurrence(max(window_start, task.time_obj))
+            if first is not None and first < window_end:
+                entries.append((first, -task.priority, task_pet_id, task))
+
+        entries.sort(key=lambda entry: entry[:2])
+        return [(task_pet_id, task) for _, _, task_pet_id, task in entries]
+
+    def find_conflicts(self, start_date: date, end_date: date = None, owner_id: int = None):
+        """
+        Find overlapping pending tasks of the same pet.
+
+        A pair is reported when its later-starting task starts inside the
+        window. Pairs of one-off tasks are found in SQL: the earlier task is
+        looked up with an index range scan bounded by the longest stored task,
+        the same trick TaskIntervalIndex uses. Pending recurring series are
+        expanded with Task.occurrences and swept together with their pets'
+        one-off tasks, so a series pairs up once per clashing occurrence.
+
+        Returns:
+            List of (pet_id, task_id, other_task_id) tuples, where task_id is
+            the later-starting task
+        """
+        start_ts, end_ts = _day_range(start_date, end_date)
+        max_span = self.connection.execute("SELECT value FROM meta WHERE key = 'max_span'").fetchone()
+        max_span = max_span[0] if max_span else 0
+
+        # "+status" keeps SQLite on the (pet_id, start_ts) index for both sides
+        pending = STATUS_CODES["pending"]
+        query = (
+            "SELECT b.start_ts, b.pet_id, b.task_id, a.task_id FROM tasks b "
+            "JOIN tasks a ON a.pet_id = b.pet_id "
+            "AND a.start_ts BETWEEN b.start_ts - ? AND b.start_ts "
+            "AND a.end_ts >= b.start_ts "
+            "AND (a.start_ts < b.start_ts OR a.task_id < b.task_id) "
+        )
+        params = [max_span]
+        if owner_id is not None:
+            query += "JOIN pets p ON p.pet_id = b.pet_id AND p.owner_id = ? "
+            params.append(owner_id)
+        query += (
+            "WHERE b.start_ts >= ? AND b.start_ts < ? AND +b.status = ? AND +a.status = ? "
+            "AND +b.recurrence = 0 AND +a.recurrence = 0"
+        )
+        params += [start_ts, end_ts, pending, pending]
+        conflicts = [(from_timestamp(row[0]),) + tuple(row[1:]) for row in self.connection.execute(query, params)]
+
+        series = self._pending_series(end_ts, owner_id)
+        if series:
+            conflicts += self._series_conflicts(series, start_ts - max_span, start_ts, end_ts)
+
+        conflicts.sort(key=lambda conflict: conflict[:2])
+        return [conflict[1:] for conflict in conflicts]
+
+    def _select_tasks(self, where: str, params, owner_id: int = None, pet_id: int = None):
+        query = f"SELECT {TASK_COLUMNS} FROM tasks t"
+        if owner_id is not None:
+            query += " JOIN pets p ON p.pet_id = t.pet_id AND p.owner_id = ?"
+            params = [owner_id] + list(params)
+        query += f" WHERE {where}"
+        if pet_id is not None:
+            query += " AND t.pet_id = ?"
+            params = list(params) + [pet_id]
+        query += " ORDER BY t.start_ts, t.priority DESC"
+        return self.connection.execute(query, params)
+
+    def _pending_series(self, end_ts: int, owner_id: int = None, pet_id: int = None):
+        """Return (pet_id, task) for every pending recurring series that starts before end_ts."""
+        rows = self._select_tasks(
+            "t.recurrence != 0 AND t.start_ts < ? AND +t.status = ?",
+            [end_ts, STATUS_CODES["pending"]], owner_id, pet_id
+        )
+        return [(row[0], self._row_to_task(row)) for row in rows]
+
+    def _series_conflicts(self, series, scan_ts: int, start_ts: int, end_ts: int):
+        """
+        Sweep the occurrences of pending series against their pets' pending tasks.
+
+        Args:
+            series: (pet_id, task) pairs from _pending_series
+            scan_ts: Earliest start that can still be running at start_ts
+            start_ts: Window start; the later task of a pair must start here or after
+            end_ts: Window end (exclusive)
+
+        Returns:
+            List of (start_time, pet_id, task_id, other_task_id) for every pair
+            that involves a series, where start_time is the later task's start
+        """
+        scan_start, window_start, window_end = map(from_timestamp, (scan_ts, start_ts, end_ts))
+        items = []
+        for pet_id, task in series:
+            span = task.end_time - task.time_obj
+            for occurrence in task.occurrences(scan_start, window_end):
+                items.append((occurrence.time_obj, task.task_id, pet_id, occurrence.time_obj + span, True))
+
+        pet_ids = sorted({pet_id for pet_id, _ in series})
+        rows = self.connection.execute(
+            f"SELECT pet_id, task_id, start_ts, end_ts FROM tasks "
+            f"WHERE pet_id IN ({', '.join('?' * len(pet_ids))}) AND start_ts >= ? AND start_ts < ? "
+            "AND +recurrence = 0 AND +status = ?",
+            pet_ids + [scan_ts, end_ts, STATUS_CODES["pending"]]
+        )
+        for pet_id, task_id, task_start, task_end in rows:
+            items.append((from_timestamp(task_start), task_id, pet_id, from_timestamp(task_end), False))
+
+        # Ties go to the lower task_id first, as in the SQL join
+        items.sort(key=lambda item: item[:2])
+        return sweep_series_conflicts(items, window_start)
+
+    def _row_to_task(self, row):
+        _, task_id, task_type, start_ts, priority, status, recurrence, details, exceptions = row
+        record = {
+            "type": task_type,
+            "task_id": task_id,
+            "time_obj": from_timestamp(start_ts),
+            "priority": priority,
+            "status": STATUS_NAMES[status],
+            "recurrence": RECURRENCE_NAMES[recurrence],
+            "exceptions": [from_timestamp(t) for t in json.loads(exceptions)] if exceptions else [],
+        }
+        record.update(json.loads(details))
+        return task_from_dict(record)
@@ -1,19 +1,169 @@
 from abc import ABC, abstractmethod
-from datetime import datetime, timedelta
-from typing import List
+from datetime import date, datetime, timedelta
+from bisect import bisect_left, bisect_right
+from contextlib import nullcontext
+from time import perf_counter
+from typing import Dict, List, NamedTuple, Tuple
+import heapq
+import threading
 import warnings
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; only the vectorized Scheduler APIs need it
+    np = None
+
+
+# Interval between occurrences for each recurrence rule
+RECURRENCE_STEPS = {
+    "daily": timedelta(days=1),
+    "weekly": timedelta(weeks=1),
+}
+
+# Compact integer codes stored on each Task in place of status/recurrence strings
+STATUS_NAMES = ("pending", "complete")
+STATUS_CODES = {name: code for code, name in enumerate(STATUS_NAMES)}
+RECURRENCE_NAMES = ("none", "daily", "weekly")
+RECURRENCE_CODES = {name: code for code, name in enumerate(RECURRENCE_NAMES)}
+
+
+# ----------------------
+# Instrumentation
+# ----------------------
+class Instrumentation:
+    """
+    Opt-in per-phase timers and counters for scheduling work.
+
+    Attach one to Scheduler(instrumentation=...), to Pet.instrumentation
+    (per pet or class-wide) or to Task.instrumentation (class-wide, since
+    tasks use slots). Everything is cumulative until reset(). When left as
+    None, instrumented code skips all bookkeeping.
+    """
+
+    def __init__(self, exporter=None):
+        """
+        Args:
+            exporter: Optional callable(report) called with report() each
+                time an outermost phase finishes, e.g. to push to a dashboard
+        """
+        self.exporter = exporter
+        self.timings: Dict[str, float] = {}  # phase -> total seconds
+        self.calls: Dict[str, int] = {}  # phase -> times entered
+        self.counters: Dict[str, int] = {}
+        self.depth = 0
+
+    def phase(self, name: str):
+        """Context manager that adds its elapsed time to timings[name]."""
+        return _Phase(self, name)
+
+    def count(self, name: str, amount: int = 1):
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def report(self) -> dict:
+        """Return a copy of the collected timings, call counts and counters."""
+        return {"timings": dict(self.timings), "calls": dict(self.calls), "counters": dict(self.counters)}
+
+    def reset(self):
+        self.timings.clear()
+        self.calls.clear()
+        self.counters.clear()
+
+
+class _Phase:
+    __slots__ = ("instrumentation", "name", "started")
+
+    def __init__(self, instrumentation: Instrumentation, name: str):
+        self.instrumentation = instrumentation
+        self.name = name
+
+    def __enter__(self):
+        self.instrumentation.depth += 1
+        self.started = perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = perf_counter() - self.started
+        inst = self.instrumentation
+        inst.timings[self.name] = inst.timings.get(self.name, 0.0) + elapsed
+        inst.calls[self.name] = inst.calls.get(self.name, 0) + 1
+        inst.depth -= 1
+        if inst.depth == 0 and inst.exporter is not None:
+            inst.exporter(inst.report())
+
+
+_NO_PHASE = nullcontext()
+
+
+def _phase(instrumentation, name: str):
+    """Time a phase on instrumentation, or do nothing if it is None."""
+    return _NO_PHASE if instrumentation is None else _Phase(instrumentation, name)
+
 
 # ----------------------
 # Task (Abstract Class)
 # ----------------------
 class Task(ABC):
-    def __init__(self, task_id: int, time_obj: datetime, priority: int, recurrence: str = "none"):
+    # Slots keep large task lists free of a per-object __dict__
+    __slots__ = (
+        "task_id", "_time_obj", "_duration", "end_time", "priority", "status_code", "recurrence_code", "exceptions"
+    )
+
+    # Constructor arguments specific to each subclass (used by to_dict / task_from_dict)
+    detail_fields = ()
+
+    # Optional Instrumentation for mark_complete, shared by all tasks
+    instrumentation = None
+
+    def __init__(self, task_id: int, time_obj: datetime, priority: int, recurrence: str = "none", duration: int = 0):
         self.task_id = task_id
-        self.time_obj = time_obj
+        self._duration = duration  # minutes; 0 means the task is instantaneous
+        self.time_obj = time_obj  # also sets end_time
         self.priority = priority
         self.status = "pending"
         self.recurrence = recurrence  # "none", "daily", or "weekly"
+        self.exceptions = None  # set of completed/skipped occurrence times, created on demand
+
+    # end_time is stored rather than computed so conflict sweeps read two
+    # fields per task; it is kept in step whenever time_obj or duration change
+    @property
+    def time_obj(self) -> datetime:
+        return self._time_obj
+
+    @time_obj.setter
+    def time_obj(self, value: datetime):
+        """Set the start time. For a task already added to a pet, use Pet.reschedule_task."""
+        self._time_obj = value
+        self.end_time = value + timedelta(minutes=self._duration)
+
+    @property
+    def duration(self) -> int:
+        return self._duration
+
+    @duration.setter
+    def duration(self, value: int):
+        """Set the length in minutes. For a task already added to a pet, use Pet.reschedule_task."""
+        self._duration = value
+        self.end_time = self._time_obj + timedelta(minutes=value)
+
+    @property
+    def status(self) -> str:
+        return STATUS_NAMES[self.status_code]
+
+    @status.setter
+    def status(self, value: str):
+        if value not in STATUS_CODES:
+            raise ValueError(f"Unknown task status: {value!r}")
+        self.status_code = STATUS_CODES[value]
+
+    @property
+    def recurrence(self) -> str:
+        return RECURRENCE_NAMES[self.recurrence_code]
+
+    @recurrence.setter
+    def recurrence(self, value: str):
+        if value not in RECURRENCE_CODES:
+            raise ValueError(f"Unknown recurrence: {value!r}")
+        self.recurrence_code = RECURRENCE_CODES[value]
 
     @abstractmethod
     def execute(self):
@@ -34,6 +184,10 @@ class Task(ABC):
         Returns:
             New Task instance if recurring, None otherwise
         """
+        inst = Task.instrumentation
+        if inst is not None:
+            inst.count("task.completed")
+
         self.status = "complete"
 
         if self.recurrence == "none":
@@ -42,16 +196,112 @@ class Task(ABC):
         if next_task_id is None:
             raise ValueError("next_task_id required for recurring tasks")
 
-        return self.create_next_occurrence(next_task_id)
+        with _phase(inst, "task.create_next_occurrence"):
+            return self.create_next_occurrence(next_task_id)
+
+    def occurrences(self, start_time: datetime, end_time: datetime, include_completed: bool = False):
+        """
+        Lazily yield the occurrences of this task in [start_time, end_time).
+
+        A recurring task is treated as a series starting at time_obj that
+        repeats by its recurrence rule, minus the times in exceptions. Nothing
+        is allocated per occurrence beyond the yielded Occurrence tuple.
+
+        Args:
+            start_time: Start of the window (inclusive)
+            end_time: End of the window (exclusive)
+            include_completed: Also yield occurrences recorded in exceptions
+
+        Yields:
+            Occurrence(task, time_obj) in time order
+        """
+        if self.status == "complete" and not include_completed:
+            return
+
+        step = RECURRENCE_STEPS.get(self.recurrence)
+        if step is None:
+            if start_time <= self.time_obj < end_time:
+                yield Occurrence(self, self.time_obj)
+            return
+
+        # Jump straight to the first occurrence inside the window
+        skipped = 0
+        if start_time > self.time_obj:
+            skipped = -((self.time_obj - start_time) // step)
+        occurrence_time = self.time_obj + skipped * step
+
+        exceptions = self.exceptions
+        while occurrence_time < end_time:
+            if include_completed or not exceptions or occurrence_time not in exceptions:
+                yield Occurrence(self, occurrence_time)
+            occurrence_time += step
+
+    def next_occurrence(self, start_time: datetime = None):
+        """
+        Return the time of the first pending occurrence at or after start_time, or None.
+
+        Args:
+            start_time: Where to start looking (defaults to time_obj, the start of the series)
+        """
+        occurrence = next(self.occurrences(start_time or self.time_obj, datetime.max), None)
+        return None if occurrence is None else occurrence.time_obj
+
+    def occurs_at(self, occurrence_time: datetime) -> bool:
+        """Return True if the task has a pending occurrence at exactly this time."""
+        return next(self.occurrences(occurrence_time, occurrence_time + timedelta.resolution), None) is not None
+
+    def complete_occurrence(self, occurrence_time: datetime):
+        """
+        Mark one occurrence of a recurring series as done without creating a new task.
+
+        Non-recurring tasks are simply marked complete.
+        """
+        if self.recurrence not in RECURRENCE_STEPS:
+            self.status = "complete"
+            return
+        if self.exceptions is None:
+            self.exceptions = set()
+        self.exceptions.add(occurrence_time)
+
+    def to_dict(self):
+        """
+        Return the task as a plain dict that task_from_dict can rebuild.
+
+        Datetimes are left as datetime objects; serializers convert them.
+        """
+        record = {
+            "type": self.__class__.__name__,
+            "task_id": self.task_id,
+            "time_obj": self.time_obj,
+            "priority": self.priority,
+            "status": self.status,
+            "recurrence": self.recurrence,
+        }
+        for field in self.detail_fields:
+            record[field] = getattr(self, field)
+        record["exceptions"] = sorted(self.exceptions) if self.exceptions else []
+        return record
+
+
+class Occurrence(NamedTuple):
+    """A single (possibly virtual) occurrence of a task."""
+    task: Task
+    time_obj: datetime
+
+    @property
+    def end_time(self) -> datetime:
+        return self.time_obj + (self.task.end_time - self.task.time_obj)
 
 
 # ----------------------
 # Concrete Task Classes
 # ----------------------
 class Walk(Task):
+    __slots__ = ()
+    detail_fields = ("duration",)
+
     def __init__(self, task_id: int, time_obj: datetime, priority: int, duration: int, recurrence: str = "none"):
-        super().__init__(task_id, time_obj, priority, recurrence)
-        self.duration = duration
+        super().__init__(task_id, time_obj, priority, recurrence, duration)
 
     def execute(self):
         print(f"Walking pet for {self.duration} minutes.")
@@ -69,8 +319,12 @@ class Walk(Task):
 
 
 class Feed(Task):
-    def __init__(self, task_id: int, time_obj: datetime, priority: int, food_type: str, portion_size: str, recurrence: str = "none"):
-        super().__init__(task_id, time_obj, priority, recurrence)
+    __slots__ = ("food_type", "portion_size")
+    detail_fields = ("food_type", "portion_size", "duration")
+
+    def __init__(self, task_id: int, time_obj: datetime, priority: int, food_type: str, portion_size: str,
+                 recurrence: str = "none", duration: int = 0):
+        super().__init__(task_id, time_obj, priority, recurrence, duration)
         self.food_type = food_type
         self.portion_size = portion_size
 
@@ -86,12 +340,16 @@ class Feed(Task):
         else:
             return None
 
-        return Feed(new_task_id, next_time, self.priority, self.food_type, self.portion_size, self.recurrence)
+        return Feed(new_task_id, next_time, self.priority, self.food_type, self.portion_size, self.recurrence, self.duration)
 
 
 class GiveMedicine(Task):
-    def __init__(self, task_id: int, time_obj: datetime, priority: int, medication_name: str, dosage: str, recurrence: str = "none"):
-        super().__init__(task_id, time_obj, priority, recurrence)
+    __slots__ = ("medication_name", "dosage")
+    detail_fields = ("medication_name", "dosage", "duration")
+
+    def __init__(self, task_id: int, time_obj: datetime, priority: int, medication_name: str, dosage: str,
+                 recurrence: str = "none", duration: int = 0):
+        super().__init__(task_id, time_obj, priority, recurrence, duration)
         self.medication_name = medication_name
         self.dosage = dosage
 
@@ -107,13 +365,223 @@ class GiveMedicine(Task):
         else:
             return None
 
-        return GiveMedicine(new_task_id, next_time, self.priority, self.medication_name, self.dosage, self.recurrence)
+        return GiveMedicine(
+            new_task_id, next_time, self.priority, self.medication_name, self.dosage, self.recurrence, self.duration
+        )
+
+
+# Concrete task classes by name, used when rebuilding tasks from stored records
+TASK_TYPES = {cls.__name__: cls for cls in (Walk, Feed, GiveMedicine)}
+
+
+def task_from_dict(record):
+    """Rebuild a Walk, Feed or GiveMedicine from a Task.to_dict() record."""
+    cls = TASK_TYPES.get(record["type"])
+    if cls is None:
+        raise ValueError(f"Unknown task type: {record['type']!r}")
+
+    # Fields added later (e.g. Feed duration) fall back to their defaults in older records
+    details = {field: record[field] for field in cls.detail_fields if field in record}
+    task = cls(
+        task_id=record["task_id"],
+        time_obj=record["time_obj"],
+        priority=record["priority"],
+        recurrence=record.get("recurrence", "none"),
+        **details
+    )
+    task.status = record.get("status", "pending")
+    if record.get("exceptions"):
+        task.exceptions = set(record["exceptions"])
+    return task
+
+
+def sweep_series_conflicts(items, window_start):
+    """
+    Pair up overlapping stored task ranges of the same pet in one sweep.
+
+    The stores match one-off pairs in their own indexes; recurring series
+    are expanded in Python, and this sweep finds the pairs they take part in.
+
+    Args:
+        items: (start, task_id, pet_id, end, is_series) tuples sorted by start,
+            then task_id; start and end may be datetimes or whole minutes
+        window_start: Only report pairs whose later item starts here or after
+
+    Returns:
+        List of (start, pet_id, task_id, other_task_id) for every overlapping
+        pair involving a series, where task_id is the later-starting task and
+        start is its start. Ranges are closed, as in TaskIntervalIndex.
+    """
+    conflicts = []
+    open_items = {}  # pet_id -> heap of (end, task_id, is_series) still running
+    for start, task_id, pet_id, end, is_series in items:
+        active = open_items.setdefault(pet_id, [])
+        while active and active[0][0] < start:
+            heapq.heappop(active)
+        if start >= window_start:
+            conflicts.extend(
+                (start, pet_id, task_id, other_id)
+                for _, other_id, other_is_series in active
+                if other_id != task_id and (is_series or other_is_series)
+            )
+        heapq.heappush(active, (end, task_id, is_series))
+    return conflicts
+
+
+def _as_date(value):
+    """Accept a date or datetime and return the calendar date."""
+    if isinstance(value, datetime):
+        return value.date()
+    return value
+
+
+def _occurrence_key(occurrence):
+    """Schedule order: by time, then higher priority first."""
+    return occurrence.time_obj, -occurrence.task.priority
+
+
+# ----------------------
+# Task Interval Index
+# ----------------------
+class TaskIntervalIndex:
+    """
+    Sorted index of pending task time ranges used for overlap queries.
+
+    Entries are kept ordered by start time. Because no indexed range is longer
+    than ``max_span``, every range that can overlap [start, end] starts inside
+    [start - max_span, end], so a query is two bisects plus a walk over the
+    matching slice: O(log n + k).
+
+    The index is not thread-safe on its own; a Pet's index is guarded by
+    that pet's lock.
+    """
+
+    def __init__(self):
+        self.starts: List[datetime] = []
+        self.entries = []  # (start_time, end_time, task), parallel to starts
+        self.max_span = timedelta(0)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def add(self, task: Task, start_time: datetime, end_time: datetime):
+        idx = bisect_right(self.starts, start_time)
+        self.starts.insert(idx, start_time)
+        self.entries.insert(idx, (start_time, end_time, task))
+        if end_time - start_time > self.max_span:
+            self.max_span = end_time - start_time
+
+    def add_many(self, entries):
+        """
+        Add many (start_time, end_time, task) ranges at once.
+
+        The batch is sorted and merged with the existing entries in a single
+        pass, O(n + b log b), instead of b separate list inserts.
+        """
+        entries = sorted(entries, key=lambda entry: entry[0])
+        if not entries:
+            return
+        self.entries = list(heapq.merge(self.entries, entries, key=lambda entry: entry[0]))
+        self.starts = [entry[0] for entry in self.entries]
+        longest = max(end_time - start_time for start_time, end_time, _ in entries)
+        if longest > self.max_span:
+            self.max_span = longest
+
+    def remove(self, task: Task, start_time: datetime):
+        """Remove a task from the index. Returns True if it was present."""
+        lo = bisect_left(self.starts, start_time)
+        hi = bisect_right(self.starts, start_time)
+        for idx in range(lo, hi):
+            if self.entries[idx][2] is task:
+                del self.starts[idx]
+                del self.entries[idx]
+                return True
+        return False
+
+    def overlapping(self, start_time: datetime, end_time: datetime):
+        """
+        Yield (start_time, end_time, task) for every indexed range overlapping
+        [start_time, end_time]. Ranges are closed, so touching ranges overlap.
+        """
+        lo = bisect_left(self.starts, start_time - self.max_span)
+        hi = bisect_right(self.starts, end_time)
+        for idx in range(lo, hi):
+            entry = self.entries[idx]
+            if entry[1] >= start_time:
+                yield entry
+
+
+class RecurrenceIndex:
+    """
+    Recurring tasks grouped by recurrence step and sorted by phase.
+
+    The phase is where a series falls within its cycle (time of day for
+    daily tasks, time of week for weekly ones). A series can only occur in
+    a window shorter than its step if its phase falls inside the window's,
+    so short queries such as conflict checks bisect the phases instead of
+    expanding every series. Candidates still need an exact check with
+    Task.occurrences (series start, exceptions, status).
+
+    Like TaskIntervalIndex, it is guarded by the owning pet's lock.
+    """
+
+    def __init__(self):
+        self.phases: Dict[timedelta, List[timedelta]] = {}  # step -> sorted phases
+        self.tasks: Dict[timedelta, List[Task]] = {}  # step -> tasks, parallel to phases
+        self.max_span = timedelta(0)
+
+    def __len__(self):
+        return sum(len(tasks) for tasks in self.tasks.values())
+
+    def add(self, task: Task, start_time: datetime):
+        step = RECURRENCE_STEPS[task.recurrence]
+        phase = (start_time - datetime.min) % step
+        phases = self.phases.setdefault(step, [])
+        idx = bisect_right(phases, phase)
+        phases.insert(idx, phase)
+        self.tasks.setdefault(step, []).insert(idx, task)
+        if task.end_time - task.time_obj > self.max_span:
+            self.max_span = task.end_time - task.time_obj
+
+    def remove(self, task: Task, start_time: datetime):
+        """Remove a series added with this start time. Returns True if it was present."""
+        for step, phases in self.phases.items():
+            phase = (start_time - datetime.min) % step
+            tasks = self.tasks[step]
+            for idx in range(bisect_left(phases, phase), bisect_right(phases, phase)):
+                if tasks[idx] is task:
+                    del phases[idx]
+                    del tasks[idx]
+                    return True
+        return False
+
+    def candidates(self, start_time: datetime, end_time: datetime):
+        """Return the series whose phase falls in [start_time, end_time)."""
+        found = []
+        for step, phases in self.phases.items():
+            tasks = self.tasks[step]
+            if end_time - start_time >= step:
+                found.extend(tasks)
+                continue
+            lo_phase = (start_time - datetime.min) % step
+            hi_phase = lo_phase + (end_time - start_time)
+            lo = bisect_left(phases, lo_phase)
+            if hi_phase <= step:
+                found.extend(tasks[lo:bisect_left(phases, hi_phase)])
+            else:
+                # The window wraps past the end of the cycle
+                found.extend(tasks[lo:])
+                found.extend(tasks[:bisect_left(phases, hi_phase - step)])
+        return found
 
 
 # ----------------------
 # Pet Class
 # ----------------------
 class Pet:
+    # Optional Instrumentation; set on the class for every pet or on one pet
+    instrumentation = None
+
     def __init__(self, pet_id: int, name: str, species: str, breed: str, medication_type: str):
         self.pet_id = pet_id
         self.name = name
@@ -121,13 +589,314 @@ class Pet:
         self.breed = breed
         self.medication_type = medication_type
         self.appointments: List[str] = []
-        self.tasks: List[Task] = []
+        self.tasks_by_id: Dict[int, Task] = {}  # insertion ordered; the source of truth for tasks
+        self._task_list: Tuple[Task, ...] = ()  # cached snapshot returned by the tasks property
+        self.interval_index = TaskIntervalIndex()
+        self.tasks_by_day: Dict[date, List[Task]] = {}
+        # task_id -> start time the task was filed under in tasks_by_day, so it
+        # can be found again even if the task was edited
+        self.placed_at: Dict[int, datetime] = {}
+        # task_id -> start of the occurrence interval_index holds for the task;
+        # a recurring series is indexed at its first pending occurrence
+        self.indexed_at: Dict[int, datetime] = {}
+        # Recurring tasks, expanded with Task.occurrences by the windowed views
+        self.series_index = RecurrenceIndex()
+        self.version = 0  # bumped on every task mutation so schedule caches can be reused
+        self.task_listeners = []  # callables(pet, task) notified after add_task
+
+        # Held by every task mutation and by readers of interval_index. The task
+        # list and day buckets are copy-on-write (replaced, never edited in
+        # place), so schedule readers can use them without taking the lock.
+        self.lock = threading.RLock()
+
+    def __getstate__(self):
+        # Listeners belong to the running process (e.g. a dispatcher's event loop)
+        state = self.__dict__.copy()
+        state["task_listeners"] = []
+        state.pop("instrumentation", None)
+        del state["lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.lock = threading.RLock()
+
+    @property
+    def tasks(self) -> Tuple[Task, ...]:
+        """
+        This pet's tasks in the order they were added.
+
+        The returned tuple is a read-only snapshot: later changes build a new
+        one, so it is safe to iterate while other threads add or remove tasks.
+        Change tasks through add_task / remove_task.
+        """
+        task_list = self._task_list
+        if task_list is None:
+            with self.lock:
+                if self._task_list is None:
+                    self._task_list = tuple(self.tasks_by_id.values())
+                task_list = self._task_list
+        return task_list
+
+    def get_task(self, task_id: int):
+        """Return the task with this id, or None."""
+        return self.tasks_by_id.get(task_id)
 
     def add_task(self, task: Task):
-        self.tasks.append(task)
+        """
+        Add a task and index it. Safe to call from several threads.
+
+        Listeners run after the pet is updated but while its lock is still
+        held, so they must be quick and must not wait on other threads.
+        """
+        with self.lock:
+            if task.task_id in self.tasks_by_id:
+                raise ValueError(f"{self.name} already has a task with id {task.task_id}")
+            self.version += 1
+            self.tasks_by_id[task.task_id] = task
+            self._task_list = None
+            self._place(task)
+            for listener in self.task_listeners:
+                listener(self, task)
+        if self.instrumentation is not None:
+            self.instrumentation.count("pet.tasks_added")
+
+    def add_tasks(self, tasks):
+        """
+        Add a batch of tasks in one step.
+
+        The batch is merged into the interval index in a single sorted pass
+        and the pet's version is bumped once. If any task_id is already used
+        (on the pet or twice in the batch), nothing is added.
+
+        Args:
+            tasks: Iterable of Task objects
+
+        Returns:
+            The added tasks, in the order given
+        """
+        tasks = list(tasks)
+        with self.lock:
+            seen = set()
+            for task in tasks:
+                if task.task_id in self.tasks_by_id or task.task_id in seen:
+                    raise ValueError(f"{self.name} already has a task with id {task.task_id}")
+                seen.add(task.task_id)
+            if not tasks:
+                return tasks
+
+            self.version += 1
+            by_day = {}
+            ranges = []
+            for task in tasks:
+                self.tasks_by_id[task.task_id] = task
+                self.placed_at[task.task_id] = task.time_obj
+                if task.recurrence != "none":
+                    self.series_index.add(task, task.time_obj)
+                by_day.setdefault(task.time_obj.date(), []).append(task)
+                start_time = task.next_occurrence()
+                if start_time is not None:
+                    self.indexed_at[task.task_id] = start_time
+                    ranges.append((start_time, Occurrence(task, start_time).end_time, task))
+            self._task_list = None
+            for day, day_tasks in by_day.items():
+                self.tasks_by_day[day] = self.tasks_by_day.get(day, []) + day_tasks
+            self.interval_index.add_many(ranges)
+
+            for task in tasks:
+                for listener in self.task_listeners:
+                    listener(self, task)
+        if self.instrumentation is not None:
+            self.instrumentation.count("pet.tasks_added", len(tasks))
+        return tasks
+
+    def remove_task(self, task):
+        """
+        Remove a task from this pet and from its indexes.
+
+        Args:
+            task: The Task to remove, or its task_id
+        """
+        with self.lock:
+            if not isinstance(task, Task):
+                task = self.tasks_by_id.get(task)
+            if task is None or self.tasks_by_id.get(task.task_id) is not task:
+                raise ValueError(f"Task is not assigned to {self.name}")
+
+            del self.tasks_by_id[task.task_id]
+            self._task_list = None
+            self.version += 1
+            self._unplace(task)
+        if self.instrumentation is not None:
+            self.instrumentation.count("pet.tasks_removed")
+
+    def reschedule_task(self, task, time_obj: datetime = None, duration: int = None):
+        """
+        Move a task to a new time and/or change its duration, keeping the indexes in step.
+
+        Setting time_obj or duration on a task directly would leave it filed
+        under its old start time. Listeners are notified as for add_task.
+
+        Args:
+            task: The Task to change, or its task_id
+            time_obj: New start time (unchanged if None)
+            duration: New duration in minutes (unchanged if None)
+
+        Returns:
+            The rescheduled task
+        """
+        with self.lock:
+            if not isinstance(task, Task):
+                task = self.tasks_by_id.get(task)
+            if task is None or self.tasks_by_id.get(task.task_id) is not task:
+                raise ValueError(f"Task is not assigned to {self.name}")
+
+            self._unplace(task)
+            if duration is not None:
+                task.duration = duration
+            if time_obj is not None:
+                task.time_obj = time_obj
+            self._place(task)
+            self.version += 1
+            for listener in self.task_listeners:
+                listener(self, task)
+        return task
+
+    def get_occurrences_between(self, start_date: date, end_date: date = None):
+        """
+        Return the occurrences scheduled from start_date through end_date.
+
+        Whole-day form of get_occurrences that also lists completed tasks at
+        their own time, so a daily task shows up on every day of the window
+        and occurrences finished with complete_occurrence are left out.
+
+        Args:
+            start_date: First day to include
+            end_date: Last day to include (defaults to start_date)
+
+        Returns:
+            List of Occurrence sorted by time, then priority (higher first)
+        """
+        start_date = _as_date(start_date)
+        end_date = start_date if end_date is None else _as_date(end_date)
+        start_time = datetime.combine(start_date, datetime.min.time())
+        end_time = datetime.combine(end_date, datetime.min.time()) + timedelta(days=1)
+
+        occurrences = list(self.get_occurrences(start_time, end_time, include_completed=True))
+        if self.instrumentation is not None:
+            self.instrumentation.count("pet.tasks_scanned", len(occurrences))
+        return occurrences
+
+    def get_tasks_between(self, start_date: date, end_date: date = None):
+        """
+        Return the tasks that occur between two dates, like get_occurrences_between.
+
+        Args:
+            start_date: First day to include
+            end_date: Last day to include (defaults to start_date)
+
+        Returns:
+            List of tasks in order of their first occurrence; a recurring task
+            is listed once however often it repeats in the window
+        """
+        occurrences = self.get_occurrences_between(start_date, end_date)
+        return list(dict.fromkeys(occurrence.task for occurrence in occurrences))
+
+    def get_daily_schedule(self, start_date: date = None, end_date: date = None):
+        """
+        Return tasks sorted by time.
+
+        Args:
+            start_date: Only include tasks from this day on (all tasks if None);
+                recurring tasks are then listed once per occurrence
+            end_date: Last day to include (defaults to start_date)
+        """
+        with _phase(self.instrumentation, "pet.get_daily_schedule"):
+            if start_date is None:
+                return sorted(self.tasks, key=lambda t: t.time_obj)
+            return [occurrence.task for occurrence in self.get_occurrences_between(start_date, end_date)]
+
+    def get_occurrences(self, start_time: datetime, end_time: datetime, include_completed: bool = False):
+        """
+        Lazily yield every task occurrence in [start_time, end_time), by time then priority.
+
+        Only the per-day index for the days the window touches and the
+        series that can fall inside it are read, so the cost follows the
+        window rather than the pet's full history. Recurring tasks are
+        expanded on demand from their rule; occurrences finished with
+        complete_occurrence are left out.
+
+        Args:
+            start_time: Start of the window (inclusive)
+            end_time: End of the window (exclusive)
+            include_completed: Also yield completed tasks, once at their own time
+        """
+        with self.lock:
+            one_off = []
+            day = start_time.date()
+            last_day = (end_time - timedelta.resolution).date()
+            while day <= last_day:
+                for task in self.tasks_by_day.get(day, ()):
+                    if task.status == "complete":
+                        if not include_completed:
+                            continue
+                    elif task.recurrence != "none":
+                        continue  # Pending series are expanded below
+                    if start_time <= task.time_obj < end_time:
+                        one_off.append(Occurrence(task, task.time_obj))
+                day += timedelta(days=1)
+            series = [
+                task for task in self.series_index.candidates(start_time, end_time) if task.status != "complete"
+            ]
+
+        one_off.sort(key=_occurrence_key)
+        streams = [task.occurrences(start_time, end_time) for task in series]
+        return heapq.merge(one_off, *streams, key=_occurrence_key)
+
+    def get_overlapping(self, start_time: datetime, end_time: datetime):
+        """
+        Return every pending occurrence whose range overlaps [start_time, end_time].
 
-    def get_daily_schedule(self):
-        return sorted(self.tasks, key=lambda t: t.time_obj)
+        Ranges are closed, as in TaskIntervalIndex.overlapping. One-off tasks
+        come from the interval index. That index holds only the first pending
+        occurrence of each recurring series, so series are taken from
+        series_index and expanded with Task.occurrences instead.
+
+        Returns:
+            List of (start_time, end_time, task) sorted by start; a series
+            appears once per overlapping occurrence
+        """
+        with self.lock:
+            found = [entry for entry in self.interval_index.overlapping(start_time, end_time)
+                     if entry[2].recurrence == "none"]
+            index = self.series_index
+            series = [
+                task for task in index.candidates(start_time - index.max_span, end_time + timedelta.resolution)
+                if task.status != "complete"
+            ]
+        for task in series:
+            span = task.end_time - task.time_obj
+            for occurrence in task.occurrences(start_time - span, end_time + timedelta.resolution):
+                found.append((occurrence.time_obj, occurrence.time_obj + span, task))
+        found.sort(key=lambda entry: entry[0])
+        return found
+
+    def complete_occurrence(self, task: Task, occurrence_time: datetime):
+        """
+        Mark one occurrence of a task done without adding a new task.
+
+        Unlike complete_task, recurring series stay a single Task with the
+        completed time recorded as an exception.
+        """
+        with self.lock:
+            task.complete_occurrence(occurrence_time)
+            self.version += 1
+            indexed_at = self.indexed_at.get(task.task_id)
+            if self.tasks_by_id.get(task.task_id) is task and indexed_at is not None and (
+                    task.status == "complete" or indexed_at == occurrence_time):
+                # The indexed occurrence is done; index the series' next pending one
+                self._unindex(task)
+                self._index(task, task.next_occurrence(indexed_at))
 
     def complete_task(self, task: Task, next_task_id: int):
         """
@@ -140,45 +909,173 @@ class Pet:
         Returns:
             The next task instance if recurring, None otherwise
         """
-        next_task = task.mark_complete(next_task_id)
-        if next_task:
-            self.add_task(next_task)
-        return next_task
+        with _phase(self.instrumentation, "pet.complete_task"), self.lock:
+            # Validate before mark_complete so a failure leaves the task untouched
+            if task.recurrence != "none":
+                if next_task_id is None:
+                    raise ValueError("next_task_id required for recurring tasks")
+                if next_task_id in self.tasks_by_id:
+                    raise ValueError(f"{self.name} already has a task with id {next_task_id}")
+            next_task = task.mark_complete(next_task_id)
+            self.version += 1
+            if self.tasks_by_id.get(task.task_id) is task:
+                self._unindex(task)
+            if next_task:
+                self.add_task(next_task)
+            return next_task
+
+    def complete_task_by_id(self, task_id: int, next_task_id: int = None):
+        """Look up a task by id and complete it like complete_task."""
+        with self.lock:
+            task = self.tasks_by_id.get(task_id)
+            if task is None:
+                raise ValueError(f"{self.name} has no task with id {task_id}")
+            return self.complete_task(task, next_task_id)
 
     def _get_task_time_range(self, task: Task):
         """
-        Calculate the start and end time for a task.
+        Return the start and end time for a task.
 
         Returns:
-            (start_time, end_time) tuple
-            For instantaneous tasks, start_time == end_time
+            (start_time, end_time) tuple read from the task's stored fields
+            For instantaneous tasks (duration 0), start_time == end_time
         """
-        start_time = task.time_obj
-        if isinstance(task, Walk):
-            end_time = start_time + timedelta(minutes=task.duration)
+        return task.time_obj, task.end_time
+
+    def _place(self, task: Task):
+        """File a task in tasks_by_day and, if it has a pending occurrence, interval_index."""
+        self.placed_at[task.task_id] = task.time_obj
+        day = task.time_obj.date()
+        self.tasks_by_day[day] = self.tasks_by_day.get(day, []) + [task]
+        if task.recurrence != "none":
+            self.series_index.add(task, task.time_obj)
+        self._index(task, task.next_occurrence())
+
+    def _unplace(self, task: Task):
+        """Take a task out of tasks_by_day and interval_index, wherever _place filed it."""
+        self._unindex(task)
+        placed_at = self.placed_at.pop(task.task_id, task.time_obj)
+        if task.recurrence != "none":
+            self.series_index.remove(task, placed_at)
+        day = placed_at.date()
+        remaining = [t for t in self.tasks_by_day.get(day, ()) if t is not task]
+        if remaining:
+            self.tasks_by_day[day] = remaining
         else:
-            # Feed and GiveMedicine are instantaneous
-            end_time = start_time
-        return start_time, end_time
+            self.tasks_by_day.pop(day, None)
 
+    def _index(self, task: Task, start_time: datetime):
+        if start_time is not None:
+            self.indexed_at[task.task_id] = start_time
+            self.interval_index.add(task, start_time, Occurrence(task, start_time).end_time)
 
+    def _unindex(self, task: Task):
+        start_time = self.indexed_at.pop(task.task_id, None)
+        if start_time is not None:
+            self.interval_index.remove(task, start_time)
 
 
 # ----------------------
 # Owner Class
 # ----------------------
 class Owner:
+    # How far past its start an open-ended timeline expands recurring series
+    SERIES_HORIZON = timedelta(weeks=4)
+
     def __init__(self, owner_id: int, name: str, contact_info: str):
         self.owner_id = owner_id
         self.name = name
         self.contact_info = contact_info
         self.pets: List[Pet] = []
+        self.version = 0  # bumped when pets are added or removed
+        # (start, end) windows when the owner can do tasks; empty means any time
+        self.availability: List[Tuple[datetime, datetime]] = []
+        # How many tasks the owner's caretakers can handle at the same moment
+        self.caretaker_capacity = 1
+        self.pet_listeners = []  # callables(owner, pet) notified after add_pet
+
+    def __getstate__(self):
+        # Listeners are bound to live objects such as a running dispatcher
+        state = self.__dict__.copy()
+        state["pet_listeners"] = []
+        return state
 
     def add_pet(self, pet: Pet):
         self.pets.append(pet)
+        self.version += 1
+        for listener in self.pet_listeners:
+            listener(self, pet)
 
     def remove_pet(self, pet: Pet):
         self.pets.remove(pet)
+        self.version += 1
+
+    def bulk_add(self, items):
+        """
+        Add tasks to several of this owner's pets with one Pet.add_tasks call per pet.
+
+        Every pet and task_id is checked before any pet is changed.
+
+        Args:
+            items: Iterable of (pet, task) pairs; each pet must belong to this owner
+
+        Returns:
+            Dict mapping each pet to the list of tasks added to it
+        """
+        batches: Dict[Pet, List[Task]] = {}
+        for pet, task in items:
+            batches.setdefault(pet, []).append(task)
+
+        for pet, tasks in batches.items():
+            if pet not in self.pets:
+                raise ValueError(f"{pet.name} does not belong to {self.name}")
+            task_ids = {task.task_id for task in tasks}
+            if len(task_ids) != len(tasks) or any(task_id in pet.tasks_by_id for task_id in task_ids):
+                raise ValueError(f"Duplicate task id in batch for {pet.name}")
+
+        for pet, tasks in batches.items():
+            pet.add_tasks(tasks)
+        return batches
+
+    def iter_timeline(self, start_time: datetime = None, end_time: datetime = None):
+        """
+        Yield (start_time, end_time, pet, task) for pending occurrences of every pet, in start order.
+
+        Recurring series are expanded with Pet.get_occurrences, and each pet's
+        stream is already sorted, so the shared timeline is a k-way heap
+        merge rather than a fresh sort.
+
+        Args:
+            start_time: Only include occurrences starting at or after this time
+                (defaults to the earliest pending occurrence of any pet)
+            end_time: Only include occurrences starting before this time.
+                Series repeat forever, so this defaults to just after the
+                last indexed occurrence, but at least SERIES_HORIZON past
+                start_time.
+        """
+        if start_time is None or end_time is None:
+            firsts, lasts = [], []
+            for pet in self.pets:
+                with pet.lock:
+                    starts = pet.interval_index.starts
+                    if starts:
+                        firsts.append(starts[0])
+                        lasts.append(starts[-1])
+            if not firsts:
+                return iter(())
+            if start_time is None:
+                start_time = min(firsts)
+            if end_time is None:
+                end_time = max(max(lasts) + timedelta.resolution, start_time + self.SERIES_HORIZON)
+
+        streams = [self._pet_stream(pet, start_time, end_time) for pet in self.pets]
+        return heapq.merge(*streams, key=lambda item: item[0])
+
+    @staticmethod
+    def _pet_stream(pet, start_time: datetime, end_time: datetime):
+        """Yield (start_time, end_time, pet, task) for one pet's pending occurrences."""
+        for occurrence in pet.get_occurrences(start_time, end_time):
+            yield occurrence.time_obj, occurrence.end_time, pet, occurrence.task
 
     def view_tasks(self):
         for pet in self.pets:
@@ -190,63 +1087,747 @@ class Owner:
 # Scheduler Class
 # ----------------------
 
+# Row layout returned by Scheduler.find_all_conflicts_vectorized
+CONFLICT_DTYPE = [("pet_id", "i8"), ("task_id", "i8"), ("other_task_id", "i8")]
+
+class Conflict(NamedTuple):
+    """Two tasks of the same pet whose time ranges overlap."""
+    pet: Pet
+    task: Task
+    other: Task
+
+    def message(self) -> str:
+        """Render the conflict as text (only done when it is actually displayed)."""
+        return (
+            f"Conflict detected for {self.pet.name}: "
+            f"{self.task.__class__.__name__} at {self.task.time_obj.strftime('%H:%M')} overlaps with "
+            f"{self.other.__class__.__name__} at {self.other.time_obj.strftime('%H:%M')}"
+        )
+
+
+class ScheduleEntry(NamedTuple):
+    """One row of a generated schedule."""
+    pet: Pet
+    task: Task
+    conflict: bool
+    sort_key: tuple  # (time_obj, -priority)
+
+    @property
+    def time_obj(self) -> datetime:
+        return self.sort_key[0]
+
+    def render(self) -> str:
+        line = (
+            f"{self.pet.name} - {self.task.__class__.__name__} at "
+            f"{self.time_obj.strftime('%H:%M')} "
+            f"[Priority {self.task.priority}]"
+        )
+        if self.conflict:
+            line += " ⚠️ CONFLICT"
+        return line
+
+    def __str__(self):
+        return self.render()
+
+
+class ResourceConflict(NamedTuple):
+    """A task that starts while every caretaker is already busy."""
+    pet: Pet
+    task: Task
+    busy: List[Tuple[Pet, Task]]  # tasks occupying the caretakers at that moment
+
+    def message(self) -> str:
+        busy = ", ".join(f"{pet.name}'s {task.__class__.__name__}" for pet, task in self.busy)
+        return (
+            f"Caretaker conflict: {self.pet.name}'s {self.task.__class__.__name__} at "
+            f"{self.task.time_obj.strftime('%H:%M')} overlaps with {busy}"
+        )
+
+
+class PlannedTask(NamedTuple):
+    """A task (or one occurrence of a recurring task) placed by Scheduler.plan_schedule."""
+    pet: Pet
+    task: Task
+    start_time: datetime
+    end_time: datetime
+    requested_time: datetime  # when the occurrence was originally due
+
+    @property
+    def shifted(self) -> bool:
+        return self.start_time != self.requested_time
+
+
+class Plan(NamedTuple):
+    """Conflict-free plan: tasks kept (sorted by start) and tasks that could not fit."""
+    scheduled: List[PlannedTask]
+    dropped: List[Tuple[Pet, Task]]
+
+
+class BusyTimeline:
+    """
+    Sorted, non-overlapping busy ranges used by the planner.
+
+    Ranges at most ``gap`` apart are merged, so placing a task only skips over
+    a handful of merged blocks instead of every task already placed.
+    """
+
+    def __init__(self, gap: timedelta):
+        self.gap = gap
+        self.starts: List[datetime] = []
+        self.ends: List[datetime] = []
+
+    def first_clash(self, start_time: datetime, end_time: datetime):
+        """Return the end of the first busy range less than gap away from [start_time, end_time], or None."""
+        idx = bisect_right(self.ends, start_time - self.gap)
+        if idx < len(self.starts) and self.starts[idx] - self.gap < end_time:
+            return self.ends[idx]
+        return None
+
+    def reserve(self, start_time: datetime, end_time: datetime):
+        idx = bisect_left(self.ends, start_time - self.gap)
+        # Merge with neighbouring ranges at most gap away; nothing can fit between them
+        while idx < len(self.starts) and self.starts[idx] - self.gap <= end_time:
+            start_time = min(start_time, self.starts[idx])
+            end_time = max(end_time, self.ends[idx])
+            del self.starts[idx]
+            del self.ends[idx]
+        self.starts.insert(idx, start_time)
+        self.ends.insert(idx, end_time)
+
+
 class Scheduler:
-    def __init__(self, owner: Owner):
+    # Minimum spacing the planner leaves between tasks, since ranges are closed
+    # and back-to-back tasks would otherwise still count as overlapping
+    PLAN_GAP = timedelta(minutes=1)
+
+    def __init__(self, owner: Owner, warn_on_conflict: bool = True, store=None, instrumentation: Instrumentation = None):
+        """
+        Args:
+            owner: Owner whose pets are scheduled
+            warn_on_conflict: Emit a warnings.warn for detected conflicts.
+                Turn off when conflicts are read from a collector instead.
+            store: Optional pawpal_storage.SQLiteStore (or read-only
+                pawpal_snapshot.Snapshot) holding this owner's tasks, used by
+                the get_stored_* / find_stored_* queries
+            instrumentation: Optional Instrumentation receiving per-phase
+                timings ("schedule.*", "conflicts.*") and counters
+        """
         self.owner = owner
-    
-    def check_for_conflicts(self, new_task: Task, pet: Pet):
+        self.warn_on_conflict = warn_on_conflict
+        self.store = store
+        self.instrumentation = instrumentation
+
+        # Cached schedule pieces, reused until Pet.version / Owner.version change.
+        # Tasks must be mutated through Pet methods for the cache to notice.
+        self._pet_cache = {}  # id(pet) -> (pet.version, window, entries, conflicts)
+        self._schedule_cache = None  # (cache key, entries, conflicts)
+
+    def check_for_conflicts(self, new_task: Task, pet: Pet, collector: list = None):
+        """
+        Check whether a task overlaps any pending task of the pet.
+
+        Args:
+            new_task: Task to check
+            pet: Pet whose tasks are compared against
+            collector: Optional list; every Conflict found is appended to it
+
+        Returns:
+            True if at least one conflict was found
+        """
         new_start, new_end = pet._get_task_time_range(new_task)
+        found = False
+        if self.instrumentation is not None:
+            self.instrumentation.count("conflicts.checks")
 
-        for existing_task in pet.tasks:
+        # Closed ranges, so instantaneous tasks at the same time overlap.
+        # A series overlapping more than once is reported once.
+        seen = set()
+        for _, _, existing_task in pet.get_overlapping(new_start, new_end):
+            if existing_task in seen:
+                continue
+            seen.add(existing_task)
             if existing_task.status == "complete":
-                continue  # Skip completed tasks
+                continue  # Skip tasks completed outside Pet.complete_task
 
             # Don't compare a task with itself
             if existing_task.task_id == new_task.task_id:
                 continue
 
-            existing_start, existing_end = pet._get_task_time_range(existing_task)
+            conflict = Conflict(pet, new_task, existing_task)
+            if self.warn_on_conflict and not found:
+                warnings.warn(conflict.message())
+            found = True
 
-            # Check for time overlap (using <= to handle instantaneous tasks)
-            # Two time ranges [start1, end1] and [start2, end2] overlap if:
-            # start1 <= end2 AND start2 <= end1
-            if new_start <= existing_end and existing_start <= new_end:
-                warnings.warn(
-                    f"Conflict detected for {pet.name}: "
-                    f"{new_task.__class__.__name__} at {new_task.time_obj.strftime('%H:%M')} overlaps with "
-                    f"{existing_task.__class__.__name__} at {existing_task.time_obj.strftime('%H:%M')}"
-                )
-                return True  # Conflict detected
+            if collector is None:
+                break  # Caller only needs to know whether there is a conflict
+            collector.append(conflict)
 
-        return False  # No conflict
+        return found
 
-    def generate_daily_schedule(self):
-        all_tasks = []
+    def find_conflicts(self, sorted_tasks):
+        """
+        Find every conflicting pair in one sweep over time-sorted tasks.
 
-        for pet in self.owner.pets:
-            for task in pet.tasks:
-                all_tasks.append((pet, task))
+        Args:
+            sorted_tasks: (pet, task) pairs sorted by task start time
+
+        Returns:
+            List of Conflict(pet, task, other) tuples, where task is the later
+            of the two and other is still running when task starts
+        """
+        items = [(pet, task, task.time_obj, task.end_time) for pet, task in sorted_tasks]
+        return [Conflict(items[idx][0], items[idx][1], items[other][1]) for idx, other in self._sweep_conflicts(items)]
+
+    def _sweep_conflicts(self, items):
+        """
+        Pair up overlapping pending items of the same pet in one sweep.
+
+        Args:
+            items: (pet, task, start_time, end_time) tuples sorted by start_time;
+                a recurring task may appear once per occurrence
+
+        Returns:
+            List of (index, other_index) pairs into items, where index is the
+            later of the two and other_index is still running when it starts
+        """
+        pairs = []
+        open_items = {}  # id(pet) -> heap of (end_time, index) still running
+        inst = self.instrumentation
+        scanned = comparisons = 0
+
+        for idx, (pet, task, start_time, end_time) in enumerate(items):
+            if task.status == "complete":
+                continue
+
+            active = open_items.setdefault(id(pet), [])
+
+            # Drop items that ended before this one starts; ranges are closed,
+            # so one ending exactly at start_time still overlaps
+            while active and active[0][0] < start_time:
+                heapq.heappop(active)
+
+            if inst is not None:
+                scanned += 1
+                comparisons += len(active)
+            for _, other in active:
+                if items[other][1].task_id != task.task_id:
+                    pairs.append((idx, other))
+
+            heapq.heappush(active, (end_time, idx))
+
+        if inst is not None:
+            inst.count("conflicts.tasks_scanned", scanned)
+            inst.count("conflicts.comparisons", comparisons)
+            inst.count("conflicts.found", len(pairs))
+        return pairs
+
+    def bulk_add(self, items, collector: list = None):
+        """
+        Add a batch of tasks through Owner.bulk_add and report its conflicts together.
+
+        Instead of a check_for_conflicts call per task, each pet gets one
+        sweep over the occurrences, recurring series included, that overlap
+        the stretch the batch covers. Only conflicts involving at least one
+        new task are reported.
+
+        Args:
+            items: Iterable of (pet, task) pairs
+            collector: Optional list that also receives every Conflict found
+
+        Returns:
+            List of Conflict for the batch
+        """
+        conflicts = []
+        for pet, tasks in self.owner.bulk_add(items).items():
+            conflicts.extend(self._batch_conflicts(pet, tasks))
+
+        if self.warn_on_conflict:
+            for conflict in conflicts:
+                warnings.warn(conflict.message())
+        if collector is not None:
+            collector.extend(conflicts)
+        return conflicts
+
+    def _batch_conflicts(self, pet: Pet, tasks):
+        batch = {id(task) for task in tasks if task.status != "complete"}
+        if not batch:
+            return []
+        ranges = [pet._get_task_time_range(task) for task in tasks if task.status != "complete"]
+        first_start = min(start_time for start_time, _ in ranges)
+        last_end = max(end_time for _, end_time in ranges)
 
-        # Sort tasks by time first, then priority (higher priority first)
-        sorted_tasks = sorted(
-            all_tasks,
-            key=lambda item: (item[1].time_obj, -item[1].priority)
+        # Series are expanded over the window, so later occurrences take part too
+        items = [(pet, task, start_time, end_time)
+                 for start_time, end_time, task in pet.get_overlapping(first_start, last_end)]
+
+        conflicts, seen = [], set()
+        for idx, other in self._sweep_conflicts(items):
+            task, other_task = items[idx][1], items[other][1]
+            if id(task) not in batch and id(other_task) not in batch:
+                continue
+            # A series clashing on several occurrences is reported once
+            if (id(task), id(other_task)) in seen:
+                continue
+            seen.add((id(task), id(other_task)))
+            conflicts.append(Conflict(pet, task, other_task))
+        return conflicts
+
+    def _timeline_window(self, start_date: date = None, end_date: date = None):
+        """
+        Return (window_start, window_end, scan_start) for a day window, or all None if start_date is None.
+
+        scan_start is early enough to see the longest task already running at window_start.
+        """
+        if start_date is None:
+            return None, None, None
+        start_date = _as_date(start_date)
+        end_date = start_date if end_date is None else _as_date(end_date)
+        window_start = datetime.combine(start_date, datetime.min.time())
+        window_end = datetime.combine(end_date, datetime.min.time()) + timedelta(days=1)
+        longest = max(
+            (max(pet.interval_index.max_span, pet.series_index.max_span) for pet in self.owner.pets),
+            default=timedelta(0)
         )
+        return window_start, window_end, window_start - longest
 
+    def find_all_conflicts_vectorized(self, start_date: date = None, end_date: date = None):
+        """
+        Find every conflicting pair of pending task occurrences across all of the owner's pets at once.
 
-        # Convert to printable strings
-        schedule_lines = []
-        for pet, task in sorted_tasks:
-            conflict = self.check_for_conflicts(task, pet)
+        Occurrence ranges, with recurring series expanded through
+        Owner.iter_timeline, are packed into NumPy arrays keyed by (pet,
+        start) so each pet occupies its own stretch of the time axis. After
+        one sort, a single searchsorted call tells every occurrence how many
+        later-starting ones begin before it ends, which are exactly its
+        conflicts.
 
-            line = (
-                f"{pet.name} - {task.__class__.__name__} at "
-                f"{task.time_obj.strftime('%H:%M')} "
-                f"[Priority {task.priority}]"
-            )
-            if conflict:
-                line += " ⚠️ CONFLICT"
-            schedule_lines.append(line)
+        Args:
+            start_date: Only report conflicts whose later task starts on this
+                day (if None, the whole default window of Owner.iter_timeline)
+            end_date: Last day to include (defaults to start_date)
+
+        Returns:
+            NumPy structured array with fields pet_id, task_id and
+            other_task_id, where task_id is the later-starting task. A series
+            clashing on several days gives one row per clash. No warnings are
+            emitted.
+        """
+        if np is None:
+            raise ImportError("NumPy is required for Scheduler.find_all_conflicts_vectorized")
+
+        window_start, window_end, scan_start = self._timeline_window(start_date, end_date)
+        slots = {id(pet): slot for slot, pet in enumerate(self.owner.pets)}
+        pet_ids, pet_slots, task_ids, starts, ends = [], [], [], [], []
+        for start_time, end_time, pet, task in self.owner.iter_timeline(scan_start, window_end):
+            if task.status == "complete":
+                continue
+            pet_ids.append(pet.pet_id)
+            pet_slots.append(slots[id(pet)])
+            task_ids.append(task.task_id)
+            starts.append(start_time)
+            ends.append(end_time)
+
+        if not starts:
+            return np.empty(0, dtype=CONFLICT_DTYPE)
+
+        starts = np.array(starts, dtype="datetime64[s]").astype(np.int64)
+        ends = np.array(ends, dtype="datetime64[s]").astype(np.int64)
+        pet_ids = np.array(pet_ids, dtype=np.int64)
+        task_ids = np.array(task_ids, dtype=np.int64)
+
+        # Shift each pet onto its own stretch of the axis so pets never overlap
+        origin = starts.min()
+        offsets = np.array(pet_slots, dtype=np.int64) * (ends.max() - origin + 1)
+        start_keys = starts - origin + offsets
+        end_keys = ends - origin + offsets
+
+        order = np.argsort(start_keys, kind="stable")
+        starts = starts[order]
+        start_keys = start_keys[order]
+        end_keys = end_keys[order]
+        pet_ids = pet_ids[order]
+        task_ids = task_ids[order]
+
+        # Tasks after position i that start no later than task i ends overlap it
+        positions = np.arange(len(start_keys))
+        counts = np.searchsorted(start_keys, end_keys, side="right") - positions - 1
+
+        earlier = np.repeat(positions, counts)
+        group_starts = np.repeat(np.cumsum(counts) - counts, counts)
+        later = earlier + (np.arange(counts.sum()) - group_starts) + 1
 
+        keep = task_ids[later] != task_ids[earlier]
+        if window_start is not None:
+            # Occurrences before the window only count as the earlier side of a pair
+            keep &= starts[later] >= np.datetime64(window_start, "s").astype(np.int64)
+        earlier = earlier[keep]
+        later = later[keep]
 
-        return schedule_lines
\ No newline at end of file
+        result = np.empty(len(earlier), dtype=CONFLICT_DTYPE)
+        result["pet_id"] = pet_ids[earlier]
+        result["task_id"] = task_ids[later]
+        result["other_task_id"] = task_ids[earlier]
+        return result
+
+    def get_stored_tasks(self, start_date: date, end_date: date = None):
+        """
+        Load the owner's tasks for a day (or range of days) straight from the store.
+
+        Only the matching rows and the pending recurring series are read,
+        using the store's (pet_id, time) indexes; series are listed once, as
+        in Pet.get_tasks_between.
+
+        Returns:
+            List of (pet_id, task) pairs sorted by time
+        """
+        if self.store is None:
+            raise ValueError("Scheduler has no store")
+        return self.store.get_tasks_between(start_date, end_date, owner_id=self.owner.owner_id)
+
+    def find_stored_conflicts(self, start_date: date, end_date: date = None):
+        """
+        Find conflicts among the owner's stored pending tasks for a day (or range of days).
+
+        Recurring series take part with every occurrence in the window.
+
+        Returns:
+            List of (pet_id, task_id, other_task_id) tuples, where task_id is
+            the later-starting task
+        """
+        if self.store is None:
+            raise ValueError("Scheduler has no store")
+        return self.store.find_conflicts(start_date, end_date, owner_id=self.owner.owner_id)
+
+    def check_resource_conflict(self, new_task: Task, pet: Pet, capacity: int = None):
+        """
+        Check whether a task would need more caretakers than the owner has.
+
+        Unlike check_for_conflicts, tasks of every pet count, because one
+        caretaker cannot be with two pets at once.
+
+        Args:
+            new_task: Task to check
+            pet: Pet the task belongs to
+            capacity: Caretakers available (defaults to owner.caretaker_capacity)
+
+        Returns:
+            True if at some moment during new_task all caretakers are busy
+        """
+        if capacity is None:
+            capacity = self.owner.caretaker_capacity
+
+        new_start, new_end = pet._get_task_time_range(new_task)
+
+        overlapping = []
+        for other_pet in self.owner.pets:
+            for start_time, end_time, task in other_pet.get_overlapping(new_start, new_end):
+                if task is not new_task and task.status != "complete":
+                    overlapping.append((max(start_time, new_start), min(end_time, new_end), other_pet, task))
+
+        # Sweep the overlapping ranges (clipped to the new task) for peak concurrency
+        overlapping.sort(key=lambda item: item[0])
+        active = []
+        for seq, (start_time, end_time, other_pet, task) in enumerate(overlapping):
+            while active and active[0][0] < start_time:
+                heapq.heappop(active)
+            heapq.heappush(active, (end_time, seq, other_pet, task))
+            if len(active) >= capacity:
+                if self.warn_on_conflict:
+                    busy = [(busy_pet, busy_task) for _, _, busy_pet, busy_task in active]
+                    warnings.warn(ResourceConflict(pet, new_task, busy).message())
+                return True
+        return False
+
+    def find_resource_conflicts(self, start_date: date = None, end_date: date = None, capacity: int = None):
+        """
+        Find every task that starts while all caretakers are busy, across all pets.
+
+        One sweep over the owner's merged timeline, keeping a heap of the
+        tasks still running: O(n log n) overall. Recurring series take part
+        with every occurrence in the window.
+
+        Args:
+            start_date: Only report tasks starting on this day (if None, the
+                whole default window of Owner.iter_timeline)
+            end_date: Last day to include (defaults to start_date)
+            capacity: Caretakers available (defaults to owner.caretaker_capacity)
+
+        Returns:
+            List of ResourceConflict in start order
+        """
+        if capacity is None:
+            capacity = self.owner.caretaker_capacity
+
+        window_start, window_end, scan_start = self._timeline_window(start_date, end_date)
+
+        conflicts = []
+        active = []  # heap of (end_time, seq, pet, task) still running
+        for seq, (start_time, end_time, pet, task) in enumerate(self.owner.iter_timeline(scan_start, window_end)):
+            if task.status == "complete":
+                continue
+            while active and active[0][0] < start_time:
+                heapq.heappop(active)
+
+            if len(active) >= capacity and (window_start is None or start_time >= window_start):
+                busy = [(busy_pet, busy_task) for _, _, busy_pet, busy_task in active]
+                conflicts.append(ResourceConflict(pet, task, busy))
+
+            heapq.heappush(active, (end_time, seq, pet, task))
+
+        if self.warn_on_conflict:
+            for conflict in conflicts:
+                warnings.warn(conflict.message())
+        return conflicts
+
+    def plan_schedule(self, start_date: date = None, end_date: date = None, windows=None, max_shift: timedelta = None):
+        """
+        Produce a conflict-free plan by shifting or dropping lower-priority tasks.
+
+        The owner is treated as a single caretaker, so no two planned tasks
+        overlap, across all pets. Tasks are placed greedily in priority order
+        (highest first, earlier requested time breaking ties), each at the
+        earliest free time at or after its requested time that fits entirely
+        inside an availability window.
+
+        Args:
+            start_date: Day to plan; every pending task is planned if None
+            end_date: Last day to include (defaults to start_date)
+            windows: (start, end) availability windows; defaults to
+                owner.availability, and an empty list means any time
+            max_shift: Drop a task rather than move it later than this
+
+        Returns:
+            Plan(scheduled, dropped)
+        """
+        if windows is None:
+            windows = self.owner.availability
+        windows = sorted(windows)
+        window_starts = [window[0] for window in windows]
+
+        candidates = []
+        for pet in self.owner.pets:
+            if start_date is None:
+                pet_occurrences = [Occurrence(task, task.time_obj) for task in pet.tasks]
+            else:
+                pet_occurrences = pet.get_occurrences_between(start_date, end_date)
+            for occurrence in pet_occurrences:
+                if occurrence.task.status != "complete":
+                    candidates.append((pet, occurrence))
+        candidates.sort(key=lambda item: (-item[1].task.priority, item[1].time_obj))
+
+        timeline = BusyTimeline(self.PLAN_GAP)
+        scheduled = []
+        dropped = []
+
+        for pet, occurrence in candidates:
+            task = occurrence.task
+            requested, requested_end = occurrence.time_obj, occurrence.end_time
+            duration = requested_end - requested
+            start_time = requested
+
+            while start_time is not None:
+                if max_shift is not None and start_time - requested > max_shift:
+                    start_time = None
+                    break
+
+                if windows:
+                    idx = bisect_right(window_starts, start_time) - 1
+                    if idx < 0 or start_time + duration > windows[idx][1]:
+                        # Doesn't fit in this window: move to the start of the next one
+                        idx += 1
+                        start_time = window_starts[idx] if idx < len(windows) else None
+                        continue
+
+                clash_end = timeline.first_clash(start_time, start_time + duration)
+                if clash_end is None:
+                    break
+                start_time = clash_end + self.PLAN_GAP
+
+            if start_time is None:
+                dropped.append((pet, task))
+                continue
+
+            timeline.reserve(start_time, start_time + duration)
+            scheduled.append(PlannedTask(pet, task, start_time, start_time + duration, requested))
+
+        scheduled.sort(key=lambda planned: (planned.start_time, -planned.task.priority))
+        return Plan(scheduled, dropped)
+
+    def _build_pet_schedule(self, pet: Pet, window):
+        """Return (entries, conflicts) for one pet, reusing the cache when the pet is unchanged."""
+        inst = self.instrumentation
+        cached = self._pet_cache.get(id(pet))
+        if cached is not None and cached[0] == pet.version and cached[1] == window:
+            if inst is not None:
+                inst.count("schedule.pet_cache_hits")
+            return cached[2], cached[3]
+
+        start_date, end_date = window
+        with _phase(inst, "schedule.gather"):
+            # Read the version with the tasks it describes, so a concurrent add
+            # cannot leave these entries cached under a newer version
+            with pet.lock:
+                version = pet.version
+                if start_date is None:
+                    occurrences = [Occurrence(task, task.time_obj) for task in pet.tasks]
+                else:
+                    occurrences = pet.get_occurrences_between(start_date, end_date)
+        if inst is not None:
+            inst.count("schedule.tasks_scanned", len(occurrences))
+
+        # Sort by time first, then priority (higher priority first)
+        with _phase(inst, "schedule.sort"):
+            occurrences.sort(key=_occurrence_key)
+
+        with _phase(inst, "schedule.conflicts"):
+            items = [(pet, occurrence.task, occurrence.time_obj, occurrence.end_time) for occurrence in occurrences]
+            pairs = self._sweep_conflicts(items)
+            conflicts = [Conflict(pet, items[idx][1], items[other][1]) for idx, other in pairs]
+            if self.warn_on_conflict:
+                for conflict in conflicts:
+                    warnings.warn(conflict.message())
+            conflicting = {idx for pair in pairs for idx in pair}
+
+        with _phase(inst, "schedule.entries"):
+            entries = [
+                ScheduleEntry(pet, occurrence.task, seq in conflicting, _occurrence_key(occurrence))
+                for seq, occurrence in enumerate(occurrences)
+            ]
+        self._pet_cache[id(pet)] = (version, window, entries, conflicts)
+        return entries, conflicts
+
+    def build_schedule(self, start_date: date = None, end_date: date = None, collector: list = None):
+        """
+        Build the owner's schedule across all pets as typed entries.
+
+        Results are cached per pet. A later call only re-sorts and re-checks
+        pets whose version changed, then merges the already-sorted per-pet
+        lists.
+
+        Args:
+            start_date: Day to schedule; every task is included if None
+            end_date: Last day to include for a multi-day window (defaults to start_date)
+            collector: Optional list that receives every Conflict found
+
+        Returns:
+            List of ScheduleEntry sorted by time, then priority. Entries are
+            only rendered to text when render() or str() is called. The list
+            may be shared with later calls, so copy it before mutating.
+        """
+        inst = self.instrumentation
+        with _phase(inst, "schedule.build"):
+            window = (start_date, end_date)
+            cache_key = (self.owner.version, window, tuple((id(pet), pet.version) for pet in self.owner.pets))
+
+            if self._schedule_cache is not None and self._schedule_cache[0] == cache_key:
+                entries, conflicts = self._schedule_cache[1], self._schedule_cache[2]
+                if inst is not None:
+                    inst.count("schedule.cache_hits")
+            else:
+                pet_entries = []
+                conflicts = []
+                for pet in self.owner.pets:
+                    entries, pet_conflicts = self._build_pet_schedule(pet, window)
+                    pet_entries.append(entries)
+                    conflicts.extend(pet_conflicts)
+
+                with _phase(inst, "schedule.merge"):
+                    entries = list(heapq.merge(*pet_entries, key=lambda entry: entry.sort_key))
+                self._schedule_cache = (cache_key, entries, conflicts)
+
+                # Forget pets that are no longer on the owner
+                current = {id(pet) for pet in self.owner.pets}
+                for pet_key in [key for key in self._pet_cache if key not in current]:
+                    del self._pet_cache[pet_key]
+
+            if collector is not None:
+                collector.extend(conflicts)
+            return entries
+
+    def build_range_schedule(self, start_date: date, end_date: date):
+        """
+        Lazily yield a ScheduleEntry for every pending occurrence from start_date through end_date.
+
+        Recurring tasks are expanded virtually with Task.occurrences, so a
+        weekly task appears in every week of the range rather than only after
+        it is completed. Each pet's already-sorted streams are merged once,
+        then the pets are k-way merged with heapq.merge; nothing is re-sorted
+        per day. Overlapping occurrences of the same pet are flagged as
+        conflicts on the entries (no warnings are emitted).
+
+        Args:
+            start_date: First day to include
+            end_date: Last day to include
+
+        Yields:
+            ScheduleEntry sorted by occurrence time, then priority; entry.time_obj
+            is the occurrence time
+        """
+        streams = [self._pet_range_entries(pet, start_date, end_date) for pet in self.owner.pets]
+        return heapq.merge(*streams, key=lambda entry: entry.sort_key)
+
+    def _pet_range_entries(self, pet: Pet, start_date: date, end_date: date):
+        occurrences = [
+            occurrence for occurrence in pet.get_occurrences_between(start_date, end_date)
+            if occurrence.task.status != "complete"
+        ]
+        items = [(pet, occurrence.task, occurrence.time_obj, occurrence.end_time) for occurrence in occurrences]
+        conflicting = {idx for pair in self._sweep_conflicts(items) for idx in pair}
+        return [
+            ScheduleEntry(pet, occurrence.task, seq in conflicting, _occurrence_key(occurrence))
+            for seq, occurrence in enumerate(occurrences)
+        ]
+
+    def generate_range_schedule(self, start_date: date, end_date: date):
+        """
+        Build printable schedule lines for each day from start_date through end_date.
+
+        Returns:
+            Dict mapping every day in the range (in order, including empty
+            days) to its schedule lines sorted by time, then priority
+        """
+        start_date = _as_date(start_date)
+        end_date = _as_date(end_date)
+        calendar: Dict[date, List[str]] = {}
+        day = start_date
+        while day <= end_date:
+            calendar[day] = []
+            day += timedelta(days=1)
+
+        for entry in self.build_range_schedule(start_date, end_date):
+            calendar[entry.time_obj.date()].append(entry.render())
+        return calendar
+
+    def generate_weekly_calendar(self, day: date):
+        """
+        Build a printable Monday-to-Sunday calendar for the week containing day.
+
+        Returns:
+            List of lines: a heading per day followed by its indented schedule lines
+        """
+        day = _as_date(day)
+        week_start = day - timedelta(days=day.weekday())
+
+        lines = []
+        for current, day_lines in self.generate_range_schedule(week_start, week_start + timedelta(days=6)).items():
+            lines.append(current.strftime("%A %Y-%m-%d"))
+            lines.extend(f"  {line}" for line in day_lines)
+            if not day_lines:
+                lines.append("  No tasks")
+        return lines
+
+    def generate_daily_schedule(self, start_date: date = None, end_date: date = None, collector: list = None):
+        """
+        Build the owner's schedule across all pets as printable lines.
+
+        Takes the same arguments as build_schedule, which should be preferred
+        by callers that filter or paginate before displaying.
+
+        Returns:
+            List of printable schedule lines sorted by time, then priority
+        """
+        inst = self.instrumentation
+        with _phase(inst, "schedule.generate"):
+            entries = self.build_schedule(start_date, end_date, collector)
+            with _phase(inst, "schedule.format"):
+                return [entry.render() for entry in entries]
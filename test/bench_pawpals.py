@@ -0,0 +1,145 @@
+"""
+Benchmarks for the pawpal_system scheduling hot paths.
+
+Builds synthetic owners with N pets and M tasks per pet and reports wall time
+and peak traced memory for each operation, at each requested size, so the
+scaling of the scheduler (and regressions back to O(n^2)) is visible.
+
+    python test/bench_pawpals.py --pets 5 --tasks 500,2000,8000 --conflict-density 0.2
+
+The file is deliberately not named test_*, so test runners skip it.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pawpal_system import Owner, Pet, Scheduler, Walk, Feed, GiveMedicine, np  # noqa: E402
+
+
+START = datetime(2026, 1, 1, 6, 0)
+
+
+def build_owner(pets: int, tasks_per_pet: int, conflict_density: float, days: int, seed: int = 0):
+    """
+    Create an owner with synthetic tasks spread over a number of days.
+
+    Roughly conflict_density of the tasks are placed inside the previous
+    task's walk window so they conflict; the rest land at random times.
+    """
+    rng = random.Random(seed)
+    owner = Owner(1, "Bench Owner", "bench@example.com")
+    task_id = 0
+
+    for pet_number in range(pets):
+        pet = Pet(pet_number + 1, f"Pet {pet_number + 1}", "dog", "Mixed", "None")
+        owner.add_pet(pet)
+        previous_time = None
+
+        for _ in range(tasks_per_pet):
+            task_id += 1
+            if previous_time is not None and rng.random() < conflict_density:
+                time_obj = previous_time + timedelta(minutes=rng.randint(0, 20))
+            else:
+                time_obj = START + timedelta(days=rng.randrange(days), minutes=5 * rng.randrange(16 * 12))
+
+            kind = rng.random()
+            recurrence = rng.choice(("none", "none", "daily", "weekly"))
+            if kind < 0.4:
+                task = Walk(task_id, time_obj, rng.randint(1, 3), rng.choice((15, 20, 30, 45)), recurrence)
+                previous_time = time_obj
+            elif kind < 0.75:
+                task = Feed(task_id, time_obj, rng.randint(1, 3), "Kibble", "1 cup", recurrence)
+            else:
+                task = GiveMedicine(task_id, time_obj, rng.randint(1, 3), "PetMed", "5ml", recurrence)
+            pet.add_task(task)
+
+    return owner, task_id
+
+
+def measure(make_operation):
+    """
+    Return (seconds, peak traced bytes) for an operation.
+
+    Time and memory come from two separate runs, because tracemalloc slows
+    allocation-heavy code down. make_operation builds a fresh callable for
+    each run so operations that mutate state can be measured twice.
+    """
+    operation = make_operation()
+    started = time.perf_counter()
+    operation()
+    elapsed = time.perf_counter() - started
+
+    operation = make_operation()
+    tracemalloc.start()
+    operation()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def benchmark_size(pets: int, tasks_per_pet: int, conflict_density: float, days: int, seed: int):
+    """Yield (operation name, seconds, peak bytes) for one owner size."""
+    owner, _ = build_owner(pets, tasks_per_pet, conflict_density, days, seed)
+    scheduler = Scheduler(owner, warn_on_conflict=False)
+    scheduler.build_schedule()  # warm the schedule cache
+    busiest_pet = owner.pets[0]
+    first_day = START.date()
+    probes = busiest_pet.tasks[:200]
+
+    def complete_recurring():
+        fresh_owner, next_id = build_owner(pets, tasks_per_pet, conflict_density, days, seed)
+
+        def run():
+            task_id = next_id
+            for pet in fresh_owner.pets:
+                for task in [t for t in pet.tasks if t.recurrence != "none" and t.status == "pending"]:
+                    task_id += 1
+                    pet.complete_task(task, task_id)
+        return run
+
+    # A fresh Scheduler each time so the schedule cache does not hide the work
+    operations = [
+        ("generate_daily_schedule (all)",
+         lambda: lambda: Scheduler(owner, warn_on_conflict=False).generate_daily_schedule()),
+        ("generate_daily_schedule (1 day)",
+         lambda: lambda: Scheduler(owner, warn_on_conflict=False).generate_daily_schedule(first_day)),
+        ("build_schedule (cached)", lambda: scheduler.build_schedule),
+        (f"check_for_conflicts x{len(probes)}",
+         lambda: lambda: [scheduler.check_for_conflicts(task, busiest_pet) for task in probes]),
+        ("Pet.get_daily_schedule (all)", lambda: busiest_pet.get_daily_schedule),
+        ("Pet.get_daily_schedule (1 day)", lambda: lambda: busiest_pet.get_daily_schedule(first_day)),
+    ]
+    if np is not None:
+        operations.append(("find_all_conflicts_vectorized", lambda: scheduler.find_all_conflicts_vectorized))
+    operations.append(("complete_task (recurring)", complete_recurring))
+
+    for name, make_operation in operations:
+        yield (name,) + measure(make_operation)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pets", type=int, default=3, help="pets per owner")
+    parser.add_argument("--tasks", default="250,1000,4000",
+                        help="comma-separated task counts per pet to benchmark")
+    parser.add_argument("--conflict-density", type=float, default=0.1,
+                        help="fraction of tasks placed inside the previous walk (0-1)")
+    parser.add_argument("--days", type=int, default=30, help="days the tasks are spread over")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    print(f"{'tasks/pet':>9}  {'operation':<34} {'time (ms)':>10} {'peak (KiB)':>11}")
+    for tasks_per_pet in (int(n) for n in args.tasks.split(",")):
+        for name, seconds, peak in benchmark_size(args.pets, tasks_per_pet, args.conflict_density, args.days, args.seed):
+            print(f"{tasks_per_pet:>9}  {name:<34} {seconds * 1000:>10.2f} {peak / 1024:>11.1f}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+import asyncio
+import unittest
+from datetime import datetime, timedelta
+
+from pawpal_system import Pet, Walk, Feed, GiveMedicine, Owner
+from pawpal_dispatch import ReminderDispatcher
+
+
+class TestReminderDispatcher(unittest.TestCase):
+
+    def test_fires_due_tasks_in_time_order_and_picks_up_new_ones(self):
+        """Verify that due tasks fire in order, missed ones are skipped and new ones are picked up."""
+        owner = Owner(1, "Jordan", "jordan@example.com")
+        dog = Pet(1, "Mochi", "dog", "Shiba Inu", "None")
+        cat = Pet(2, "Tofu", "cat", "Tabby", "None")
+        owner.add_pet(dog)
+        owner.add_pet(cat)
+
+        now = datetime.now()
+        dog.add_task(Walk(task_id=1, time_obj=now + timedelta(milliseconds=60), priority=1, duration=20))
+        cat.add_task(Feed(task_id=2, time_obj=now + timedelta(milliseconds=20), priority=1,
+                          food_type="Tuna", portion_size="1 can"))
+        dog.add_task(Feed(task_id=3, time_obj=now - timedelta(hours=1), priority=1,
+                          food_type="Kibble", portion_size="1 cup"))  # missed
+        removed = Walk(task_id=4, time_obj=now + timedelta(milliseconds=40), priority=1, duration=10)
+        dog.add_task(removed)
+
+        fired = []
+        dispatcher = ReminderDispatcher(owner, notifier=lambda pet, task: fired.append(task.task_id))
+
+        async def scenario():
+            runner = asyncio.create_task(dispatcher.run(stop_when_idle=True))
+            await asyncio.sleep(0)
+            dog.remove_task(removed)
+            cat.add_task(GiveMedicine(task_id=5, time_obj=datetime.now() + timedelta(milliseconds=40), priority=3,
+                                      medication_name="Drops", dosage="2 drops"))
+            await asyncio.wait_for(runner, timeout=2)
+
+        asyncio.run(scenario())
+
+        self.assertEqual(fired, [2, 5, 1])
+        self.assertEqual(dog.task_listeners, [])
+
+    def test_watches_pets_added_after_run_starts(self):
+        """Verify that a pet added to the owner while running has its tasks dispatched."""
+        owner = Owner(2, "Riley", "riley@example.com")
+        fired = []
+        dispatcher = ReminderDispatcher(owner, notifier=lambda pet, task: fired.append((pet.name, task.task_id)))
+
+        async def scenario():
+            runner = asyncio.create_task(dispatcher.run())
+            await asyncio.sleep(0)
+            hamster = Pet(7, "Pip", "hamster", "Syrian", "None")
+            hamster.add_task(Feed(task_id=11, time_obj=datetime.now() + timedelta(milliseconds=20), priority=1,
+                                  food_type="Seeds", portion_size="1 tbsp"))
+            owner.add_pet(hamster)
+            await asyncio.sleep(0.1)
+            dispatcher.stop()
+            await asyncio.wait_for(runner, timeout=2)
+            return hamster
+
+        hamster = asyncio.run(scenario())
+
+        self.assertEqual(fired, [("Pip", 11)])
+        self.assertEqual(owner.pet_listeners, [])
+        self.assertEqual(hamster.task_listeners, [])
+
+    def test_stop_before_run_is_not_lost(self):
+        """Verify that calling stop() before run() makes run() return without dispatching."""
+        owner = Owner(3, "Casey", "casey@example.com")
+        parrot = Pet(8, "Kiwi", "bird", "Parrot", "None")
+        owner.add_pet(parrot)
+        parrot.add_task(Walk(task_id=12, time_obj=datetime.now() + timedelta(hours=2), priority=1, duration=15))
+        fired = []
+        dispatcher = ReminderDispatcher(owner, notifier=lambda pet, task: fired.append(task.task_id))
+
+        dispatcher.stop()
+        asyncio.run(asyncio.wait_for(dispatcher.run(), timeout=2))
+
+        self.assertEqual(fired, [])
+        self.assertEqual(parrot.task_listeners, [])
+
+    def test_rescheduled_task_fires_once_at_its_new_time(self):
+        """Verify that a task moved with Pet.reschedule_task fires once, at the new time."""
+        owner = Owner(4, "Morgan", "morgan@example.com")
+        turtle = Pet(9, "Shelly", "turtle", "Box", "None")
+        owner.add_pet(turtle)
+        feed = Feed(task_id=13, time_obj=datetime.now() + timedelta(milliseconds=20), priority=1,
+                    food_type="Greens", portion_size="1 handful")
+        turtle.add_task(feed)
+        fired = []
+        dispatcher = ReminderDispatcher(owner, notifier=lambda pet, task: fired.append((task.task_id, task.time_obj)))
+
+        async def scenario():
+            runner = asyncio.create_task(dispatcher.run(stop_when_idle=True))
+            await asyncio.sleep(0)
+            turtle.reschedule_task(feed, time_obj=datetime.now() + timedelta(milliseconds=60))
+            await asyncio.wait_for(runner, timeout=2)
+
+        asyncio.run(scenario())
+
+        self.assertEqual(fired, [(13, feed.time_obj)])
+
+    def test_series_fire_their_next_pending_occurrence(self):
+        """Verify that a recurring series fires its upcoming occurrence and skips completed ones."""
+        owner = Owner(5, "Avery", "avery@example.com")
+        goat = Pet(10, "Clover", "goat", "Nigerian Dwarf", "None")
+        owner.add_pet(goat)
+        now = datetime.now()
+        walk = Walk(task_id=14, time_obj=now - timedelta(days=2) + timedelta(milliseconds=20), priority=1,
+                    duration=15, recurrence="daily")
+        feed = Feed(task_id=15, time_obj=now - timedelta(days=1) + timedelta(milliseconds=40), priority=1,
+                    food_type="Hay", portion_size="1 flake", recurrence="daily")
+        goat.add_task(walk)
+        goat.add_task(feed)
+        fired = []
+        dispatcher = ReminderDispatcher(owner, notifier=lambda pet, task: fired.append(task.task_id))
+
+        async def scenario():
+            runner = asyncio.create_task(dispatcher.run())
+            await asyncio.sleep(0)
+            goat.complete_occurrence(feed, feed.time_obj + timedelta(days=1))
+            await asyncio.sleep(0.1)
+            dispatcher.stop()
+            await asyncio.wait_for(runner, timeout=2)
+
+        asyncio.run(scenario())
+
+        self.assertEqual(fired, [14])
+
+
+if __name__ == "__main__":
+    unittest.main()
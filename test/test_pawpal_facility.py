@@ -0,0 +1,130 @@
+import os
+import tempfile
+import unittest
+from datetime import date, datetime, timedelta
+
+from pawpal_system import Pet, Walk, Feed, GiveMedicine, Owner
+from pawpal_storage import SQLiteStore
+from pawpal_facility import FacilityScheduler, forecast_medications, parse_dosage
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - NumPy is optional
+    numpy = None
+
+
+def make_owner(owner_id: int) -> Owner:
+    owner = Owner(owner_id, f"Owner {owner_id}", f"owner{owner_id}@example.com")
+    pet = Pet(owner_id * 10, f"Pet {owner_id}", "dog", "Mixed", "None")
+    owner.add_pet(pet)
+
+    base_time = datetime(2026, 2, 11, 8, 0)
+    pet.add_task(Walk(task_id=1, time_obj=base_time, priority=2, duration=30))
+    # Every third owner gets an overlapping feed
+    offset = 15 if owner_id % 3 == 0 else 90
+    pet.add_task(Feed(task_id=2, time_obj=base_time + timedelta(minutes=offset), priority=1,
+                      food_type="Kibble", portion_size="1 cup"))
+    return owner
+
+
+class TestFacilityScheduler(unittest.TestCase):
+
+    def test_parallel_schedules_for_many_owners(self):
+        """Verify that every owner's schedule comes back from the worker pool."""
+        owners = (make_owner(owner_id) for owner_id in range(1, 31))
+        facility = FacilityScheduler(owners, max_workers=2, batch_size=4)
+
+        results = facility.generate_schedules(date(2026, 2, 11))
+
+        self.assertEqual(sorted(results), list(range(1, 31)))
+        self.assertEqual(results[3].conflicts, [(30, 2, 1)])
+        self.assertEqual(results[4].conflicts, [])
+        self.assertEqual(results[4].lines[0], "Pet 4 - Walk at 08:00 [Priority 2]")
+
+    def test_workers_load_owners_from_store(self):
+        """Verify that owners can be read by the workers straight from a store file."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "facility.db")
+            with SQLiteStore(path) as store:
+                for owner_id in range(1, 7):
+                    store.save_owner(make_owner(owner_id))
+
+            results = list(FacilityScheduler(store_path=path, max_workers=2, batch_size=2).iter_schedules())
+
+        self.assertEqual(sorted(r.owner_id for r in results), list(range(1, 7)))
+        self.assertEqual(sum(len(r.conflicts) for r in results), 2)
+
+    def test_requires_exactly_one_source(self):
+        """Verify that the facility scheduler rejects missing or unshareable sources."""
+        with self.assertRaises(ValueError):
+            FacilityScheduler()
+        with self.assertRaises(ValueError):
+            FacilityScheduler(store_path=":memory:")
+
+
+class TestMedicationForecast(unittest.TestCase):
+
+    def make_owner(self):
+        owner = Owner(1, "Jordan", "jordan@example.com")
+        dog = Pet(101, "Mochi", "dog", "Shiba Inu", "None")
+        cat = Pet(102, "Tofu", "cat", "Tabby", "Insulin")
+        owner.add_pet(dog)
+        owner.add_pet(cat)
+        start = datetime(2026, 3, 1, 8, 0)
+
+        # Daily antibiotic at 08:10, inside the daily 08:00-08:30 walk; one dose already given
+        antibiotic = GiveMedicine(task_id=1, time_obj=start - timedelta(days=10, minutes=-10), priority=3,
+                                  medication_name="Antibiotic", dosage="5ml", recurrence="daily")
+        antibiotic.complete_occurrence(start + timedelta(days=3, minutes=10))
+        dog.add_task(antibiotic)
+        dog.add_task(Walk(task_id=2, time_obj=start, priority=2, duration=30, recurrence="daily"))
+        # Weekly insulin for the cat, whose walk-free schedule means no collisions
+        cat.add_task(GiveMedicine(task_id=3, time_obj=start + timedelta(hours=1), priority=3,
+                                  medication_name="Insulin", dosage="2 units", recurrence="weekly"))
+        cat.add_task(GiveMedicine(task_id=4, time_obj=start + timedelta(days=5), priority=3,
+                                  medication_name="Insulin", dosage="a splash"))
+        return owner
+
+    def test_parse_dosage(self):
+        """Verify that dosage strings split into amount and unit."""
+        self.assertEqual(parse_dosage("5ml"), (5.0, "ml"))
+        self.assertEqual(parse_dosage(" 2.5 units "), (2.5, "units"))
+        self.assertEqual(parse_dosage("a splash"), (None, "a splash"))
+
+    @unittest.skipIf(numpy is None, "NumPy not installed")
+    def test_forecast_matches_expanded_occurrences(self):
+        """Verify that the vectorized projection agrees with Task.occurrences."""
+        owner = self.make_owner()
+        start = date(2026, 3, 1)
+        forecast = forecast_medications([owner], start, days=90)
+
+        window_start = datetime(2026, 3, 1)
+        window_end = window_start + timedelta(days=90)
+        expected = sorted(
+            (occurrence.time_obj, task.task_id)
+            for pet in owner.pets for task in pet.tasks if isinstance(task, GiveMedicine)
+            for occurrence in task.occurrences(window_start, window_end)
+        )
+        self.assertEqual(sorted(zip(forecast.doses["time"].tolist(), forecast.doses["task_id"].tolist())), expected)
+
+        self.assertEqual(forecast.dose_counts, {"Antibiotic": 89, "Insulin": 14})
+        self.assertEqual(forecast.total_dosage, {("Antibiotic", "ml"): 445.0, ("Insulin", "units"): 26.0})
+        self.assertEqual(forecast.walk_collisions, {"Antibiotic": 89, "Insulin": 0})
+        self.assertTrue(all(forecast.doses["walk_collision"][forecast.doses["pet_id"] == 101]))
+
+    @unittest.skipIf(numpy is None, "NumPy not installed")
+    def test_facility_forecast_reads_owners_from_store(self):
+        """Verify that FacilityScheduler forecasts owners loaded from a store."""
+        handle, path = tempfile.mkstemp(suffix=".db")
+        os.close(handle)
+        try:
+            with SQLiteStore(path) as store:
+                store.save_owner(self.make_owner())
+            forecast = FacilityScheduler(store_path=path).forecast_medications(date(2026, 3, 1), days=7)
+            self.assertEqual(forecast.dose_counts, {"Antibiotic": 6, "Insulin": 2})
+        finally:
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
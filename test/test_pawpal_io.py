@@ -0,0 +1,80 @@
+import io
+import unittest
+from datetime import datetime, timedelta
+
+from pawpal_system import Pet, Walk, Feed, GiveMedicine, Owner
+from pawpal_io import read_csv, read_jsonl, write_csv, write_jsonl
+
+
+def make_owners():
+    owners = []
+    for owner_id in (1, 2):
+        owner = Owner(owner_id, f"Owner {owner_id}", f"owner{owner_id}@example.com")
+        owner.availability = [(datetime(2026, 2, 11, 8, 0), datetime(2026, 2, 11, 18, 0))]
+        pet = Pet(owner_id * 100, f"Pet {owner_id}", "dog", "Mixed, \"rescue\"", "None")
+        owner.add_pet(pet)
+
+        base_time = datetime(2026, 2, 11, 9, 0)
+        walk = Walk(task_id=1, time_obj=base_time, priority=2, duration=30, recurrence="daily")
+        walk.complete_occurrence(base_time + timedelta(days=1))
+        pet.add_task(walk)
+        pet.add_task(Feed(task_id=2, time_obj=base_time + timedelta(hours=3), priority=1,
+                          food_type="Kibble", portion_size="1 cup"))
+        meds = GiveMedicine(task_id=3, time_obj=base_time + timedelta(hours=6), priority=3,
+                            medication_name="Insulin", dosage="2 units", recurrence="weekly")
+        meds.mark_complete(next_task_id=4)
+        pet.add_task(meds)
+        owners.append(owner)
+    return owners
+
+
+class TestPawPalIO(unittest.TestCase):
+
+    def assert_round_trip(self, loaded):
+        self.assertEqual([owner.owner_id for owner in loaded], [1, 2])
+        pet = loaded[1].pets[0]
+        self.assertEqual(pet.breed, "Mixed, \"rescue\"")
+        self.assertEqual(loaded[1].availability, [(datetime(2026, 2, 11, 8, 0), datetime(2026, 2, 11, 18, 0))])
+
+        walk, feed, meds = pet.tasks
+        self.assertIsInstance(walk, Walk)
+        self.assertEqual((walk.duration, walk.recurrence), (30, "daily"))
+        self.assertEqual(walk.exceptions, {datetime(2026, 2, 12, 9, 0)})
+        self.assertEqual((feed.food_type, feed.portion_size), ("Kibble", "1 cup"))
+        self.assertIsInstance(meds, GiveMedicine)
+        self.assertEqual((meds.status, meds.recurrence), ("complete", "weekly"))
+
+    def test_jsonl_round_trip(self):
+        """Verify that owners survive a JSON Lines export and import."""
+        buffer = io.StringIO()
+        self.assertEqual(write_jsonl(make_owners(), buffer), 10)
+        buffer.seek(0)
+        self.assert_round_trip(list(read_jsonl(buffer)))
+
+    def test_csv_round_trip(self):
+        """Verify that owners survive a CSV export and import."""
+        buffer = io.StringIO()
+        write_csv(make_owners(), buffer)
+        buffer.seek(0)
+        self.assert_round_trip(list(read_csv(buffer)))
+
+    def test_loader_yields_owner_before_reading_whole_file(self):
+        """Verify that the loader streams: the first owner arrives after reading just past it."""
+        buffer = io.StringIO()
+        write_jsonl(make_owners(), buffer)
+        lines = buffer.getvalue().splitlines(keepends=True)
+
+        consumed = []
+
+        def tracked_lines():
+            for line in lines:
+                consumed.append(line)
+                yield line
+
+        first = next(read_jsonl(tracked_lines()))
+        self.assertEqual(first.owner_id, 1)
+        self.assertEqual(len(consumed), 6)  # owner, pet, 3 tasks and the next owner's header
+
+
+if __name__ == "__main__":
+    unittest.main()
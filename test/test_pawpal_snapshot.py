@@ -0,0 +1,127 @@
+import os
+import tempfile
+import unittest
+from datetime import date, datetime, timedelta
+
+from pawpal_system import Pet, Walk, Feed, GiveMedicine, Owner, Scheduler
+from pawpal_snapshot import Snapshot, write_snapshot
+from pawpal_storage import SQLiteStore
+
+
+class TestSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.owner = Owner(1, "Jordan", "jordan@example.com")
+        self.dog = Pet(101, "Mochi", "dog", "Shiba Inu", "None")
+        self.cat = Pet(102, "Tofu", "cat", "Tabby", "Insulin")
+        self.owner.add_pet(self.dog)
+        self.owner.add_pet(self.cat)
+        other = Owner(2, "Sam", "sam@example.com")
+        other.add_pet(Pet(201, "Rex", "dog", "Boxer", "None"))
+
+        base_time = datetime(2026, 2, 11, 9, 0)
+        walk = Walk(task_id=1, time_obj=base_time, priority=2, duration=45, recurrence="daily")
+        walk.complete_occurrence(base_time + timedelta(days=2))
+        self.dog.add_task(walk)
+        self.dog.add_task(Feed(task_id=3, time_obj=base_time + timedelta(days=1), priority=1,
+                               food_type="Kibble", portion_size="1 cup"))
+        self.dog.add_task(Feed(task_id=2, time_obj=base_time + timedelta(minutes=30), priority=1,
+                               food_type="Kibble", portion_size="1 cup"))
+        self.cat.add_task(GiveMedicine(task_id=4, time_obj=base_time + timedelta(minutes=30), priority=3,
+                                       medication_name="Insulin", dosage="2 units", recurrence="weekly"))
+        other.pets[0].add_task(Walk(task_id=5, time_obj=base_time, priority=1, duration=20))
+        self.owners = [self.owner, other]
+
+        handle, self.path = tempfile.mkstemp(suffix=".snap")
+        os.close(handle)
+        self.assertEqual(write_snapshot(self.owners, self.path), 5)
+        self.snapshot = Snapshot(self.path)
+
+    def tearDown(self):
+        self.snapshot.close()
+        os.remove(self.path)
+
+    def test_round_trip_rebuilds_owners(self):
+        """Verify that a snapshot loads back with the same pets and task details."""
+        self.assertEqual(self.snapshot.owner_ids(), [1, 2])
+        loaded = self.snapshot.load_owner(1)
+
+        self.assertEqual([pet.name for pet in loaded.pets], ["Mochi", "Tofu"])
+        walk, feed, _ = loaded.pets[0].tasks  # stored in start order
+        self.assertIsInstance(walk, Walk)
+        self.assertEqual((walk.duration, walk.recurrence), (45, "daily"))
+        self.assertEqual(walk.exceptions, {datetime(2026, 2, 13, 9, 0)})
+        self.assertEqual((feed.task_id, feed.food_type), (2, "Kibble"))
+        meds = loaded.pets[1].tasks[0]
+        self.assertEqual((meds.medication_name, meds.dosage), ("Insulin", "2 units"))
+        self.assertIsNone(self.snapshot.load_owner(99))
+
+    def test_range_query_reads_only_the_requested_days(self):
+        """Verify that day queries match the SQLite store's results."""
+        tasks = self.snapshot.get_tasks_between(date(2026, 2, 11), owner_id=1)
+        self.assertEqual([(pet_id, task.task_id) for pet_id, task in tasks], [(101, 1), (102, 4), (101, 2)])
+        # The daily walk's next occurrence is listed alongside feed 3; its Feb 13 occurrence is done
+        self.assertEqual([task.task_id for _, task in self.snapshot.get_tasks_between(date(2026, 2, 12))], [1, 3])
+        self.assertEqual([task.task_id for _, task in self.snapshot.get_tasks_between(date(2026, 2, 13))], [])
+        self.assertEqual(self.snapshot.get_tasks_between(date(2026, 2, 11), pet_id=201, owner_id=1), [])
+
+    def test_conflicts_match_sqlite_store(self):
+        """Verify that conflict queries agree with SQLiteStore.find_conflicts."""
+        self.dog.add_task(Walk(task_id=6, time_obj=datetime(2026, 2, 11, 9, 40), priority=1, duration=10))
+        self.cat.add_task(Walk(task_id=7, time_obj=datetime(2026, 2, 11, 9, 25), priority=1, duration=10))
+        write_snapshot(self.owners, self.path)
+
+        with Snapshot(self.path) as snapshot, SQLiteStore() as store:
+            for owner in self.owners:
+                store.save_owner(owner)
+            expected = store.find_conflicts(date(2026, 2, 11))
+            self.assertEqual(expected, [(101, 2, 1), (102, 4, 7), (101, 6, 1)])
+            self.assertEqual(snapshot.find_conflicts(date(2026, 2, 11)), expected)
+            self.assertEqual(snapshot.find_conflicts(date(2026, 2, 12)), [(101, 3, 1)])
+            self.assertEqual(snapshot.find_conflicts(date(2026, 2, 12)), store.find_conflicts(date(2026, 2, 12)))
+            self.assertEqual(snapshot.find_conflicts(), expected + [(101, 3, 1)])
+
+            scheduler = Scheduler(self.owner, warn_on_conflict=False, store=snapshot)
+            self.assertEqual(scheduler.find_stored_conflicts(date(2026, 2, 11)), expected)
+
+    def test_round_trip_keeps_owner_availability(self):
+        """Verify that availability windows are stored per owner."""
+        self.owner.availability = [(datetime(2026, 2, 11, 8, 0), datetime(2026, 2, 11, 12, 0)),
+                                   (datetime(2026, 2, 12, 17, 30), datetime(2026, 2, 12, 19, 0))]
+        write_snapshot(self.owners, self.path)
+
+        with Snapshot(self.path) as snapshot:
+            self.assertEqual(snapshot.load_owner(1).availability, self.owner.availability)
+            self.assertEqual(snapshot.load_owner(2).availability, [])
+
+    def test_queries_expand_recurring_series(self):
+        """Verify that range and conflict queries see later occurrences of a series, like the pet views."""
+        owner = Owner(3, "Lars", "lars@example.com")
+        pet = Pet(301, "Storm", "dog", "Husky", "None")
+        owner.add_pet(pet)
+        pet.add_task(Walk(task_id=1, time_obj=datetime(2026, 1, 1, 9, 0), priority=1, duration=60, recurrence="daily"))
+        pet.add_task(Feed(task_id=2, time_obj=datetime(2026, 3, 3, 9, 20), priority=1,
+                          food_type="Kibble", portion_size="1 cup"))
+        write_snapshot([owner], self.path)
+
+        with Snapshot(self.path) as snapshot, SQLiteStore() as store:
+            store.save_owner(owner)
+            for day in (date(2026, 1, 1), date(2026, 3, 3), date(2026, 3, 4)):
+                self.assertEqual([task.task_id for _, task in snapshot.get_tasks_between(day)],
+                                 [task.task_id for task in pet.get_tasks_between(day)])
+            self.assertEqual(snapshot.find_conflicts(date(2026, 3, 3)), [(301, 2, 1)])
+            self.assertEqual(snapshot.find_conflicts(date(2026, 3, 1), date(2026, 3, 4)),
+                             store.find_conflicts(date(2026, 3, 1), date(2026, 3, 4)))
+            self.assertEqual(snapshot.find_conflicts(date(2026, 3, 4)), [])
+            self.assertEqual(snapshot.find_conflicts(), [(301, 2, 1)])
+
+    def test_rejects_files_that_are_not_snapshots(self):
+        """Verify that opening an unrelated file raises ValueError."""
+        with open(self.path, "wb") as fp:
+            fp.write(b"not a snapshot at all, just some bytes")
+        with self.assertRaises(ValueError):
+            Snapshot(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
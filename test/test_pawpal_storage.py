@@ -0,0 +1,136 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from datetime import date, datetime, timedelta
+
+from pawpal_system import Pet, Walk, Feed, GiveMedicine, Owner, Scheduler
+from pawpal_storage import SQLiteStore
+
+
+class TestSQLiteStore(unittest.TestCase):
+
+    def setUp(self):
+        self.store = SQLiteStore()
+
+        self.owner = Owner(1, "Jordan", "jordan@example.com")
+        self.dog = Pet(101, "Mochi", "dog", "Shiba Inu", "None")
+        self.cat = Pet(102, "Tofu", "cat", "Tabby", "Insulin")
+        self.owner.add_pet(self.dog)
+        self.owner.add_pet(self.cat)
+
+        base_time = datetime(2026, 2, 11, 9, 0)
+        self.dog.add_task(Walk(task_id=1, time_obj=base_time, priority=2, duration=45, recurrence="daily"))
+        self.dog.add_task(Feed(task_id=2, time_obj=base_time + timedelta(minutes=30), priority=1,
+                               food_type="Kibble", portion_size="1 cup"))
+        self.dog.add_task(Feed(task_id=3, time_obj=base_time + timedelta(days=1), priority=1,
+                               food_type="Kibble", portion_size="1 cup"))
+        self.cat.add_task(GiveMedicine(task_id=4, time_obj=base_time + timedelta(minutes=30), priority=3,
+                                       medication_name="Insulin", dosage="2 units", recurrence="weekly"))
+
+        self.store.save_owner(self.owner)
+
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.store.close()
+        self.tmpdir.cleanup()
+
+    def test_round_trip_rebuilds_task_subclasses(self):
+        """Verify that a saved owner loads back with the same pets and task details."""
+        loaded = self.store.load_owner(1)
+
+        self.assertEqual([pet.name for pet in loaded.pets], ["Mochi", "Tofu"])
+        walk = loaded.pets[0].tasks[0]
+        self.assertIsInstance(walk, Walk)
+        self.assertEqual(walk.duration, 45)
+        self.assertEqual(walk.recurrence, "daily")
+
+        meds = loaded.pets[1].tasks[0]
+        self.assertIsInstance(meds, GiveMedicine)
+        self.assertEqual((meds.medication_name, meds.dosage), ("Insulin", "2 units"))
+        self.assertIsNone(self.store.load_owner(99))
+
+    def test_save_owner_drops_removed_pets_and_their_tasks(self):
+        """Verify that saving an owner deletes pets it no longer has, along with their tasks."""
+        self.owner.remove_pet(self.cat)
+        self.store.save_owner(self.owner)
+
+        loaded = self.store.load_owner(1)
+        self.assertEqual([pet.pet_id for pet in loaded.pets], [101])
+        self.assertEqual(self.store.connection.execute("SELECT COUNT(*) FROM tasks WHERE pet_id = 102").fetchone()[0], 0)
+        self.assertEqual([task.task_id for _, task in self.store.get_tasks_between(date(2026, 2, 11), owner_id=1)],
+                         [1, 2])
+
+    def test_round_trip_keeps_owner_capacity_and_availability(self):
+        """Verify that caretaker capacity and availability windows survive a save and load."""
+        owner = Owner(2, "Priya", "priya@example.com")
+        owner.caretaker_capacity = 3
+        owner.availability = [(datetime(2026, 3, 2, 7, 0), datetime(2026, 3, 2, 12, 30))]
+        self.store.save_owner(owner)
+
+        loaded = self.store.load_owner(2)
+        self.assertEqual(loaded.caretaker_capacity, 3)
+        self.assertEqual(loaded.availability, owner.availability)
+
+    def test_opening_old_database_adds_owner_columns(self):
+        """Verify that a database created before the owner columns existed is migrated on open."""
+        path = os.path.join(self.tmpdir.name, "old.db")
+        connection = sqlite3.connect(path)
+        connection.execute("CREATE TABLE owners (owner_id INTEGER PRIMARY KEY, name TEXT NOT NULL, contact_info TEXT)")
+        connection.execute("INSERT INTO owners VALUES (5, 'Sam', 'sam@example.com')")
+        connection.commit()
+        connection.close()
+
+        store = SQLiteStore(path)
+        try:
+            loaded = store.load_owner(5)
+            self.assertEqual((loaded.name, loaded.caretaker_capacity, loaded.availability), ("Sam", 1, []))
+        finally:
+            store.close()
+
+    def test_scheduler_day_query_and_conflicts_from_store(self):
+        """Verify that the scheduler answers day and conflict queries from the store."""
+        scheduler = Scheduler(self.owner, store=self.store)
+
+        today = scheduler.get_stored_tasks(date(2026, 2, 11))
+        self.assertEqual([(pet_id, task.task_id) for pet_id, task in today], [(101, 1), (102, 4), (101, 2)])
+
+        self.assertEqual(scheduler.find_stored_conflicts(date(2026, 2, 11)), [(101, 2, 1)])
+        # The daily walk's next occurrence lands on feed 3
+        self.assertEqual(scheduler.find_stored_conflicts(date(2026, 2, 12)), [(101, 3, 1)])
+
+        # Completed tasks drop out of conflict queries
+        self.dog.tasks[1].mark_complete()
+        self.store.add_tasks(self.dog, [self.dog.tasks[1]])
+        self.assertEqual(scheduler.find_stored_conflicts(date(2026, 2, 11)), [])
+
+    def test_store_queries_expand_recurring_series(self):
+        """Verify that stored day and conflict queries see later occurrences of a series, like the pet views."""
+        owner = Owner(2, "Sam", "sam@example.com")
+        pet = Pet(201, "Pip", "dog", "Beagle", "None")
+        owner.add_pet(pet)
+        walk = Walk(task_id=1, time_obj=datetime(2026, 1, 1, 9, 0), priority=1, duration=60, recurrence="daily")
+        pet.add_task(walk)
+        pet.add_task(Feed(task_id=2, time_obj=datetime(2026, 3, 3, 9, 20), priority=1,
+                          food_type="Kibble", portion_size="1 cup"))
+        self.store.save_owner(owner)
+        scheduler = Scheduler(owner, store=self.store)
+
+        for day in (date(2026, 1, 1), date(2026, 3, 3), date(2026, 3, 4)):
+            stored = [task.task_id for _, task in scheduler.get_stored_tasks(day)]
+            self.assertEqual(stored, [task.task_id for task in pet.get_tasks_between(day)])
+        self.assertEqual(scheduler.find_stored_conflicts(date(2026, 3, 3)), [(201, 2, 1)])
+        self.assertEqual(scheduler.find_stored_conflicts(date(2026, 3, 4)), [])
+        self.assertEqual(scheduler.find_stored_conflicts(date(2026, 3, 2), date(2026, 3, 4)), [(201, 2, 1)])
+
+        # A completed occurrence drops out of both views
+        pet.complete_occurrence(walk, datetime(2026, 3, 3, 9, 0))
+        self.store.add_tasks(pet, [walk])
+        self.assertEqual([task.task_id for _, task in scheduler.get_stored_tasks(date(2026, 3, 3))], [2])
+        self.assertEqual([task.task_id for task in pet.get_tasks_between(date(2026, 3, 3))], [2])
+        self.assertEqual(scheduler.find_stored_conflicts(date(2026, 3, 3)), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,15 @@
+import pickle
+import threading
 import unittest
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 import warnings
 
-from pawpal_system import Pet, Walk, Feed, GiveMedicine, Owner, Scheduler
+from pawpal_system import Pet, Walk, Feed, GiveMedicine, Owner, Scheduler, Task, Instrumentation
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 
 class TestPawPalSystem(unittest.TestCase):
@@ -47,7 +54,7 @@ class TestPawPalSystem(unittest.TestCase):
         pet = Pet(1, "Max", "Cat", "Persian", "None")
 
         self.assertEqual(len(pet.tasks), 0)
-        self.assertIsInstance(pet.tasks, list)
+        self.assertIsInstance(pet.tasks, tuple)
 
     def test_pet_with_no_tasks_daily_schedule(self):
         """Verify that get_daily_schedule returns empty list for pet with no tasks."""
@@ -253,6 +260,687 @@ class TestPawPalSystem(unittest.TestCase):
         self.assertIn("Spot", schedule[0])
         self.assertIn("Mittens", schedule[1])
 
+    def test_removed_task_no_longer_conflicts(self):
+        """Verify that removing a task drops it from the pet's conflict index."""
+        owner = Owner(1, "Sam Lee", "sam@example.com")
+        pet = Pet(1, "Biscuit", "Dog", "Corgi", "None")
+        owner.add_pet(pet)
+        scheduler = Scheduler(owner)
+
+        base_time = datetime(2026, 2, 11, 10, 0)
+        walk1 = Walk(task_id=1, time_obj=base_time, priority=1, duration=30)
+        walk2 = Walk(task_id=2, time_obj=base_time + timedelta(minutes=10), priority=1, duration=30)
+
+        pet.add_task(walk1)
+        pet.remove_task(walk1)
+
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            has_conflict = scheduler.check_for_conflicts(walk2, pet)
+
+            self.assertFalse(has_conflict)
+            self.assertEqual(len(pet.tasks), 0)
+            self.assertEqual(len(pet.interval_index), 0)
+
+    def test_interval_index_finds_long_walk_started_earlier(self):
+        """Verify that the index finds a long walk that started well before the query."""
+        pet = Pet(1, "Scout", "Dog", "Husky", "None")
+
+        base_time = datetime(2026, 2, 11, 8, 0)
+        long_walk = Walk(task_id=1, time_obj=base_time, priority=1, duration=180)
+        short_walk = Walk(task_id=2, time_obj=base_time + timedelta(minutes=30), priority=1, duration=10)
+        feed = Feed(task_id=3, time_obj=base_time + timedelta(hours=5), priority=1, food_type="Kibble", portion_size="1 cup")
+
+        for task in (long_walk, short_walk, feed):
+            pet.add_task(task)
+
+        query_time = base_time + timedelta(hours=2)
+        found = [task.task_id for _, _, task in pet.interval_index.overlapping(query_time, query_time)]
+
+        self.assertEqual(found, [1])
+
+        # Completing through the pet removes the walk from the index
+        pet.complete_task(long_walk, next_task_id=4)
+        found = [task.task_id for _, _, task in pet.interval_index.overlapping(query_time, query_time)]
+        self.assertEqual(found, [])
+
+    def test_generate_schedule_flags_all_conflicting_pairs(self):
+        """Verify that the sweep reports every overlapping pair, not only the first."""
+        owner = Owner(1, "Pat Kim", "pat@example.com")
+        pet1 = Pet(1, "Ziggy", "Dog", "Boxer", "None")
+        pet2 = Pet(2, "Olive", "Cat", "Sphynx", "None")
+        owner.add_pet(pet1)
+        owner.add_pet(pet2)
+        scheduler = Scheduler(owner)
+
+        base_time = datetime(2026, 2, 11, 9, 0)
+        walk = Walk(task_id=1, time_obj=base_time, priority=1, duration=60)
+        feed = Feed(task_id=2, time_obj=base_time + timedelta(minutes=20), priority=2, food_type="Kibble", portion_size="1 cup")
+        meds = GiveMedicine(task_id=3, time_obj=base_time + timedelta(minutes=40), priority=3, medication_name="Vitamin", dosage="1 tablet")
+        later_feed = Feed(task_id=4, time_obj=base_time + timedelta(hours=3), priority=1, food_type="Kibble", portion_size="1 cup")
+        other_pet_feed = Feed(task_id=5, time_obj=base_time + timedelta(minutes=20), priority=1, food_type="Tuna", portion_size="1 can")
+
+        for task in (walk, feed, meds, later_feed):
+            pet1.add_task(task)
+        pet2.add_task(other_pet_feed)
+
+        with warnings.catch_warnings(record=True):
+            warnings.simplefilter("always")
+            sorted_tasks = sorted(
+                [(pet1, t) for t in pet1.tasks] + [(pet2, t) for t in pet2.tasks],
+                key=lambda item: item[1].time_obj
+            )
+            pairs = {(task.task_id, other.task_id) for _, task, other in scheduler.find_conflicts(sorted_tasks)}
+            schedule = scheduler.generate_daily_schedule()
+
+        # The walk overlaps both the feed and the medicine; other pets never conflict
+        self.assertEqual(pairs, {(2, 1), (3, 1)})
+        flagged = [line for line in schedule if "CONFLICT" in line]
+        self.assertEqual(len(flagged), 3)
+        self.assertTrue(all("Ziggy" in line for line in flagged))
+
+    def test_daily_schedule_for_single_day(self):
+        """Verify that a dated schedule only includes that day's tasks."""
+        owner = Owner(1, "Dana Cruz", "dana@example.com")
+        pet = Pet(1, "Pepper", "Dog", "Schnauzer", "None")
+        owner.add_pet(pet)
+
+        yesterday = Walk(task_id=1, time_obj=datetime(2026, 2, 10, 9, 0), priority=1, duration=20)
+        today_late = Feed(task_id=2, time_obj=datetime(2026, 2, 11, 18, 0), priority=1, food_type="Kibble", portion_size="1 cup")
+        today_early = Walk(task_id=3, time_obj=datetime(2026, 2, 11, 7, 0), priority=1, duration=20)
+        tomorrow = Feed(task_id=4, time_obj=datetime(2026, 2, 12, 8, 0), priority=1, food_type="Kibble", portion_size="1 cup")
+
+        for task in (yesterday, today_late, today_early, tomorrow):
+            pet.add_task(task)
+
+        schedule = pet.get_daily_schedule(date(2026, 2, 11))
+        self.assertEqual([t.task_id for t in schedule], [3, 2])
+
+        window = pet.get_daily_schedule(date(2026, 2, 11), date(2026, 2, 12))
+        self.assertEqual([t.task_id for t in window], [3, 2, 4])
+
+        pet.remove_task(today_late)
+        lines = Scheduler(owner).generate_daily_schedule(date(2026, 2, 11))
+        self.assertEqual(len(lines), 1)
+        self.assertIn("07:00", lines[0])
+
+    def test_recurring_series_expands_lazily(self):
+        """Verify that a daily series yields occurrences on demand and skips completed ones."""
+        pet = Pet(1, "Maple", "Dog", "Shiba Inu", "None")
+        walk = Walk(task_id=1, time_obj=datetime(2026, 1, 1, 7, 0), priority=1, duration=30, recurrence="daily")
+        pet.add_task(walk)
+
+        year = list(pet.get_occurrences(datetime(2026, 1, 1), datetime(2027, 1, 1)))
+        self.assertEqual(len(year), 365)
+        self.assertTrue(all(o.task is walk for o in year))
+
+        # Completing an occurrence records an exception instead of adding a task
+        pet.complete_occurrence(walk, datetime(2026, 3, 2, 7, 0))
+        window = list(pet.get_occurrences(datetime(2026, 3, 1, 12, 0), datetime(2026, 3, 4)))
+
+        self.assertEqual([o.time_obj for o in window], [datetime(2026, 3, 3, 7, 0)])
+        self.assertEqual(len(pet.tasks), 1)
+        self.assertEqual(walk.status, "pending")
+
+        # One-off tasks are read from the days the window covers only
+        pet.add_task(Walk(task_id=2, time_obj=datetime(2026, 3, 3, 6, 0), priority=2, duration=15))
+        pet.add_task(Walk(task_id=3, time_obj=datetime(2026, 6, 1, 6, 0), priority=2, duration=15))
+        window = list(pet.get_occurrences(datetime(2026, 3, 1, 12, 0), datetime(2026, 3, 4)))
+        self.assertEqual([(o.task.task_id, o.time_obj.hour) for o in window], [(2, 6), (1, 7)])
+
+    def test_tasks_use_compact_slots_storage(self):
+        """Verify that tasks have no __dict__ but keep the string status/recurrence API."""
+        meds = GiveMedicine(task_id=1, time_obj=datetime(2026, 2, 11, 9, 0), priority=3,
+                            medication_name="Insulin", dosage="2 units", recurrence="weekly")
+
+        self.assertFalse(hasattr(meds, "__dict__"))
+        self.assertEqual(meds.status, "pending")
+        self.assertEqual(meds.recurrence, "weekly")
+
+        meds.mark_complete(next_task_id=2)
+        self.assertEqual(meds.status, "complete")
+
+        with self.assertRaises(ValueError):
+            meds.recurrence = "hourly"
+
+    @unittest.skipIf(numpy is None, "NumPy not installed")
+    def test_vectorized_conflicts_across_pets(self):
+        """Verify that bulk conflict detection returns every pair without warnings."""
+        owner = Owner(1, "Robin Hale", "robin@example.com")
+        pet1 = Pet(11, "Ace", "Dog", "Pointer", "None")
+        pet2 = Pet(12, "Bean", "Dog", "Pug", "None")
+        owner.add_pet(pet1)
+        owner.add_pet(pet2)
+
+        base_time = datetime(2026, 2, 11, 9, 0)
+        pet1.add_task(Walk(task_id=1, time_obj=base_time, priority=1, duration=60))
+        pet1.add_task(Feed(task_id=2, time_obj=base_time + timedelta(minutes=30), priority=1, food_type="Kibble", portion_size="1 cup"))
+        pet1.add_task(Feed(task_id=3, time_obj=base_time + timedelta(minutes=60), priority=1, food_type="Kibble", portion_size="1 cup"))
+        pet1.add_task(Feed(task_id=4, time_obj=base_time + timedelta(minutes=90), priority=1, food_type="Kibble", portion_size="1 cup"))
+        pet2.add_task(Walk(task_id=5, time_obj=base_time, priority=1, duration=10))
+        pet2.add_task(Walk(task_id=6, time_obj=base_time + timedelta(minutes=5), priority=1, duration=10))
+
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            result = Scheduler(owner).find_all_conflicts_vectorized()
+            self.assertEqual(len(w), 0)
+
+        pairs = {tuple(int(v) for v in row) for row in result}
+        self.assertEqual(pairs, {(11, 2, 1), (11, 3, 1), (12, 6, 5)})
+
+    def test_vectorized_conflicts_include_recurring_series(self):
+        """Verify that bulk conflict detection sees later occurrences of a recurring series."""
+        owner = Owner(1, "Robin Hale", "robin@example.com")
+        pet = Pet(11, "Ace", "Dog", "Pointer", "None")
+        owner.add_pet(pet)
+        pet.add_task(Walk(task_id=1, time_obj=datetime(2026, 1, 1, 9, 0), priority=1, duration=60, recurrence="daily"))
+        feed = Feed(task_id=2, time_obj=datetime(2026, 3, 3, 9, 20), priority=1, food_type="Kibble", portion_size="1 cup")
+        scheduler = Scheduler(owner, warn_on_conflict=False)
+
+        self.assertTrue(scheduler.check_for_conflicts(feed, pet))
+        pet.add_task(feed)
+        pairs = [tuple(int(v) for v in row) for row in scheduler.find_all_conflicts_vectorized()]
+        self.assertEqual(pairs, [(11, 2, 1)])
+
+        # A window keeps only pairs whose later task starts inside it
+        pairs = [tuple(int(v) for v in row) for row in scheduler.find_all_conflicts_vectorized(date(2026, 3, 3))]
+        self.assertEqual(pairs, [(11, 2, 1)])
+        self.assertEqual(len(scheduler.find_all_conflicts_vectorized(date(2026, 3, 4))), 0)
+
+    def test_conflict_collector_without_warnings(self):
+        """Verify that conflicts can be collected as objects with warnings turned off."""
+        owner = Owner(1, "Lee Park", "lee@example.com")
+        pet = Pet(1, "Nala", "Cat", "Bengal", "None")
+        owner.add_pet(pet)
+        scheduler = Scheduler(owner, warn_on_conflict=False)
+
+        base_time = datetime(2026, 2, 11, 10, 0)
+        walk = Walk(task_id=1, time_obj=base_time, priority=1, duration=30)
+        feed = Feed(task_id=2, time_obj=base_time + timedelta(minutes=10), priority=1, food_type="Tuna", portion_size="1 can")
+        meds = GiveMedicine(task_id=3, time_obj=base_time + timedelta(minutes=10), priority=2, medication_name="Drops", dosage="2 drops")
+        for task in (walk, feed, meds):
+            pet.add_task(task)
+
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+
+            found = []
+            self.assertTrue(scheduler.check_for_conflicts(meds, pet, collector=found))
+            self.assertEqual({c.other.task_id for c in found}, {1, 2})
+
+            collected = []
+            scheduler.generate_daily_schedule(collector=collected)
+            self.assertEqual(len(collected), 3)
+            self.assertIn("Conflict detected for Nala", collected[0].message())
+
+            self.assertEqual(len(w), 0)
+
+    def test_build_schedule_returns_typed_entries(self):
+        """Verify that build_schedule returns entries with conflict flags and lazy text."""
+        owner = Owner(1, "Kai Wong", "kai@example.com")
+        pet = Pet(1, "Juno", "Dog", "Vizsla", "None")
+        owner.add_pet(pet)
+
+        base_time = datetime(2026, 2, 11, 10, 0)
+        walk = Walk(task_id=1, time_obj=base_time, priority=1, duration=30)
+        feed = Feed(task_id=2, time_obj=base_time + timedelta(minutes=15), priority=3, food_type="Kibble", portion_size="1 cup")
+        meds = GiveMedicine(task_id=3, time_obj=base_time + timedelta(hours=2), priority=2, medication_name="Vitamin", dosage="1 tablet")
+        for task in (meds, feed, walk):
+            pet.add_task(task)
+
+        entries = Scheduler(owner, warn_on_conflict=False).build_schedule()
+
+        self.assertEqual([e.task.task_id for e in entries], [1, 2, 3])
+        self.assertEqual([e.conflict for e in entries], [True, True, False])
+        self.assertEqual(entries[1].sort_key, (feed.time_obj, -3))
+        self.assertEqual(str(entries[2]), "Juno - GiveMedicine at 12:00 [Priority 2]")
+
+    def test_schedule_cache_reuses_unchanged_pets(self):
+        """Verify that the scheduler reuses cached results until a pet changes."""
+        owner = Owner(1, "Noor Ali", "noor@example.com")
+        pet1 = Pet(1, "Taco", "Dog", "Chihuahua", "None")
+        pet2 = Pet(2, "Mochi", "Cat", "Ragdoll", "None")
+        owner.add_pet(pet1)
+        owner.add_pet(pet2)
+        scheduler = Scheduler(owner, warn_on_conflict=False)
+
+        base_time = datetime(2026, 2, 11, 8, 0)
+        pet1.add_task(Walk(task_id=1, time_obj=base_time, priority=1, duration=30))
+        pet2.add_task(Feed(task_id=2, time_obj=base_time + timedelta(hours=1), priority=1, food_type="Tuna", portion_size="1 can"))
+
+        first = scheduler.build_schedule()
+        self.assertIs(scheduler.build_schedule(), first)
+
+        pet2_entries = scheduler._pet_cache[id(pet2)][2]
+        extra = Walk(task_id=3, time_obj=base_time + timedelta(minutes=10), priority=2, duration=15)
+        pet1.add_task(extra)
+
+        second = scheduler.build_schedule()
+        self.assertEqual([e.task.task_id for e in second], [1, 3, 2])
+        self.assertEqual([e.conflict for e in second], [True, True, False])
+        self.assertIs(scheduler._pet_cache[id(pet2)][2], pet2_entries)
+
+        pet1.remove_task(extra)
+        owner.remove_pet(pet2)
+        self.assertEqual([e.task.task_id for e in scheduler.build_schedule()], [1])
+
+    def test_plan_schedule_shifts_and_drops_lower_priority(self):
+        """Verify that the planner keeps high-priority tasks and shifts or drops the rest."""
+        owner = Owner(1, "Ava Stone", "ava@example.com")
+        dog = Pet(1, "Rufus", "Dog", "Beagle", "None")
+        cat = Pet(2, "Pixel", "Cat", "Tabby", "None")
+        owner.add_pet(dog)
+        owner.add_pet(cat)
+        owner.availability = [(datetime(2026, 2, 11, 10, 0), datetime(2026, 2, 11, 11, 0))]
+
+        base_time = datetime(2026, 2, 11, 10, 0)
+        walk = Walk(task_id=1, time_obj=base_time, priority=3, duration=30)
+        feed = Feed(task_id=2, time_obj=base_time + timedelta(minutes=10), priority=1, food_type="Tuna", portion_size="1 can")
+        meds = GiveMedicine(task_id=3, time_obj=base_time + timedelta(minutes=15), priority=2, medication_name="Drops", dosage="2 drops")
+        long_walk = Walk(task_id=4, time_obj=base_time + timedelta(minutes=20), priority=1, duration=45)
+        dog.add_task(walk)
+        dog.add_task(long_walk)
+        cat.add_task(feed)
+        cat.add_task(meds)
+
+        plan = Scheduler(owner).plan_schedule(date(2026, 2, 11))
+
+        placed = [(p.task.task_id, p.start_time.strftime("%H:%M")) for p in plan.scheduled]
+        self.assertEqual(placed, [(1, "10:00"), (3, "10:31"), (2, "10:32")])
+        self.assertTrue(plan.scheduled[1].shifted)
+        self.assertEqual([task.task_id for _, task in plan.dropped], [4])
+
+    def test_caretaker_conflicts_span_pets(self):
+        """Verify that one caretaker cannot handle tasks for two pets at the same time."""
+        owner = Owner(1, "Mia Ford", "mia@example.com")
+        dog1 = Pet(1, "Bolt", "Dog", "Collie", "None")
+        dog2 = Pet(2, "Rosie", "Dog", "Terrier", "None")
+        owner.add_pet(dog1)
+        owner.add_pet(dog2)
+        scheduler = Scheduler(owner, warn_on_conflict=False)
+
+        base_time = datetime(2026, 2, 11, 9, 0)
+        walk1 = Walk(task_id=1, time_obj=base_time, priority=1, duration=60)
+        walk2 = Walk(task_id=2, time_obj=base_time + timedelta(minutes=30), priority=1, duration=60)
+        feed = Feed(task_id=3, time_obj=base_time + timedelta(minutes=45), priority=1, food_type="Kibble", portion_size="1 cup")
+        dog1.add_task(walk1)
+        dog2.add_task(walk2)
+
+        # Per-pet checks see nothing, the caretaker check does
+        self.assertFalse(scheduler.check_for_conflicts(walk2, dog2))
+        self.assertTrue(scheduler.check_resource_conflict(walk2, dog2))
+
+        conflicts = scheduler.find_resource_conflicts(date(2026, 2, 11))
+        self.assertEqual([(c.pet.name, c.task.task_id) for c in conflicts], [("Rosie", 2)])
+
+        # Two caretakers can cover both walks, but not a feed during both
+        self.assertEqual(scheduler.find_resource_conflicts(capacity=2), [])
+        self.assertTrue(scheduler.check_resource_conflict(feed, dog1, capacity=2))
+        self.assertFalse(scheduler.check_resource_conflict(feed, dog1, capacity=3))
+
+    def test_caretaker_conflicts_include_recurring_series(self):
+        """Verify that caretaker checks see later occurrences of a recurring series."""
+        owner = Owner(1, "Lars Berg", "lars@example.com")
+        husky = Pet(1, "Storm", "Dog", "Husky", "None")
+        parrot = Pet(2, "Mango", "Bird", "Parrot", "None")
+        owner.add_pet(husky)
+        owner.add_pet(parrot)
+        husky.add_task(Walk(task_id=1, time_obj=datetime(2026, 1, 1, 9, 0), priority=1, duration=60, recurrence="daily"))
+        visit = Walk(task_id=2, time_obj=datetime(2026, 3, 3, 9, 15), priority=1, duration=20)
+        scheduler = Scheduler(owner, warn_on_conflict=False)
+
+        self.assertTrue(scheduler.check_resource_conflict(visit, parrot))
+        parrot.add_task(visit)
+        conflicts = scheduler.find_resource_conflicts(date(2026, 3, 3))
+        self.assertEqual([(c.pet.name, c.task.task_id, [t.task_id for _, t in c.busy]) for c in conflicts],
+                         [("Mango", 2, [1])])
+        self.assertEqual(scheduler.find_resource_conflicts(date(2026, 3, 4)), [])
+
+        # Open-ended timelines run from the first pending occurrence to past the last one-off task
+        timeline = list(owner.iter_timeline())
+        self.assertEqual(timeline[0][0], datetime(2026, 1, 1, 9, 0))
+        self.assertEqual(len(timeline), 62 + 1)  # Jan 1 through Mar 3, plus the visit
+        self.assertEqual({(pet.name, task.task_id) for _, _, pet, task in timeline}, {("Storm", 1), ("Mango", 2)})
+        self.assertEqual(len(scheduler.find_resource_conflicts()), 1)
+
+    def test_task_lookup_removal_and_completion_by_id(self):
+        """Verify that tasks can be found, completed and removed by task_id."""
+        pet = Pet(1, "Hazel", "Dog", "Whippet", "None")
+        base_time = datetime(2026, 2, 11, 7, 0)
+        walk = Walk(task_id=10, time_obj=base_time, priority=1, duration=20, recurrence="daily")
+        feed = Feed(task_id=11, time_obj=base_time + timedelta(hours=1), priority=1, food_type="Kibble", portion_size="1 cup")
+        pet.add_task(walk)
+        pet.add_task(feed)
+
+        self.assertIs(pet.get_task(11), feed)
+        self.assertIsNone(pet.get_task(99))
+
+        with self.assertRaises(ValueError):
+            pet.add_task(Feed(task_id=11, time_obj=base_time, priority=1, food_type="Kibble", portion_size="1 cup"))
+
+        # A recurring task needs a fresh id for its successor; a bad one changes nothing
+        version = pet.version
+        for bad_id in (None, 11):
+            with self.assertRaises(ValueError):
+                pet.complete_task_by_id(10, next_task_id=bad_id)
+        self.assertEqual((walk.status, pet.version), ("pending", version))
+        self.assertEqual([entry[2] for entry in pet.interval_index.entries], [walk, feed])
+
+        next_walk = pet.complete_task_by_id(10, next_task_id=12)
+        self.assertEqual(walk.status, "complete")
+        self.assertIs(pet.get_task(12), next_walk)
+
+        pet.remove_task(11)
+        self.assertEqual([t.task_id for t in pet.tasks], [10, 12])
+        with self.assertRaises(ValueError):
+            pet.remove_task(11)
+
+    def test_instrumentation_records_phases_and_counters(self):
+        """Verify that opt-in instrumentation times schedule phases and counts work."""
+        owner = Owner(1, "Elena Petrova", "elena@example.com")
+        pet = Pet(1, "Pickles", "Dog", "Pug", "None")
+        owner.add_pet(pet)
+        base_time = datetime(2026, 2, 11, 8, 0)
+        pet.add_task(Walk(task_id=1, time_obj=base_time, priority=1, duration=30))
+        pet.add_task(Feed(task_id=2, time_obj=base_time + timedelta(minutes=10), priority=2,
+                          food_type="Kibble", portion_size="1 cup"))
+
+        reports = []
+        instrumentation = Instrumentation(exporter=reports.append)
+        scheduler = Scheduler(owner, warn_on_conflict=False, instrumentation=instrumentation)
+        scheduler.generate_daily_schedule(base_time.date())
+        scheduler.build_schedule(base_time.date())
+
+        report = instrumentation.report()
+        for name in ("schedule.generate", "schedule.build", "schedule.gather", "schedule.sort",
+                     "schedule.conflicts", "schedule.merge", "schedule.format"):
+            self.assertIn(name, report["timings"])
+        self.assertEqual(report["calls"]["schedule.build"], 2)
+        self.assertEqual(report["counters"]["schedule.tasks_scanned"], 2)
+        self.assertEqual(report["counters"]["conflicts.comparisons"], 1)
+        self.assertEqual(report["counters"]["conflicts.found"], 1)
+        self.assertEqual(report["counters"]["schedule.cache_hits"], 1)
+        self.assertEqual(len(reports), 2)  # one export per outermost phase
+
+        Task.instrumentation = instrumentation
+        try:
+            pet.instrumentation = instrumentation
+            pet.complete_task_by_id(1)
+        finally:
+            Task.instrumentation = None
+        self.assertEqual(instrumentation.counters["task.completed"], 1)
+        self.assertEqual(instrumentation.calls["pet.complete_task"], 1)
+
+        instrumentation.reset()
+        self.assertEqual(instrumentation.report(), {"timings": {}, "calls": {}, "counters": {}})
+
+    def test_concurrent_writers_and_schedule_readers(self):
+        """Verify that threads can add and remove tasks while others build schedules."""
+        owner = Owner(1, "Marcus Lee", "marcus@example.com")
+        pet = Pet(1, "Ziggy", "Dog", "Whippet", "None")
+        owner.add_pet(pet)
+        base_time = datetime(2026, 2, 11, 6, 0)
+        per_writer = 200
+        errors = []
+
+        def writer(offset):
+            try:
+                for n in range(per_writer):
+                    task_id = offset + n
+                    pet.add_task(Walk(task_id=task_id, time_obj=base_time + timedelta(minutes=n), priority=1, duration=5))
+                    if n % 4 == 0:
+                        pet.remove_task(task_id)
+            except Exception as exc:  # pragma: no cover - reported below
+                errors.append(exc)
+
+        probe = Walk(task_id=0, time_obj=base_time + timedelta(minutes=30), priority=1, duration=5)
+
+        def reader():
+            try:
+                scheduler = Scheduler(owner, warn_on_conflict=False)
+                for _ in range(50):
+                    scheduler.build_schedule(base_time.date())
+                    scheduler.check_for_conflicts(probe, pet)
+            except Exception as exc:  # pragma: no cover - reported below
+                errors.append(exc)
+
+        threads = [threading.Thread(target=writer, args=(offset,)) for offset in (1000, 2000, 3000)]
+        threads += [threading.Thread(target=reader) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        expected = 3 * (per_writer - per_writer // 4)
+        self.assertEqual(len(pet.tasks), expected)
+        self.assertEqual(len(pet.interval_index), expected)
+        self.assertEqual(pet.interval_index.starts, sorted(pet.interval_index.starts))
+        self.assertEqual(len(pet.get_tasks_between(base_time.date())), expected)
+
+        # The lock is recreated rather than pickled
+        copy = pickle.loads(pickle.dumps(pet))
+        self.assertEqual(len(copy.tasks), expected)
+        copy.add_task(Feed(task_id=1, time_obj=base_time, priority=1, food_type="Kibble", portion_size="1 cup"))
+
+    def test_schedule_cache_uses_version_read_with_tasks(self):
+        """Verify that a task added while a schedule is gathered is not hidden by the cache."""
+        owner = Owner(7, "Hana Sato", "hana@example.com")
+        pet = Pet(7, "Kuma", "Dog", "Akita", "None")
+        owner.add_pet(pet)
+        morning = datetime(2026, 3, 4, 7, 30)
+        pet.add_task(Walk(task_id=1, time_obj=morning, priority=1, duration=20))
+        scheduler = Scheduler(owner, warn_on_conflict=False)
+
+        def gather_then_add(start_date, end_date=None):
+            occurrences = Pet.get_occurrences_between(pet, start_date, end_date)
+            pet.add_task(Feed(task_id=2, time_obj=morning + timedelta(hours=1), priority=1,
+                              food_type="Raw", portion_size="200g"))
+            return occurrences
+
+        pet.get_occurrences_between = gather_then_add  # simulates a writer landing mid-build
+        self.assertEqual([e.task.task_id for e in scheduler.build_schedule(morning.date())], [1])
+        del pet.get_occurrences_between
+
+        self.assertEqual([e.task.task_id for e in scheduler.build_schedule(morning.date())], [1, 2])
+
+    def test_bulk_add_merges_batch_and_reports_its_conflicts(self):
+        """Verify that a batch is indexed in order and only its own conflicts are reported."""
+        owner = Owner(1, "Amara Okafor", "amara@example.com")
+        dog = Pet(1, "Bruno", "Dog", "Boxer", "None")
+        cat = Pet(2, "Olive", "Cat", "Siamese", "None")
+        owner.add_pet(dog)
+        owner.add_pet(cat)
+        base_time = datetime(2026, 2, 11, 8, 0)
+        dog.add_task(Walk(task_id=1, time_obj=base_time, priority=1, duration=60))
+        dog.add_task(Walk(task_id=2, time_obj=base_time + timedelta(minutes=30), priority=1, duration=10))
+
+        meds = [
+            GiveMedicine(task_id=10 + n, time_obj=base_time + timedelta(hours=3 - n), priority=3,
+                         medication_name="PetMed", dosage="5ml")
+            for n in range(4)
+        ]
+        scheduler = Scheduler(owner, warn_on_conflict=False)
+        conflicts = scheduler.bulk_add([(dog, meds[0]), (dog, meds[3]), (cat, meds[1]), (cat, meds[2])])
+
+        # meds[3] lands inside walk 1; the pre-existing walk 1 / walk 2 clash is not part of the batch
+        self.assertEqual([(c.task.task_id, c.other.task_id) for c in conflicts], [(13, 1)])
+        self.assertEqual(dog.interval_index.starts, sorted(dog.interval_index.starts))
+        self.assertEqual([t.task_id for t in cat.tasks], [11, 12])
+
+        version = dog.version
+        with self.assertRaises(ValueError):
+            dog.add_tasks([Feed(task_id=20, time_obj=base_time, priority=1, food_type="Kibble", portion_size="1 cup"),
+                           Feed(task_id=1, time_obj=base_time, priority=1, food_type="Kibble", portion_size="1 cup")])
+        self.assertEqual(dog.version, version)
+        self.assertIsNone(dog.get_task(20))
+
+        with self.assertRaises(ValueError):
+            owner.bulk_add([(Pet(3, "Stray", "Cat", "Unknown", "None"), meds[0])])
+
+    def test_bulk_add_reports_conflicts_with_recurring_series(self):
+        """Verify that a batch is checked against later occurrences of a recurring series."""
+        owner = Owner(1, "Amara Okafor", "amara@example.com")
+        dog = Pet(1, "Bruno", "Dog", "Boxer", "None")
+        owner.add_pet(dog)
+        dog.add_task(Walk(task_id=1, time_obj=datetime(2026, 1, 1, 9, 0), priority=1, duration=60, recurrence="daily"))
+        scheduler = Scheduler(owner, warn_on_conflict=False)
+
+        feed = Feed(task_id=4, time_obj=datetime(2026, 3, 4, 9, 20), priority=1, food_type="Kibble", portion_size="1 cup")
+        conflicts = scheduler.bulk_add([(dog, feed)])
+        self.assertEqual([(c.task.task_id, c.other.task_id) for c in conflicts], [(4, 1)])
+
+        later = Feed(task_id=5, time_obj=datetime(2026, 3, 4, 10, 30), priority=1, food_type="Kibble", portion_size="1 cup")
+        self.assertEqual(scheduler.bulk_add([(dog, later)]), [])
+
+    def test_range_schedule_expands_recurrences_virtually(self):
+        """Verify that multi-day views include every occurrence of recurring tasks, merged in order."""
+        owner = Owner(1, "Diego Ramirez", "diego@example.com")
+        dog = Pet(1, "Rocket", "Dog", "Border Collie", "None")
+        cat = Pet(2, "Luna", "Cat", "Maine Coon", "None")
+        owner.add_pet(dog)
+        owner.add_pet(cat)
+        monday = datetime(2026, 2, 9, 8, 0)
+        walk = Walk(task_id=1, time_obj=monday, priority=2, duration=30, recurrence="daily")
+        walk.complete_occurrence(monday + timedelta(days=2))
+        dog.add_task(walk)
+        dog.add_task(Feed(task_id=2, time_obj=monday + timedelta(days=1, minutes=15), priority=1,
+                          food_type="Kibble", portion_size="1 cup"))
+        cat.add_task(GiveMedicine(task_id=3, time_obj=monday - timedelta(weeks=1, hours=1), priority=3,
+                                  medication_name="Insulin", dosage="2 units", recurrence="weekly"))
+
+        scheduler = Scheduler(owner, warn_on_conflict=False)
+        entries = list(scheduler.build_range_schedule(monday.date(), monday.date() + timedelta(days=13)))
+
+        walk_days = [entry.time_obj.day for entry in entries if entry.task is walk]
+        self.assertEqual(len(walk_days), 13)  # 14 days minus the completed occurrence
+        self.assertNotIn(11, walk_days)
+        self.assertEqual([entry.time_obj for entry in entries if entry.pet is cat],
+                         [datetime(2026, 2, 9, 7, 0), datetime(2026, 2, 16, 7, 0)])
+        self.assertEqual([entry.sort_key for entry in entries], sorted(entry.sort_key for entry in entries))
+
+        tuesday = [entry for entry in entries if entry.time_obj.date() == date(2026, 2, 10)]
+        self.assertEqual([(entry.task.task_id, entry.conflict) for entry in tuesday], [(1, True), (2, True)])
+
+        calendar = scheduler.generate_range_schedule(date(2026, 2, 11), date(2026, 2, 12))
+        self.assertEqual(calendar, {date(2026, 2, 11): [], date(2026, 2, 12): ["Rocket - Walk at 08:00 [Priority 2]"]})
+
+        week = scheduler.generate_weekly_calendar(date(2026, 2, 18))
+        self.assertEqual(week[0], "Monday 2026-02-16")
+        self.assertEqual(week[1:3], ["  Luna - GiveMedicine at 07:00 [Priority 3]", "  Rocket - Walk at 08:00 [Priority 2]"])
+        self.assertEqual(sum(1 for line in week if not line.startswith("  ")), 7)
+
+    def test_every_task_type_has_a_cached_end_time(self):
+        """Verify that feed and medication windows take time and count in conflict checks."""
+        pet = Pet(1, "Nala", "Dog", "Labrador", "None")
+        base_time = datetime(2026, 2, 11, 8, 0)
+        feed = Feed(task_id=1, time_obj=base_time, priority=1, food_type="Kibble", portion_size="1 cup", duration=20)
+        meds = GiveMedicine(task_id=2, time_obj=base_time + timedelta(minutes=15), priority=3,
+                            medication_name="PetMed", dosage="5ml")
+        self.assertEqual(feed.end_time, base_time + timedelta(minutes=20))
+        self.assertEqual(meds.end_time, meds.time_obj)
+
+        pet.add_task(feed)
+        scheduler = Scheduler(Owner(1, "Grace Kim", "grace@example.com"), warn_on_conflict=False)
+        self.assertTrue(scheduler.check_for_conflicts(meds, pet))
+
+        # end_time follows changes to either field
+        meds.duration = 10
+        meds.time_obj = base_time + timedelta(hours=1)
+        self.assertEqual(meds.end_time, base_time + timedelta(hours=1, minutes=10))
+
+        daily_feed = Feed(task_id=3, time_obj=base_time, priority=1, food_type="Kibble", portion_size="1 cup",
+                          recurrence="daily", duration=20)
+        self.assertEqual(daily_feed.create_next_occurrence(4).duration, 20)
+        self.assertEqual(feed.to_dict()["duration"], 20)
+
+    def test_reschedule_task_moves_index_entries(self):
+        """Verify that rescheduling refiles a task so removing it leaves no stale index entries."""
+        owner = Owner(1, "Tomas Novak", "tomas@example.com")
+        pet = Pet(1, "Fig", "Rabbit", "Lop", "None")
+        owner.add_pet(pet)
+        base_time = datetime(2026, 4, 6, 9, 0)
+        walk = Walk(task_id=1, time_obj=base_time, priority=1, duration=20)
+        pet.add_task(walk)
+        heard = []
+        pet.task_listeners.append(lambda pet, task: heard.append(task.task_id))
+
+        version = pet.version
+        pet.reschedule_task(1, time_obj=base_time + timedelta(days=1), duration=45)
+        self.assertGreater(pet.version, version)
+        self.assertEqual(heard, [1])
+        self.assertEqual(pet.get_tasks_between(base_time.date()), [])
+        self.assertEqual(pet.get_tasks_between(base_time.date() + timedelta(days=1)), [walk])
+        self.assertEqual(pet.interval_index.entries, [(walk.time_obj, walk.end_time, walk)])
+
+        # Even a task edited behind the pet's back is found under the time it was filed at
+        walk.time_obj = base_time + timedelta(days=3)
+        pet.remove_task(walk)
+        self.assertEqual(len(pet.interval_index), 0)
+        self.assertEqual(pet.tasks_by_day, {})
+        with self.assertRaises(ValueError):
+            pet.reschedule_task(walk, time_obj=base_time)
+
+    def test_daily_views_and_conflicts_follow_recurring_series(self):
+        """Verify that windowed views, conflict checks and the index follow each series occurrence."""
+        owner = Owner(1, "Ines Duarte", "ines@example.com")
+        pet = Pet(1, "Pretzel", "Dog", "Dachshund", "None")
+        owner.add_pet(pet)
+        new_year = datetime(2026, 1, 1, 8, 0)
+        walk = Walk(task_id=1, time_obj=new_year, priority=3, duration=30, recurrence="daily")
+        feed = Feed(task_id=2, time_obj=new_year + timedelta(days=4, minutes=15), priority=1,
+                    food_type="Kibble", portion_size="1 cup", duration=10)
+        pet.add_task(walk)
+        pet.add_task(feed)
+        scheduler = Scheduler(owner, warn_on_conflict=False)
+
+        self.assertEqual(scheduler.generate_daily_schedule(date(2026, 1, 5)), [
+            "Pretzel - Walk at 08:00 [Priority 3] ⚠️ CONFLICT",
+            "Pretzel - Feed at 08:15 [Priority 1] ⚠️ CONFLICT",
+        ])
+        self.assertEqual(pet.get_tasks_between(date(2026, 1, 1), date(2026, 1, 3)), [walk])
+        self.assertEqual(pet.get_daily_schedule(date(2026, 1, 1), date(2026, 1, 3)), [walk, walk, walk])
+        plan = scheduler.plan_schedule(date(2026, 1, 5))
+        self.assertEqual([(p.task.task_id, p.shifted) for p in plan.scheduled], [(1, False), (2, True)])
+
+        pet.complete_occurrence(walk, new_year)
+        self.assertEqual(scheduler.generate_daily_schedule(date(2026, 1, 1)), [])
+        self.assertEqual(pet.interval_index.entries, [
+            (new_year + timedelta(days=1), new_year + timedelta(days=1, minutes=30), walk),
+            (feed.time_obj, feed.end_time, feed),
+        ])
+        probe = Feed(task_id=3, time_obj=new_year + timedelta(minutes=10), priority=1,
+                     food_type="Treat", portion_size="1 biscuit")
+        self.assertFalse(scheduler.check_for_conflicts(probe, pet))
+        probe.time_obj += timedelta(days=1)
+        self.assertTrue(scheduler.check_for_conflicts(probe, pet))
+        self.assertEqual(len(pet.tasks), 2)  # the series stays one task
+
+    def test_series_conflicts_across_midnight_and_weeks(self):
+        """Verify that series conflict checks find occurrences whose window wraps the day or week."""
+        owner = Owner(1, "Kofi Mensah", "kofi@example.com")
+        pet = Pet(1, "Sable", "Cat", "Burmese", "None")
+        owner.add_pet(pet)
+        night_walk = Walk(task_id=1, time_obj=datetime(2026, 5, 3, 23, 50), priority=1, duration=30, recurrence="daily")
+        sunday_meds = GiveMedicine(task_id=2, time_obj=datetime(2026, 5, 10, 23, 55), priority=3,
+                                   medication_name="Drops", dosage="1 drop", recurrence="weekly", duration=10)
+        pet.add_task(night_walk)
+        pet.add_task(sunday_meds)
+        scheduler = Scheduler(owner, warn_on_conflict=False)
+
+        def feed_at(time_obj):
+            return Feed(task_id=3, time_obj=time_obj, priority=1, food_type="Pate", portion_size="1 pouch")
+
+        collector = []
+        self.assertTrue(scheduler.check_for_conflicts(feed_at(datetime(2026, 5, 18, 0, 5)), pet, collector))
+        self.assertEqual([c.other.task_id for c in collector], [1, 2])
+        self.assertFalse(scheduler.check_for_conflicts(feed_at(datetime(2026, 5, 3, 0, 5)), pet))  # before the series
+        self.assertFalse(scheduler.check_for_conflicts(feed_at(datetime(2026, 5, 12, 0, 25)), pet))
+
+        pet.remove_task(night_walk)
+        self.assertEqual(len(pet.series_index), 1)
+        self.assertFalse(scheduler.check_for_conflicts(feed_at(datetime(2026, 5, 13, 0, 5)), pet))
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file